@@ -14,6 +14,7 @@ from infrahub.api import (
     file,
     internal,
     menu,
+    node,
     oauth2,
     oidc,
     query,
@@ -31,6 +32,7 @@ router.include_router(diff.router)
 router.include_router(file.router)
 router.include_router(internal.router)
 router.include_router(menu.router)
+router.include_router(node.router)
 router.include_router(oauth2.router)
 router.include_router(oidc.router)
 router.include_router(query.router)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from pydantic import BaseModel, Field
+
+from infrahub import config
+from infrahub.api.dependencies import get_branch_dep, get_current_user, get_db
+from infrahub.core import registry
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.branch import Branch  # noqa: TCH001
+from infrahub.core.constants import (
+    GLOBAL_BRANCH_NAME,
+    RESTRICTED_NAMESPACES,
+    GlobalPermissions,
+    InfrahubKind,
+    MutationAction,
+    PermissionDecision,
+)
+from infrahub.core.constraint.node.runner import NodeConstraintRunner
+from infrahub.core.manager import NodeManager
+from infrahub.core.schema import NodeSchema
+from infrahub.database import InfrahubDatabase  # noqa: TCH001
+from infrahub.dependencies.registry import get_component_registry
+from infrahub.events import EventMeta, NodeMutatedEvent
+from infrahub.exceptions import PermissionDeniedError, ValidationError
+from infrahub.log import get_log_data, get_logger
+from infrahub.permissions.constants import PermissionDecisionFlag
+from infrahub.utils import extract_camelcase_words
+from infrahub.worker import WORKER_IDENTITY
+
+if TYPE_CHECKING:
+    from infrahub.auth import AccountSession
+    from infrahub.services import InfrahubServices
+
+
+log = get_logger()
+router = APIRouter(prefix="/node")
+
+# Kinds relying on a dedicated GraphQL mutation to be created, they can't be created in bulk
+BULK_CREATE_UNSUPPORTED_KINDS = [
+    InfrahubKind.ARTIFACTDEFINITION,
+    InfrahubKind.GRAPHQLQUERY,
+    InfrahubKind.MENUITEM,
+    InfrahubKind.NAMESPACE,
+    InfrahubKind.NUMBERPOOL,
+    InfrahubKind.PROPOSEDCHANGE,
+    InfrahubKind.READONLYREPOSITORY,
+    InfrahubKind.REPOSITORY,
+]
+
+
+class NodeBulkCreatePayload(BaseModel):
+    kind: str = Field(..., description="Kind of the nodes to create")
+    data: list[dict[str, Any]] = Field(
+        ..., description="Attributes and relationships of each node, as in a Create mutation"
+    )
+    batch_size: int = Field(default=1000, ge=1, description="Number of nodes created in each transaction")
+
+
+class NodeBulkCreateResponse(BaseModel):
+    kind: str = Field(..., description="Kind of the nodes created")
+    ids: list[str] = Field(..., description="IDs of the nodes created, in the order of the payload")
+    count: int = Field(..., description="Number of nodes created")
+    duration: float = Field(..., description="Time spent to validate and create the nodes, in seconds")
+    throughput: float = Field(..., description="Number of nodes created per second")
+
+
+async def _check_create_permissions(
+    db: InfrahubDatabase, account_session: AccountSession, branch: Branch, kind: str
+) -> None:
+    if account_session.read_only:
+        raise PermissionDeniedError("The current account is not authorized to perform this operation")
+
+    operates_on_default_branch = branch.name in (GLOBAL_BRANCH_NAME, registry.default_branch)
+    if operates_on_default_branch:
+        can_edit_default_branch = False
+        for permission_backend in registry.permission_backends:
+            can_edit_default_branch = await permission_backend.has_permission(
+                db=db,
+                account_id=account_session.account_id,
+                permission=GlobalPermission(
+                    id="",
+                    name="",
+                    action=GlobalPermissions.EDIT_DEFAULT_BRANCH.value,
+                    decision=PermissionDecision.ALLOW_ALL.value,
+                ),
+                branch=branch,
+            )
+            if can_edit_default_branch:
+                break
+        if not can_edit_default_branch:
+            raise PermissionDeniedError(
+                f"You are not allowed to change data in the default branch '{registry.default_branch}'"
+            )
+
+    extracted_words = extract_camelcase_words(kind)
+    permission = ObjectPermission(
+        id="",
+        namespace=extracted_words[0],
+        name="".join(extracted_words[1:]),
+        action="create",
+        decision=(
+            PermissionDecisionFlag.ALLOW_DEFAULT if operates_on_default_branch else PermissionDecisionFlag.ALLOW_OTHER
+        ),
+    )
+    has_permission = False
+    for permission_backend in registry.permission_backends:
+        has_permission = await permission_backend.has_permission(
+            db=db, account_id=account_session.account_id, permission=permission, branch=branch
+        )
+        if has_permission:
+            break
+    if not has_permission:
+        raise PermissionDeniedError(f"You do not have the following permission: {permission}")
+
+
+@router.post("/bulk")
+async def bulk_create_nodes(
+    request: Request,
+    payload: NodeBulkCreatePayload,
+    background_tasks: BackgroundTasks,
+    db: InfrahubDatabase = Depends(get_db),
+    branch: Branch = Depends(get_branch_dep),
+    account_session: AccountSession = Depends(get_current_user),
+) -> NodeBulkCreateResponse:
+    """Create many nodes of the same kind, validated together and written with a few batched queries."""
+    await _check_create_permissions(db=db, account_session=account_session, branch=branch, kind=payload.kind)
+
+    node_schema = db.schema.get(name=payload.kind, branch=branch.name, duplicate=False)
+    if (
+        not isinstance(node_schema, NodeSchema)
+        or node_schema.namespace in RESTRICTED_NAMESPACES
+        or node_schema.kind in BULK_CREATE_UNSUPPORTED_KINDS
+        or node_schema.is_ip_prefix()
+        or node_schema.is_ip_address()
+    ):
+        raise ValidationError(input_value=f"Nodes of kind {payload.kind} can't be created in bulk")
+
+    component_registry = get_component_registry()
+    node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=branch)
+
+    start_time = time.perf_counter()
+    nodes = await NodeManager.create_many(
+        db=db,
+        schema=node_schema,
+        data=payload.data,
+        branch=branch,
+        batch_size=payload.batch_size,
+        node_constraint_runner=node_constraint_runner,
+    )
+    duration = time.perf_counter() - start_time
+    throughput = len(nodes) / duration if duration else 0.0
+
+    log.info(
+        "node_bulk_create",
+        branch=branch.name,
+        kind=node_schema.kind,
+        count=len(nodes),
+        duration=round(duration, 3),
+        throughput=round(throughput, 1),
+    )
+
+    if config.SETTINGS.broker.enable:
+        service: InfrahubServices = request.app.state.service
+        request_id = get_log_data().get("request_id", "")
+        for node in nodes:
+            event = NodeMutatedEvent(
+                branch=branch.name,
+                kind=node_schema.kind,
+                node_id=node.get_id(),
+                data=await node.to_graphql(db=db, filter_sensitive=True),
+                action=MutationAction.ADDED,
+                meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+            )
+            background_tasks.add_task(service.event.send, event)
+
+    return NodeBulkCreateResponse(
+        kind=node_schema.kind,
+        ids=[node.get_id() for node in nodes],
+        count=len(nodes),
+        duration=duration,
+        throughput=throughput,
+    )
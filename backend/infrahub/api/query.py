@@ -3,14 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
-from graphql import graphql
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import BranchParams, get_branch_params, get_current_user, get_db
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase  # noqa: TCH001
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, execute_analyzed_query
 from infrahub.graphql.api.dependencies import build_graphql_query_permission_checker
 from infrahub.graphql.initialization import prepare_graphql_params
 from infrahub.graphql.metrics import (
@@ -58,8 +57,9 @@ async def execute_query(
     gql_params = prepare_graphql_params(
         db=db, branch=branch_params.branch, at=branch_params.at, account_session=account_session
     )
-    analyzed_query = InfrahubGraphQLQueryAnalyzer(
+    analyzed_query = InfrahubGraphQLQueryAnalyzer.from_cache(
         query=gql_query.query.value,  # type: ignore[attr-defined]
+        schema_hash=gql_params.schema_hash,
         schema=gql_params.schema,
         branch=branch_params.branch,
     )
@@ -80,9 +80,8 @@ async def execute_query(
     }
 
     with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-        result = await graphql(
-            schema=gql_params.schema,
-            source=gql_query.query.value,  # type: ignore[attr-defined]
+        result = await execute_analyzed_query(
+            analyzed_query=analyzed_query,
             context_value=gql_params.context,
             root_value=None,
             variable_values=params,
@@ -342,6 +342,7 @@ async def load_schema(
         if config.SETTINGS.broker.enable:
             message = messages.EventSchemaUpdate(
                 branch=branch.name,
+                schema_hash=branch.active_schema_hash,
                 meta=Meta(initiator_id=WORKER_IDENTITY),
             )
             background_tasks.add_task(services.send, message)
@@ -19,7 +19,7 @@ from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.graph import GRAPH_VERSION
 from infrahub.core.graph.constraints import ConstraintManagerBase, ConstraintManagerMemgraph, ConstraintManagerNeo4j
-from infrahub.core.graph.index import node_indexes, rel_indexes
+from infrahub.core.graph.index import get_rel_indexes, node_indexes
 from infrahub.core.graph.schema import GRAPH_SCHEMA
 from infrahub.core.initialization import (
     create_default_menu,
@@ -32,7 +32,7 @@ from infrahub.core.initialization import (
     initialize_registry,
 )
 from infrahub.core.manager import NodeManager
-from infrahub.core.migrations.graph import get_graph_migrations
+from infrahub.core.migrations.graph import Migration017, get_graph_migrations
 from infrahub.core.migrations.schema.models import SchemaApplyMigrationData
 from infrahub.core.schema import SchemaRoot, core_models, internal_schema
 from infrahub.core.schema.definitions.deprecated import deprecated_models
@@ -162,6 +162,20 @@ async def migrate(
             )
 
         if migrations and not check:
+            for migration in migrations:
+                if not isinstance(migration, Migration017):
+                    continue
+                migration.temporal_format = config.SETTINGS.database.temporal_format
+                # The times are converted before the other migrations to let them all run against a graph stored
+                # with the configured format, the migration 017 then resumes and validates the conversion in its turn
+                conversion_result = await migration.execute(db=db)
+                if not conversion_result.success:
+                    rprint(f"Migration: {migration.name} [bold red]FAILED[/bold red]")
+                    for error in conversion_result.errors:
+                        rprint(f"  {error}")
+                    migrations = []
+                break
+
             for migration in migrations:
                 log.debug(f"Execute Migration: {migration.name}")
                 execution_result = await migration.execute(db=db)
@@ -371,7 +385,7 @@ async def index(
 
     context: CliContext = ctx.obj
     dbdriver = await context.get_db(retry=1)
-    dbdriver.manager.index.init(nodes=node_indexes, rels=rel_indexes)
+    dbdriver.manager.index.init(nodes=node_indexes, rels=get_rel_indexes())
 
     if action == IndexAction.ADD:
         await dbdriver.manager.index.add()
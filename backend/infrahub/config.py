@@ -109,6 +109,11 @@ class WorkflowDriver(str, Enum):
     WORKER = "worker"
 
 
+class TemporalFormat(str, Enum):
+    ISO8601 = "iso8601"
+    EPOCH_MICROSECONDS = "epoch_microseconds"
+
+
 class MainSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="INFRAHUB_")
     docs_index_path: str = Field(
@@ -210,6 +215,29 @@ class DatabaseSettings(BaseSettings):
     retry_limit: int = Field(
         default=3, description="Maximum number of times a transient issue in a transaction should be retried."
     )
+    rebase_batch_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Number of relationships updated or deleted in each query when rebasing a branch.",
+    )
+    diff_split_threshold: int = Field(
+        default=86400,
+        ge=1,
+        description=(
+            "Duration in seconds above which the timeframe of a diff is split into smaller timeframes calculated "
+            "in parallel."
+        ),
+    )
+    diff_max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of queries run in parallel to calculate a diff."
+    )
+    temporal_format: TemporalFormat = Field(
+        default=TemporalFormat.ISO8601,
+        description=(
+            "Format of the from and to properties of the relationships of the graph, an existing database is "
+            "converted by the graph migrations and the format can't be changed afterwards."
+        ),
+    )
 
     @property
     def database_name(self) -> str:
@@ -320,6 +348,24 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    schema_history_cache_size: int = Field(
+        default=16,
+        ge=0,
+        description="Maximum number of past versions of the schema kept in memory to answer queries using the at parameter (0 disables the cache)",
+    )
+    graphql_schema_cache_size: int = Field(
+        default=8,
+        ge=0,
+        description="Maximum number of generated GraphQL schemas kept in memory and shared between branches (0 disables the cache)",
+    )
+    graphql_document_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of parsed and validated GraphQL queries kept in memory (0 disables the cache)",
+    )
+    graphql_batch_max_size: int = Field(
+        default=50, ge=1, description="Maximum number of GraphQL operations that can be sent in a single request"
+    )
 
 
 class GitSettings(BaseSettings):
@@ -328,6 +374,27 @@ class GitSettings(BaseSettings):
     sync_interval: int = Field(
         default=10, ge=0, description="Time (in seconds) between git repositories synchronizations"
     )
+    max_commit_worktrees: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Maximum number of commit worktrees kept on disk for each repository, the least recently used ones are "
+            "removed first. 0 means no limit. The worktrees in use are only tracked within a process, so a limit "
+            "requires a single git agent per repositories directory."
+        ),
+    )
+    jinja2_environment_cache_size: int = Field(
+        default=50,
+        ge=0,
+        description=(
+            "Maximum number of Jinja2 environments, one per commit of a repository, kept in memory with their "
+            "compiled templates (0 disables the cache)"
+        ),
+    )
+    jinja2_bytecode_cache_directory: Optional[str] = Field(
+        default=None,
+        description="Directory where the compiled Jinja2 templates are stored to be reused by other processes, disabled if not set",
+    )
 
 
 class HTTPSettings(BaseSettings):
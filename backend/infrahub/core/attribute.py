@@ -91,7 +91,7 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         id: Optional[str] = None,
         db_id: Optional[str] = None,
         data: Optional[Union[dict, str, AttributeFromDB]] = None,
-        updated_at: Optional[Union[Timestamp, str]] = None,
+        updated_at: Optional[Union[Timestamp, str, int]] = None,
         is_default: bool = False,
         is_from_profile: bool = False,
         **kwargs,
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from pydantic import Field, field_validator
 
+from infrahub import config
 from infrahub.core.constants import (
     GLOBAL_BRANCH_NAME,
 )
@@ -12,8 +13,8 @@ from infrahub.core.models import SchemaBranchHash  # noqa: TCH001
 from infrahub.core.node.standard import StandardNode
 from infrahub.core.query.branch import (
     DeleteBranchRelationshipsQuery,
-    GetAllBranchInternalRelationshipQuery,
     RebaseBranchDeleteRelationshipQuery,
+    RebaseBranchRelationshipsQuery,
     RebaseBranchUpdateRelationshipQuery,
 )
 from infrahub.core.registry import registry
@@ -169,13 +170,15 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         return [default_branch, self.name]
 
-    def get_branches_and_times_to_query(self, at: Optional[Union[Timestamp, str]] = None) -> dict[frozenset, str]:
+    def get_branches_and_times_to_query(
+        self, at: Optional[Union[Timestamp, str]] = None
+    ) -> dict[frozenset, Union[str, int]]:
         """Return all the names of the branches that are constituing this branch with the associated times excluding the global branch"""
 
         at = Timestamp(at)
 
         if self.is_default:
-            return {frozenset([self.name]): at.to_string()}
+            return {frozenset([self.name]): at.to_graph()}
 
         time_default_branch = at
 
@@ -184,21 +187,21 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             time_default_branch = Timestamp(self.branched_from)
 
         return {
-            frozenset([self.origin_branch]): time_default_branch.to_string(),
-            frozenset([self.name]): at.to_string(),
+            frozenset([self.origin_branch]): time_default_branch.to_graph(),
+            frozenset([self.name]): at.to_graph(),
         }
 
     def get_branches_and_times_to_query_global(
         self,
         at: Optional[Union[Timestamp, str]] = None,
         is_isolated: bool = True,
-    ) -> dict[frozenset, str]:
+    ) -> dict[frozenset, Union[str, int]]:
         """Return all the names of the branches that are constituting this branch with the associated times."""
 
         at = Timestamp(at)
 
         if self.is_default:
-            return {frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_string()}
+            return {frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_graph()}
 
         time_default_branch = at
 
@@ -207,17 +210,17 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             time_default_branch = Timestamp(self.branched_from)
 
         return {
-            frozenset((GLOBAL_BRANCH_NAME, self.origin_branch)): time_default_branch.to_string(),
-            frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_string(),
+            frozenset((GLOBAL_BRANCH_NAME, self.origin_branch)): time_default_branch.to_graph(),
+            frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_graph(),
         }
 
     def get_branches_and_times_for_range(
         self, start_time: Timestamp, end_time: Timestamp
-    ) -> tuple[dict[str, str], dict[str, str]]:
+    ) -> tuple[dict[str, Union[str, int]], dict[str, Union[str, int]]]:
         """Return the names of the branches that are constituing this branch with the start and end times."""
 
-        start = {}
-        end = {}
+        start: dict[str, Union[str, int]] = {}
+        end: dict[str, Union[str, int]] = {}
 
         time_branched_from = Timestamp(self.branched_from)
         time_created_at = Timestamp(self.created_at)
@@ -227,18 +230,18 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         if start_time < time_created_at:
             time_query_start = time_created_at
 
-        start[self.name] = time_query_start.to_string()
+        start[self.name] = time_query_start.to_graph()
 
         # START
         if not self.is_default and time_query_start <= time_branched_from:
-            start[self.origin_branch] = time_branched_from.to_string()
+            start[self.origin_branch] = time_branched_from.to_graph()
         elif not self.is_default and time_query_start > time_branched_from:
-            start[self.origin_branch] = time_query_start.to_string()
+            start[self.origin_branch] = time_query_start.to_graph()
 
         # END
-        end[self.name] = end_time.to_string()
+        end[self.name] = end_time.to_graph()
         if not self.is_default:
-            end[self.origin_branch] = end_time.to_string()
+            end[self.origin_branch] = end_time.to_graph()
 
         return start, end
 
@@ -304,13 +307,12 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         params: dict[str, Any] = {}
         at = Timestamp(at)
-        at_str = at.to_string()
         if branch_agnostic:
             filter_str = "r.from <= $time1 AND (r.to IS NULL or r.to >= $time1)"
-            params["time1"] = at_str
+            params["time1"] = at.to_graph()
             return filter_str, params
 
-        branches_times = self.get_branches_and_times_to_query_global(at=at_str, is_isolated=is_isolated)
+        branches_times = self.get_branches_and_times_to_query_global(at=at, is_isolated=is_isolated)
 
         for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
             params[f"branch{idx}"] = list(branch_name)
@@ -352,8 +354,8 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             branches_times = self.get_branches_and_times_to_query(at=start_time)
 
         params["branches"] = list({branch for branches in branches_times for branch in branches})
-        params["start_time"] = start_time.to_string()
-        params["end_time"] = end_time.to_string()
+        params["start_time"] = start_time.to_graph()
+        params["end_time"] = end_time.to_graph()
 
         for rel in rel_labels:
             filters_per_rel = [
@@ -422,8 +424,8 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         end_time = Timestamp(end_time)
 
         params["branches"] = self.get_branches_in_scope()
-        params["start_time"] = start_time.to_string()
-        params["end_time"] = end_time.to_string()
+        params["start_time"] = start_time.to_graph()
+        params["end_time"] = end_time.to_graph()
 
         filters_per_rel = [
             f"""({rel_label}.branch IN $branches AND {rel_label}.from >= $start_time
@@ -437,8 +439,11 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         return filters, params
 
-    async def rebase(self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None) -> None:
-        """Rebase the current Branch with its origin branch"""
+    async def rebase(self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None) -> tuple[int, int]:
+        """Rebase the current Branch with its origin branch
+
+        Return the number of relationships deleted and the number of relationships updated.
+        """
 
         at = Timestamp(at)
 
@@ -447,7 +452,7 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         # Update the from time on all other relationships
         # If conflict is set, ignore the one with Drop
 
-        await self.rebase_graph(db=db, at=at)
+        nbr_rels_deleted, nbr_rels_updated = await self.rebase_graph(db=db, at=at)
 
         # FIXME, we must ensure that there is no conflict before rebasing a branch
         #   Otherwise we could endup with a complicated situation
@@ -457,46 +462,45 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         # Update the branch in the registry after the rebase
         registry.branch[self.name] = self
 
-    async def rebase_graph(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
-        at = Timestamp(at)
-
-        query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=self)
-        await query.execute(db=db)
-
-        rels_to_delete = []
-        rels_to_update = []
-        for result in query.get_results():
-            element_id = result.get("r").element_id
-
-            conflict_status = result.get("r").get("conflict", None)
-            if conflict_status and conflict_status == "drop":
-                rels_to_delete.append(element_id)
-                continue
+        return nbr_rels_deleted, nbr_rels_updated
 
-            time_to_str = result.get("r").get("to", None)
-            time_from_str = result.get("r").get("from")
-            time_from = Timestamp(time_from_str)
+    async def rebase_graph(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> tuple[int, int]:
+        """Update the relationships of the branch for a rebase at a given time.
 
-            if not time_to_str and time_from_str and time_from <= at:
-                rels_to_update.append(element_id)
-                continue
-
-            if not time_to_str and time_from_str and time_from > at:
-                rels_to_delete.append(element_id)
-                continue
-
-            time_to = Timestamp(time_to_str)
-            if time_to < at:
-                rels_to_delete.append(element_id)
-                continue
-
-            rels_to_update.append(element_id)
+        The relationships of the branch are read by pages of `rebase_batch_size` ordered by internal id,
+        the relationships of each page are classified by the database then deleted or updated before reading the next page.
+        Return the number of relationships deleted and the number of relationships updated.
+        """
+        at = Timestamp(at)
+        batch_size = config.SETTINGS.database.rebase_batch_size
+
+        nbr_rels_deleted = 0
+        nbr_rels_updated = 0
+        after_rel_id: Optional[str] = None
+        while True:
+            query = await RebaseBranchRelationshipsQuery.init(
+                db=db, branch=self, at=at, after_rel_id=after_rel_id, limit=batch_size
+            )
+            await query.execute(db=db)
+            rel_ids_to_delete, rel_ids_to_update = query.get_rel_ids()
+
+            if rel_ids_to_delete:
+                delete_query = await RebaseBranchDeleteRelationshipQuery.init(
+                    db=db, branch=self, at=at, ids=rel_ids_to_delete
+                )
+                await delete_query.execute(db=db)
+                nbr_rels_deleted += delete_query.get_nbr_rels()
 
-        update_query = await RebaseBranchUpdateRelationshipQuery.init(db=db, ids=rels_to_update, at=at)
-        await update_query.execute(db=db)
+            if rel_ids_to_update:
+                update_query = await RebaseBranchUpdateRelationshipQuery.init(
+                    db=db, branch=self, at=at, ids=rel_ids_to_update
+                )
+                await update_query.execute(db=db)
+                nbr_rels_updated += update_query.get_nbr_rels()
 
-        delete_query = await RebaseBranchDeleteRelationshipQuery.init(db=db, ids=rels_to_delete, at=at)
-        await delete_query.execute(db=db)
+            if len(rel_ids_to_delete) + len(rel_ids_to_update) < batch_size:
+                return nbr_rels_deleted, nbr_rels_updated
+            after_rel_id = query.get_last_rel_id()
 
 
 registry.branch_object = Branch
@@ -1,3 +1,8 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable
+
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.diff.query_parser import DiffQueryParser
@@ -5,7 +10,7 @@ from infrahub.core.query.diff import DiffAllPathsQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
-from .model.path import CalculatedDiffs, NodeFieldSpecifier
+from .model.path import CalculatedDiffs, NodeFieldSpecifier, TimeRange
 
 
 class DiffCalculator:
@@ -20,53 +25,153 @@ class DiffCalculator:
         to_time: Timestamp,
         previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
     ) -> CalculatedDiffs:
-        if diff_branch.name == registry.default_branch:
-            diff_branch_from_time = from_time
-        else:
-            diff_branch_from_time = Timestamp(diff_branch.get_branched_from())
-        diff_parser = DiffQueryParser(
+        calculated_diffs = await self.calculate_diffs(
             base_branch=base_branch,
             diff_branch=diff_branch,
-            schema_manager=registry.schema,
-            from_time=from_time,
-            to_time=to_time,
-        )
-        branch_diff_query = await DiffAllPathsQuery.init(
-            db=self.db,
-            branch=diff_branch,
-            base_branch=base_branch,
-            diff_branch_from_time=diff_branch_from_time,
-            diff_from=from_time,
-            diff_to=to_time,
+            time_ranges=[TimeRange(from_time=from_time, to_time=to_time)],
+            previous_node_specifiers=previous_node_specifiers,
         )
-        await branch_diff_query.execute(db=self.db)
-        for query_result in branch_diff_query.get_results():
-            diff_parser.read_result(query_result=query_result)
+        return calculated_diffs[0]
+
+    async def calculate_diffs(
+        self,
+        base_branch: Branch,
+        diff_branch: Branch,
+        time_ranges: list[TimeRange],
+        previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
+    ) -> list[CalculatedDiffs]:
+        """Calculate one diff for each of the consecutive time ranges, running the independent queries in parallel.
 
-        if base_branch.name != diff_branch.name:
-            branch_node_specifiers = diff_parser.get_node_field_specifiers_for_branch(branch_name=diff_branch.name)
-            new_node_field_specifiers = branch_node_specifiers - (previous_node_specifiers or set())
-            current_node_field_specifiers = (previous_node_specifiers or set()) - new_node_field_specifiers
-            base_diff_query = await DiffAllPathsQuery.init(
-                db=self.db,
-                branch=base_branch,
+        The queries on the base branch for a given time range depend on the fields changed on the diff branch
+        before the end of this time range, so they are run once all the queries on the diff branch are completed,
+        except for the fields already known to be changed before the first time range.
+        """
+        branched_from_time: Timestamp | None = None
+        if diff_branch.name != registry.default_branch:
+            branched_from_time = Timestamp(diff_branch.get_branched_from())
+        diff_parsers = [
+            DiffQueryParser(
                 base_branch=base_branch,
-                diff_branch_from_time=diff_branch_from_time,
-                diff_from=from_time,
-                diff_to=to_time,
-                current_node_field_specifiers=[
-                    (nfs.node_uuid, nfs.field_name) for nfs in current_node_field_specifiers
-                ],
-                new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
+                diff_branch=diff_branch,
+                schema_manager=registry.schema,
+                from_time=time_range.from_time,
+                to_time=time_range.to_time,
             )
-            await base_diff_query.execute(db=self.db)
-            for query_result in base_diff_query.get_results():
-                diff_parser.read_result(query_result=query_result)
+            for time_range in time_ranges
+        ]
+        # queries sharing a transaction can't be run in parallel
+        max_concurrency = 1 if self.db.is_transaction else config.SETTINGS.database.diff_max_concurrency
+        semaphore = asyncio.Semaphore(max_concurrency)
+        is_branch_diff = base_branch.name != diff_branch.name
+        # immutable as the pending queries keep a reference to it
+        known_node_specifiers = frozenset(previous_node_specifiers or set())
 
-        diff_parser.parse()
-        return CalculatedDiffs(
-            base_branch_name=base_branch.name,
-            diff_branch_name=diff_branch.name,
-            base_branch_diff=diff_parser.get_diff_root_for_branch(branch=base_branch.name),
-            diff_branch_diff=diff_parser.get_diff_root_for_branch(branch=diff_branch.name),
-        )
+        branch_queries = [
+            self._read_diff_query(
+                semaphore=semaphore,
+                diff_parser=diff_parser,
+                branch=diff_branch,
+                base_branch=base_branch,
+                branched_from_time=branched_from_time,
+                time_range=time_range,
+            )
+            for diff_parser, time_range in zip(diff_parsers, time_ranges)
+        ]
+        if is_branch_diff and known_node_specifiers:
+            branch_queries.append(
+                self._read_diff_query(
+                    semaphore=semaphore,
+                    diff_parser=diff_parsers[0],
+                    branch=base_branch,
+                    base_branch=base_branch,
+                    branched_from_time=branched_from_time,
+                    time_range=time_ranges[0],
+                    current_node_field_specifiers=known_node_specifiers,
+                    new_node_field_specifiers=set(),
+                )
+            )
+        await asyncio.gather(*branch_queries)
+
+        if is_branch_diff:
+            base_queries = []
+            for index, (diff_parser, time_range) in enumerate(zip(diff_parsers, time_ranges)):
+                branch_node_specifiers = diff_parser.get_node_field_specifiers_for_branch(branch_name=diff_branch.name)
+                new_node_field_specifiers = branch_node_specifiers - known_node_specifiers
+                if index > 0 and known_node_specifiers:
+                    base_queries.append(
+                        self._read_diff_query(
+                            semaphore=semaphore,
+                            diff_parser=diff_parser,
+                            branch=base_branch,
+                            base_branch=base_branch,
+                            branched_from_time=branched_from_time,
+                            time_range=time_range,
+                            current_node_field_specifiers=known_node_specifiers,
+                            new_node_field_specifiers=set(),
+                        )
+                    )
+                if new_node_field_specifiers:
+                    base_queries.append(
+                        self._read_diff_query(
+                            semaphore=semaphore,
+                            diff_parser=diff_parser,
+                            branch=base_branch,
+                            base_branch=base_branch,
+                            branched_from_time=branched_from_time,
+                            time_range=time_range,
+                            current_node_field_specifiers=set(),
+                            new_node_field_specifiers=new_node_field_specifiers,
+                        )
+                    )
+                known_node_specifiers |= branch_node_specifiers
+            await asyncio.gather(*base_queries)
+
+        calculated_diffs = []
+        for diff_parser in diff_parsers:
+            diff_parser.parse()
+            calculated_diffs.append(
+                CalculatedDiffs(
+                    base_branch_name=base_branch.name,
+                    diff_branch_name=diff_branch.name,
+                    base_branch_diff=diff_parser.get_diff_root_for_branch(branch=base_branch.name),
+                    diff_branch_diff=diff_parser.get_diff_root_for_branch(branch=diff_branch.name),
+                )
+            )
+        return calculated_diffs
+
+    @asynccontextmanager
+    async def _get_query_db(self) -> AsyncIterator[InfrahubDatabase]:
+        if self.db.is_transaction:
+            yield self.db
+            return
+        async with self.db.start_session() as db:
+            yield db
+
+    async def _read_diff_query(
+        self,
+        semaphore: asyncio.Semaphore,
+        diff_parser: DiffQueryParser,
+        branch: Branch,
+        base_branch: Branch,
+        branched_from_time: Timestamp | None,
+        time_range: TimeRange,
+        current_node_field_specifiers: Iterable[NodeFieldSpecifier] | None = None,
+        new_node_field_specifiers: Iterable[NodeFieldSpecifier] | None = None,
+    ) -> None:
+        async with semaphore, self._get_query_db() as db:
+            diff_query = await DiffAllPathsQuery.init(
+                db=db,
+                branch=branch,
+                base_branch=base_branch,
+                diff_branch_from_time=branched_from_time or time_range.from_time,
+                diff_from=time_range.from_time,
+                diff_to=time_range.to_time,
+                current_node_field_specifiers=None
+                if current_node_field_specifiers is None
+                else [(nfs.node_uuid, nfs.field_name) for nfs in current_node_field_specifiers],
+                new_node_field_specifiers=None
+                if new_node_field_specifiers is None
+                else [(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
+            )
+            async for query_result in diff_query.stream(db=db):
+                diff_parser.read_result(query_result=query_result)
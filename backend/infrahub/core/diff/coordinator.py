@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from infrahub import lock
+from infrahub import config, lock
 from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.log import get_logger
@@ -131,7 +132,7 @@ class DiffCoordinator:
             self.lock_registry.get(name=incremental_lock_name, namespace=self.lock_namespace),
         ):
             log.debug(f"Acquired lock to run branch diff update for {base_branch.name} - {diff_branch.name}")
-            enriched_diffs = await self._update_diffs(
+            enriched_diffs, previous_diffs = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=from_time,
@@ -140,7 +141,7 @@ class DiffCoordinator:
             )
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
+            await self._save_diffs(enriched_diffs=enriched_diffs, previous_diffs=previous_diffs)
             await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Branch diff update complete for {base_branch.name} - {diff_branch.name}")
         return enriched_diffs.diff_branch_diff
@@ -161,7 +162,7 @@ class DiffCoordinator:
         )
         async with self.lock_registry.get(name=general_lock_name, namespace=self.lock_namespace):
             log.debug(f"Acquired lock to run arbitrary diff update for {base_branch.name} - {diff_branch.name}")
-            enriched_diffs = await self._update_diffs(
+            enriched_diffs, previous_diffs = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=from_time,
@@ -170,7 +171,7 @@ class DiffCoordinator:
             )
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
+            await self._save_diffs(enriched_diffs=enriched_diffs, previous_diffs=previous_diffs)
             await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Arbitrary diff update complete for {base_branch.name} - {diff_branch.name}")
         return enriched_diffs.diff_branch_diff
@@ -198,7 +199,7 @@ class DiffCoordinator:
             from_time = current_branch_diff.from_time
             branched_from_time = Timestamp(diff_branch.get_branched_from())
             from_time = max(from_time, branched_from_time)
-            enriched_diffs = await self._update_diffs(
+            enriched_diffs, previous_diffs = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=branched_from_time,
@@ -214,7 +215,7 @@ class DiffCoordinator:
 
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
             await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
+            await self._save_diffs(enriched_diffs=enriched_diffs, previous_diffs=previous_diffs)
             await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Diff recalculation complete for {base_branch.name} - {diff_branch.name}")
         return enriched_diffs.diff_branch_diff
@@ -227,7 +228,7 @@ class DiffCoordinator:
         to_time: Timestamp,
         tracking_id: TrackingId | None = None,
         force_branch_refresh: bool = False,
-    ) -> EnrichedDiffs:
+    ) -> tuple[EnrichedDiffs, EnrichedDiffs | None]:
         diff_uuids_to_delete = []
         retrieved_enriched_diffs = await self.diff_repo.get_pairs(
             base_branch_name=base_branch.name,
@@ -235,7 +236,12 @@ class DiffCoordinator:
             from_time=from_time,
             to_time=to_time,
         )
+        previous_diffs = self._get_tracked_diffs(
+            enriched_diffs_list=retrieved_enriched_diffs if not force_branch_refresh else [], tracking_id=tracking_id
+        )
         for enriched_diffs in retrieved_enriched_diffs:
+            if enriched_diffs is previous_diffs:
+                continue
             if tracking_id:
                 if enriched_diffs.base_branch_diff.tracking_id:
                     diff_uuids_to_delete.append(enriched_diffs.base_branch_diff.uuid)
@@ -250,6 +256,10 @@ class DiffCoordinator:
             ),
             partial_enriched_diffs=retrieved_enriched_diffs if not force_branch_refresh else [],
         )
+        if previous_diffs and aggregated_enriched_diffs is previous_diffs:
+            # the saved diffs already cover the timeframe, they are enriched again and replaced as a whole
+            diff_uuids_to_delete.extend([previous_diffs.base_branch_diff.uuid, previous_diffs.diff_branch_diff.uuid])
+            previous_diffs = None
 
         await self.conflicts_enricher.add_conflicts_to_branch_diff(
             base_diff_root=aggregated_enriched_diffs.base_branch_diff,
@@ -262,9 +272,34 @@ class DiffCoordinator:
         if tracking_id:
             aggregated_enriched_diffs.base_branch_diff.tracking_id = tracking_id
             aggregated_enriched_diffs.diff_branch_diff.tracking_id = tracking_id
+        if previous_diffs:
+            # keep the saved roots, only the nodes that changed will be saved again
+            aggregated_enriched_diffs.base_branch_diff.uuid = previous_diffs.base_branch_diff.uuid
+            aggregated_enriched_diffs.base_branch_diff.partner_uuid = previous_diffs.diff_branch_diff.uuid
+            aggregated_enriched_diffs.diff_branch_diff.uuid = previous_diffs.diff_branch_diff.uuid
+            aggregated_enriched_diffs.diff_branch_diff.partner_uuid = previous_diffs.base_branch_diff.uuid
         if diff_uuids_to_delete:
             await self.diff_repo.delete_diff_roots(diff_root_uuids=diff_uuids_to_delete)
-        return aggregated_enriched_diffs
+        return aggregated_enriched_diffs, previous_diffs
+
+    def _get_tracked_diffs(
+        self, enriched_diffs_list: list[EnrichedDiffs], tracking_id: TrackingId | None
+    ) -> EnrichedDiffs | None:
+        if not tracking_id:
+            return None
+        for enriched_diffs in enriched_diffs_list:
+            if (
+                enriched_diffs.diff_branch_diff.tracking_id == tracking_id
+                and enriched_diffs.base_branch_diff.tracking_id == tracking_id
+            ):
+                return enriched_diffs
+        return None
+
+    async def _save_diffs(self, enriched_diffs: EnrichedDiffs, previous_diffs: EnrichedDiffs | None) -> None:
+        if previous_diffs:
+            await self.diff_repo.update(enriched_diffs=enriched_diffs, previous_diffs=previous_diffs)
+        else:
+            await self.diff_repo.save(enriched_diffs=enriched_diffs)
 
     async def _get_aggregated_enriched_diffs(
         self, diff_request: EnrichedDiffRequest, partial_enriched_diffs: list[EnrichedDiffs]
@@ -312,16 +347,40 @@ class DiffCoordinator:
         return await self.data_check_synchronizer.synchronize(enriched_diff=enriched_diff)
 
     async def _get_enriched_diff(self, diff_request: EnrichedDiffRequest) -> EnrichedDiffs:
-        calculated_diff_pair = await self.diff_calculator.calculate_diff(
+        calculated_diff_pairs = await self.diff_calculator.calculate_diffs(
             base_branch=diff_request.base_branch,
             diff_branch=diff_request.diff_branch,
-            from_time=diff_request.from_time,
-            to_time=diff_request.to_time,
+            time_ranges=self._split_time_range(from_time=diff_request.from_time, to_time=diff_request.to_time),
             previous_node_specifiers=diff_request.node_field_specifiers,
         )
-        enriched_diff_pair = await self.diff_enricher.enrich(calculated_diffs=calculated_diff_pair)
+        enriched_diff_pair: EnrichedDiffs | None = None
+        for calculated_diff_pair in calculated_diff_pairs:
+            current_diff_pair = await self.diff_enricher.enrich(calculated_diffs=calculated_diff_pair)
+            if enriched_diff_pair:
+                current_diff_pair = await self.diff_combiner.combine(
+                    earlier_diffs=enriched_diff_pair, later_diffs=current_diff_pair
+                )
+            enriched_diff_pair = current_diff_pair
+        if enriched_diff_pair is None:
+            raise ValueError("No diff calculated")
         return enriched_diff_pair
 
+    def _split_time_range(self, from_time: Timestamp, to_time: Timestamp) -> list[TimeRange]:
+        duration = (to_time.obj - from_time.obj).total_seconds()
+        nbr_time_ranges = min(
+            math.ceil(duration / config.SETTINGS.database.diff_split_threshold),
+            config.SETTINGS.database.diff_max_concurrency,
+        )
+        if nbr_time_ranges <= 1:
+            return [TimeRange(from_time=from_time, to_time=to_time)]
+        limits = [from_time]
+        for index in range(1, nbr_time_ranges):
+            limits.append(
+                Timestamp(from_time.obj.add(microseconds=int(duration * 1_000_000 * index / nbr_time_ranges)))
+            )
+        limits.append(to_time)
+        return [TimeRange(from_time=start, to_time=end) for start, end in zip(limits[:-1], limits[1:])]
+
     def _get_missing_time_ranges(
         self, time_ranges: list[TimeRange], from_time: Timestamp, to_time: Timestamp
     ) -> list[TimeRange]:
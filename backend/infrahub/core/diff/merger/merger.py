@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from infrahub.core import registry
 from infrahub.core.diff.model.path import BranchTrackingId
 from infrahub.core.diff.query.merge import DiffMergePropertiesQuery, DiffMergeQuery
+from infrahub.log import get_logger
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
@@ -14,8 +15,13 @@ if TYPE_CHECKING:
 
     from .serializer import DiffMergeSerializer
 
+log = get_logger()
+
 
 class DiffMerger:
+    # number of diff nodes loaded from the database at once
+    MAX_NODE_BATCH_SIZE: int = 500
+
     def __init__(
         self,
         db: InfrahubDatabase,
@@ -41,26 +47,48 @@ class DiffMerger:
                 latest_diff = diff
         if latest_diff is None:
             raise RuntimeError(f"Missing diff for branch {self.source_branch.name}")
-        enriched_diff = await self.diff_repository.get_one(
-            diff_branch_name=self.source_branch.name, diff_id=latest_diff.uuid
+        conflicted_relationship_elements = await self.diff_repository.get_conflicted_relationship_elements(
+            diff_id=latest_diff.uuid
         )
-        async for node_diff_dicts, property_diff_dicts in self.serializer.serialize_diff(diff=enriched_diff):
-            merge_query = await DiffMergeQuery.init(
-                db=self.db,
-                branch=self.source_branch,
-                at=at,
-                target_branch=self.destination_branch,
-                node_diff_dicts=node_diff_dicts,
-            )
-            await merge_query.execute(db=self.db)
-            merge_properties_query = await DiffMergePropertiesQuery.init(
-                db=self.db,
-                branch=self.source_branch,
-                at=at,
-                target_branch=self.destination_branch,
-                property_diff_dicts=property_diff_dicts,
+        self.serializer.initialize(
+            source_branch_name=self.source_branch.name,
+            target_branch_name=self.destination_branch.name,
+            conflicted_relationship_elements=conflicted_relationship_elements,
+        )
+        log.info(f"Merging diff {latest_diff.uuid} of branch {self.source_branch.name}")
+        after_node_uuid: str | None = None
+        num_merged_nodes = 0
+        while True:
+            node_batch = await self.diff_repository.get_node_batch(
+                diff_branch_name=self.source_branch.name,
+                diff_id=latest_diff.uuid,
+                limit=self.MAX_NODE_BATCH_SIZE,
+                after_node_uuid=after_node_uuid,
             )
-            await merge_properties_query.execute(db=self.db)
+            if not node_batch:
+                break
+            async for node_diff_dicts, property_diff_dicts in self.serializer.serialize_nodes(nodes=node_batch):
+                merge_query = await DiffMergeQuery.init(
+                    db=self.db,
+                    branch=self.source_branch,
+                    at=at,
+                    target_branch=self.destination_branch,
+                    node_diff_dicts=node_diff_dicts,
+                )
+                await merge_query.execute(db=self.db)
+                merge_properties_query = await DiffMergePropertiesQuery.init(
+                    db=self.db,
+                    branch=self.source_branch,
+                    at=at,
+                    target_branch=self.destination_branch,
+                    property_diff_dicts=property_diff_dicts,
+                )
+                await merge_properties_query.execute(db=self.db)
+            num_merged_nodes += len(node_batch)
+            log.info(f"Merged {num_merged_nodes} nodes of branch {self.source_branch.name}")
+            if len(node_batch) < self.MAX_NODE_BATCH_SIZE:
+                break
+            after_node_uuid = node_batch[-1].uuid
 
         self.source_branch.branched_from = at.to_string()
         await self.source_branch.save(db=self.db)
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterable
 
 from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.constants.database import DatabaseEdgeType
@@ -8,9 +8,11 @@ from infrahub.exceptions import SchemaNotFoundError
 from infrahub.types import ATTRIBUTE_PYTHON_TYPES
 
 from ..model.path import (
+    ConflictedRelationshipElement,
     ConflictSelection,
     EnrichedDiffAttribute,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffProperty,
     EnrichedDiffRoot,
     EnrichedDiffSingleRelationship,
@@ -121,7 +123,8 @@ class DiffMergeSerializer:
             return value_type(raw_value)
         return raw_value
 
-    def _cache_conflicted_cardinality_one_relationships(self, diff: EnrichedDiffRoot) -> None:
+    def _get_conflicted_relationship_elements(self, diff: EnrichedDiffRoot) -> list[ConflictedRelationshipElement]:
+        conflicted_elements = []
         for node in diff.nodes:
             for rel in node.relationships:
                 if rel.cardinality is not RelationshipCardinality.ONE:
@@ -132,30 +135,59 @@ class DiffMergeSerializer:
                     for prop in element.properties:
                         if prop.property_type is not DatabaseEdgeType.IS_RELATED:
                             continue
-                        relationship_identifier = self._get_relationship_identifier(
-                            schema_kind=node.kind, relationship_name=rel.name
-                        )
-                        if prop.previous_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.previous_value)
-                            )
-                        if prop.new_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.new_value)
+                        conflicted_elements.append(
+                            ConflictedRelationshipElement(
+                                node_uuid=node.uuid,
+                                node_kind=node.kind,
+                                relationship_name=rel.name,
+                                previous_peer_id=prop.previous_value,
+                                new_peer_id=prop.new_value,
                             )
+                        )
+        return conflicted_elements
+
+    def initialize(
+        self,
+        source_branch_name: str,
+        target_branch_name: str,
+        conflicted_relationship_elements: Iterable[ConflictedRelationshipElement],
+    ) -> None:
+        """Prepare the serialization of the nodes of a diff, which can then be serialized in several calls"""
+        self._reset_caches()
+        self._source_branch_name = source_branch_name
+        self._target_branch_name = target_branch_name
+        self._conflicted_cardinality_one_relationships = set()
+        for element in conflicted_relationship_elements:
+            relationship_identifier = self._get_relationship_identifier(
+                schema_kind=element.node_kind, relationship_name=element.relationship_name
+            )
+            for peer_id in (element.previous_peer_id, element.new_peer_id):
+                if peer_id:
+                    self._conflicted_cardinality_one_relationships.add(
+                        (element.node_uuid, relationship_identifier, peer_id)
+                    )
 
     async def serialize_diff(
         self, diff: EnrichedDiffRoot
     ) -> AsyncGenerator[
         tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]], None
     ]:
-        self._reset_caches()
-        self._source_branch_name = diff.diff_branch_name
-        self._target_branch_name = diff.base_branch_name
-        self._cache_conflicted_cardinality_one_relationships(diff=diff)
+        self.initialize(
+            source_branch_name=diff.diff_branch_name,
+            target_branch_name=diff.base_branch_name,
+            conflicted_relationship_elements=self._get_conflicted_relationship_elements(diff=diff),
+        )
+        async for serialized_diffs in self.serialize_nodes(nodes=diff.nodes):
+            yield serialized_diffs
+
+    async def serialize_nodes(
+        self, nodes: Iterable[EnrichedDiffNode]
+    ) -> AsyncGenerator[
+        tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]], None
+    ]:
         serialized_node_diffs = []
         serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
-        for node in diff.nodes:
+        for node in nodes:
             node_action = self._get_action(action=node.action, conflict=node.conflict)
             serial_attr_diffs = []
             for attr_diff in node.attributes:
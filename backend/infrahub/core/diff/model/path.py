@@ -704,3 +704,14 @@ class DatabasePath:  # pylint: disable=too-many-public-methods
 class EnrichedNodeCreateRequest:
     node: EnrichedDiffNode
     root_uuid: str
+
+
+@dataclass
+class ConflictedRelationshipElement:
+    """IS_RELATED property of a cardinality-one relationship element with a conflict"""
+
+    node_uuid: str
+    node_kind: str
+    relationship_name: str
+    previous_peer_id: str | None
+    new_peer_id: str | None
@@ -0,0 +1,52 @@
+from typing import Any, Generator
+
+from infrahub.core.constants import RelationshipCardinality
+from infrahub.core.constants.database import DatabaseEdgeType
+from infrahub.core.query import Query, QueryType
+from infrahub.database import InfrahubDatabase
+
+from ..model.path import ConflictedRelationshipElement
+
+
+class EnrichedDiffConflictedRelationshipsQuery(Query):
+    """Get the peers of the cardinality-one relationship elements with a conflict in a diff, without the rest of the diff"""
+
+    name = "enriched_diff_conflicted_relationships"
+    type = QueryType.READ
+    insert_limit = False
+
+    def __init__(self, diff_id: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.diff_id = diff_id
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {
+            "diff_id": self.diff_id,
+            "cardinality": RelationshipCardinality.ONE.value,
+            "property_type": DatabaseEdgeType.IS_RELATED.value,
+        }
+        query = """
+        MATCH (:DiffRoot {uuid: $diff_id})-[:DIFF_HAS_NODE]->(diff_node:DiffNode)
+            -[:DIFF_HAS_RELATIONSHIP]->(diff_relationship:DiffRelationship {cardinality: $cardinality})
+            -[:DIFF_HAS_ELEMENT]->(diff_rel_element:DiffRelationshipElement)
+        WHERE exists((diff_rel_element)-[:DIFF_HAS_CONFLICT]->(:DiffConflict))
+        MATCH (diff_rel_element)-[:DIFF_HAS_PROPERTY]->(diff_rel_property:DiffProperty {property_type: $property_type})
+        """
+        self.add_to_query(query=query)
+        self.return_labels = [
+            "diff_node.uuid AS node_uuid",
+            "diff_node.kind AS node_kind",
+            "diff_relationship.name AS relationship_name",
+            "diff_rel_property.previous_value AS previous_peer_id",
+            "diff_rel_property.new_value AS new_peer_id",
+        ]
+
+    def get_conflicted_elements(self) -> Generator[ConflictedRelationshipElement, None, None]:
+        for result in self.get_results():
+            yield ConflictedRelationshipElement(
+                node_uuid=result.get_as_type("node_uuid", return_type=str),
+                node_kind=result.get_as_type("node_kind", return_type=str),
+                relationship_name=result.get_as_type("relationship_name", return_type=str),
+                previous_peer_id=result.get_as_optional_type("previous_peer_id", return_type=str),
+                new_peer_id=result.get_as_optional_type("new_peer_id", return_type=str),
+            )
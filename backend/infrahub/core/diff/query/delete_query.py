@@ -23,3 +23,33 @@ class EnrichedDiffDeleteQuery(Query):
         DETACH DELETE d_root
         """
         self.add_to_query(query=query)
+
+
+class EnrichedNodesDeleteQuery(Query):
+    """Delete some nodes of diff roots with their fields, the child nodes are kept but unlinked from deleted parents."""
+
+    name = "enriched_nodes_delete"
+    type = QueryType.WRITE
+    insert_return = False
+
+    def __init__(self, node_uuids_by_root: dict[str, set[str]], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.node_uuids_by_root = node_uuids_by_root
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {
+            "node_details_list": [
+                {"root_uuid": root_uuid, "node_uuids": list(node_uuids)}
+                for root_uuid, node_uuids in self.node_uuids_by_root.items()
+                if node_uuids
+            ]
+        }
+        query = """
+        UNWIND $node_details_list AS node_details
+        MATCH (:DiffRoot {uuid: node_details.root_uuid})-[:DIFF_HAS_NODE]->(diff_node:DiffNode)
+        WHERE diff_node.uuid IN node_details.node_uuids
+        OPTIONAL MATCH (diff_node)-[:DIFF_HAS_ATTRIBUTE|DIFF_HAS_RELATIONSHIP|DIFF_HAS_ELEMENT|DIFF_HAS_PROPERTY|DIFF_HAS_CONFLICT*]->(diff_thing)
+        DETACH DELETE diff_thing
+        DETACH DELETE diff_node
+        """
+        self.add_to_query(query=query)
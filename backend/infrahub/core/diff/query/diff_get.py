@@ -41,6 +41,8 @@ class EnrichedDiffGetQuery(Query):
         to_time: Timestamp | None = None,
         tracking_id: TrackingId | None = None,
         diff_ids: list[str] | None = None,
+        order_by_node_uuid: bool = False,
+        after_node_uuid: str | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -52,6 +54,9 @@ class EnrichedDiffGetQuery(Query):
         self.tracking_id = tracking_id
         self.diff_ids = diff_ids
         self.filters = filters or EnrichedDiffQueryFilters()
+        # keyset pagination over the UUIDs of the nodes, instead of the ordering by kind and label
+        self.order_by_node_uuid = order_by_node_uuid
+        self.after_node_uuid = after_node_uuid
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         self.params = {
@@ -63,6 +68,7 @@ class EnrichedDiffGetQuery(Query):
             "diff_ids": self.diff_ids,
             "limit": self.limit or config.SETTINGS.database.query_size_limit,
             "offset": self.offset,
+            "after_node_uuid": self.after_node_uuid,
         }
         # ruff: noqa: E501
         self.add_to_query(query=QUERY_MATCH_NODES)
@@ -78,20 +84,37 @@ class EnrichedDiffGetQuery(Query):
             """ % {"filters": filters}
             self.add_to_query(query=query_filters)
 
-        query_2 = """
+        query_group = """
+        // skip the nodes of the previous pages before grouping them
+        WITH diff_root, diff_node
+        WHERE $after_node_uuid IS NULL OR diff_node.uuid > $after_node_uuid
         // group by diff node uuid for pagination
         WITH diff_node.uuid AS diff_node_uuid, diff_node.kind AS diff_node_kind, collect([diff_root, diff_node]) AS node_root_tuples
-        // order by kind and latest label for each diff_node uuid
-        CALL {
-            WITH node_root_tuples
-            UNWIND node_root_tuples AS nrt
-            WITH nrt[0] AS diff_root, nrt[1] AS diff_node
-            ORDER BY diff_root.from_time DESC
-            RETURN diff_node.label AS latest_node_label
-            LIMIT 1
-        }
-        WITH diff_node_kind, node_root_tuples, latest_node_label
-        ORDER BY diff_node_kind, latest_node_label
+        """
+        self.add_to_query(query=query_group)
+
+        if self.order_by_node_uuid:
+            query_order = """
+            WITH diff_node_uuid, node_root_tuples
+            ORDER BY diff_node_uuid
+            """
+        else:
+            query_order = """
+            // order by kind and latest label for each diff_node uuid
+            CALL {
+                WITH node_root_tuples
+                UNWIND node_root_tuples AS nrt
+                WITH nrt[0] AS diff_root, nrt[1] AS diff_node
+                ORDER BY diff_root.from_time DESC
+                RETURN diff_node.label AS latest_node_label
+                LIMIT 1
+            }
+            WITH diff_node_uuid, diff_node_kind, node_root_tuples, latest_node_label
+            ORDER BY diff_node_kind, latest_node_label
+            """
+        self.add_to_query(query=query_order)
+
+        query_2 = """
         SKIP COALESCE($offset, 0)
         LIMIT $limit
         UNWIND node_root_tuples AS nrt
@@ -31,7 +31,7 @@ class DiffMergeQuery(Query):
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         self.params = {
             "node_diff_dicts": self.node_diff_dicts,
-            "at": self.at.to_string(),
+            "at": self.at.to_graph(),
             "branch_level": self.target_branch.hierarchy_level,
             "target_branch": self.target_branch.name,
             "source_branch": self.source_branch_name,
@@ -279,7 +279,7 @@ class DiffMergePropertiesQuery(Query):
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         self.params = {
             "property_diff_dicts": self.property_diff_dicts,
-            "at": self.at.to_string(),
+            "at": self.at.to_graph(),
             "branch_level": self.target_branch.hierarchy_level,
             "target_branch": self.target_branch.name,
             "source_branch": self.source_branch_name,
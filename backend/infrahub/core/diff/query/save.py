@@ -31,18 +31,16 @@ UNWIND $diff_root_list AS diff_root_map
 WITH diff_root_map
 CALL {
     WITH diff_root_map
-    MERGE (diff_root:DiffRoot {
-        base_branch: diff_root_map.base_branch,
-        diff_branch: diff_root_map.diff_branch,
-        from_time: diff_root_map.from_time,
-        to_time: diff_root_map.to_time,
-        uuid: diff_root_map.uuid,
-        num_added: diff_root_map.num_added,
-        num_updated: diff_root_map.num_updated,
-        num_removed: diff_root_map.num_removed,
-        num_conflicts: diff_root_map.num_conflicts,
-        contains_conflict: diff_root_map.contains_conflict
-    })
+    MERGE (diff_root:DiffRoot {uuid: diff_root_map.uuid})
+    SET diff_root.base_branch = diff_root_map.base_branch
+    SET diff_root.diff_branch = diff_root_map.diff_branch
+    SET diff_root.from_time = diff_root_map.from_time
+    SET diff_root.to_time = diff_root_map.to_time
+    SET diff_root.num_added = diff_root_map.num_added
+    SET diff_root.num_updated = diff_root_map.num_updated
+    SET diff_root.num_removed = diff_root_map.num_removed
+    SET diff_root.num_conflicts = diff_root_map.num_conflicts
+    SET diff_root.contains_conflict = diff_root_map.contains_conflict
     SET diff_root.tracking_id = diff_root_map.tracking_id
     RETURN diff_root
 }
@@ -322,15 +320,26 @@ class EnrichedNodesLinkQuery(Query):
     type = QueryType.WRITE
     insert_return = False
 
-    def __init__(self, enriched_diffs: EnrichedDiffs, **kwargs: Any) -> None:
+    def __init__(
+        self, enriched_diffs: EnrichedDiffs, node_uuids_by_root: dict[str, set[str]] | None = None, **kwargs: Any
+    ) -> None:
         super().__init__(**kwargs)
         self.enriched_diffs = enriched_diffs
+        # only link the nodes that have been (re)created in each root, when provided
+        self.node_uuids_by_root = node_uuids_by_root
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         parent_links_list = []
         for diff_root in (self.enriched_diffs.base_branch_diff, self.enriched_diffs.diff_branch_diff):
             for node in diff_root.nodes:
                 parent_links_list.extend(self._build_node_parent_links(enriched_node=node, root_uuid=diff_root.uuid))
+        if self.node_uuids_by_root is not None:
+            parent_links_list = [
+                link
+                for link in parent_links_list
+                if link["parent_uuid"] in self.node_uuids_by_root.get(link["root_uuid"], set())
+                or link["child_uuid"] in self.node_uuids_by_root.get(link["root_uuid"], set())
+            ]
         self.params = {"node_links_list": parent_links_list}
         query = """
 UNWIND $node_links_list AS node_link_details
@@ -7,15 +7,18 @@ from infrahub.database import InfrahubDatabase, retry_db_transaction
 from infrahub.exceptions import ResourceNotFoundError
 
 from ..model.path import (
+    ConflictedRelationshipElement,
     ConflictSelection,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffRoot,
     EnrichedDiffs,
     EnrichedNodeCreateRequest,
     TimeRange,
     TrackingId,
 )
-from ..query.delete_query import EnrichedDiffDeleteQuery
+from ..query.conflicted_relationships import EnrichedDiffConflictedRelationshipsQuery
+from ..query.delete_query import EnrichedDiffDeleteQuery, EnrichedNodesDeleteQuery
 from ..query.diff_get import EnrichedDiffGetQuery
 from ..query.diff_summary import DiffSummaryCounters, DiffSummaryQuery
 from ..query.empty_roots import EnrichedDiffEmptyRootsQuery
@@ -142,12 +145,46 @@ class DiffRepository:
             raise ResourceNotFoundError(f"Multiple diffs for {error_str}")
         return enriched_diffs[0]
 
+    async def get_node_batch(
+        self,
+        diff_branch_name: str,
+        diff_id: str,
+        limit: int,
+        after_node_uuid: str | None = None,
+    ) -> list[EnrichedDiffNode]:
+        """Nodes of a diff, without their parents, ordered by UUID and starting after after_node_uuid
+
+        Used to go through all the nodes of a diff, one batch at a time
+        """
+        query = await EnrichedDiffGetQuery.init(
+            db=self.db,
+            base_branch_name=registry.default_branch,
+            diff_branch_names=[diff_branch_name],
+            max_depth=config.SETTINGS.database.max_depth_search_hierarchy,
+            limit=limit,
+            diff_ids=[diff_id],
+            order_by_node_uuid=True,
+            after_node_uuid=after_node_uuid,
+        )
+        await query.execute(db=self.db)
+        diff_roots = await self.deserializer.deserialize(database_results=query.get_results(), include_parents=False)
+        if not diff_roots:
+            return []
+        return sorted(diff_roots[0].nodes, key=lambda n: n.uuid)
+
+    async def get_conflicted_relationship_elements(self, diff_id: str) -> list[ConflictedRelationshipElement]:
+        query = await EnrichedDiffConflictedRelationshipsQuery.init(db=self.db, diff_id=diff_id)
+        await query.execute(db=self.db)
+        return list(query.get_conflicted_elements())
+
     def _get_node_create_request_batch(
-        self, enriched_diffs: EnrichedDiffs
+        self, enriched_diffs: EnrichedDiffs, node_uuids_by_root: dict[str, set[str]] | None = None
     ) -> Generator[list[EnrichedNodeCreateRequest], None, None]:
         node_requests = []
         for diff_root in (enriched_diffs.base_branch_diff, enriched_diffs.diff_branch_diff):
             for node in diff_root.nodes:
+                if node_uuids_by_root is not None and node.uuid not in node_uuids_by_root.get(diff_root.uuid, set()):
+                    continue
                 node_requests.append(EnrichedNodeCreateRequest(node=node, root_uuid=diff_root.uuid))
                 if len(node_requests) == self.MAX_SAVE_BATCH_SIZE:
                     yield node_requests
@@ -165,6 +202,62 @@ class DiffRepository:
         link_query = await EnrichedNodesLinkQuery.init(db=self.db, enriched_diffs=enriched_diffs)
         await link_query.execute(db=self.db)
 
+    @staticmethod
+    def _get_changed_node_uuids(
+        diff_root: EnrichedDiffRoot, previous_diff_root: EnrichedDiffRoot
+    ) -> tuple[set[str], set[str]]:
+        """UUIDs of the nodes to save and of the nodes to delete to turn previous_diff_root into diff_root
+
+        A node is equal to its previous version only if its child nodes are equal too, so the ancestors of
+        a changed node are saved again with their updated summary counts and links
+        """
+        previous_nodes_by_uuid: dict[str, EnrichedDiffNode] = {n.uuid: n for n in previous_diff_root.nodes}
+        node_uuids_to_save = {
+            node.uuid
+            for node in diff_root.nodes
+            if node.uuid not in previous_nodes_by_uuid or node != previous_nodes_by_uuid[node.uuid]
+        }
+        node_uuids_to_delete = (set(previous_nodes_by_uuid) - {n.uuid for n in diff_root.nodes}) | (
+            node_uuids_to_save & set(previous_nodes_by_uuid)
+        )
+        return node_uuids_to_save, node_uuids_to_delete
+
+    @retry_db_transaction(name="enriched_diff_update")
+    async def update(self, enriched_diffs: EnrichedDiffs, previous_diffs: EnrichedDiffs) -> None:
+        """Save enriched_diffs in place of previous_diffs, which must be saved with the same root UUIDs
+
+        Only the nodes that differ from the previous diffs are deleted and created again,
+        the other nodes and their fields are kept as they are in the database
+        """
+        node_uuids_to_save: dict[str, set[str]] = {}
+        node_uuids_to_delete: dict[str, set[str]] = {}
+        for diff_root, previous_diff_root in (
+            (enriched_diffs.base_branch_diff, previous_diffs.base_branch_diff),
+            (enriched_diffs.diff_branch_diff, previous_diffs.diff_branch_diff),
+        ):
+            if diff_root.uuid != previous_diff_root.uuid:
+                raise ValueError(f"Diff {diff_root.uuid} cannot replace the diff {previous_diff_root.uuid} in place")
+            node_uuids_to_save[diff_root.uuid], node_uuids_to_delete[diff_root.uuid] = self._get_changed_node_uuids(
+                diff_root=diff_root, previous_diff_root=previous_diff_root
+            )
+
+        root_query = await EnrichedDiffRootsCreateQuery.init(db=self.db, enriched_diffs=enriched_diffs)
+        await root_query.execute(db=self.db)
+        if any(node_uuids_to_delete.values()):
+            delete_query = await EnrichedNodesDeleteQuery.init(db=self.db, node_uuids_by_root=node_uuids_to_delete)
+            await delete_query.execute(db=self.db)
+        if not any(node_uuids_to_save.values()):
+            return
+        for node_create_batch in self._get_node_create_request_batch(
+            enriched_diffs=enriched_diffs, node_uuids_by_root=node_uuids_to_save
+        ):
+            node_query = await EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=node_create_batch)
+            await node_query.execute(db=self.db)
+        link_query = await EnrichedNodesLinkQuery.init(
+            db=self.db, enriched_diffs=enriched_diffs, node_uuids_by_root=node_uuids_to_save
+        )
+        await link_query.execute(db=self.db)
+
     async def summary(
         self,
         base_branch_name: str,
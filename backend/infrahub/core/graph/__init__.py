@@ -1 +1 @@
-GRAPH_VERSION = 16
+GRAPH_VERSION = 18
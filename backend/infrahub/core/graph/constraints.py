@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, ForwardRef, Optional, Union, get_origin
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from infrahub import config
+
 if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
 
@@ -220,6 +222,10 @@ class ConstraintManagerBase:
                     mandatory = False
                 if not item_type or not manager.constraint_rel_class:
                     continue
+                if clean_field_name in ("from", "to") and (
+                    config.SETTINGS.database.temporal_format == config.TemporalFormat.EPOCH_MICROSECONDS
+                ):
+                    item_type = GraphPropertyType.INTEGER
 
                 manager.rels.append(
                     manager.constraint_rel_class(
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from infrahub import config
 from infrahub.database.constants import IndexType
 from infrahub.database.index import IndexItem
 
+# Full-text index on the values of the attributes, used by the search anywhere query
+attr_value_fulltext_index = IndexItem(
+    name="attr_value", label="AttributeValue", properties=["value"], type=IndexType.FULLTEXT
+)
+
 node_indexes: list[IndexItem] = [
     IndexItem(name="node_uuid", label="Node", properties=["uuid"], type=IndexType.RANGE),
     IndexItem(name="node_kind", label="Node", properties=["kind"], type=IndexType.RANGE),
@@ -12,6 +18,26 @@ node_indexes: list[IndexItem] = [
     IndexItem(name="attr_iphost_bin", label="AttributeIPHost", properties=["binary_address"], type=IndexType.RANGE),
     IndexItem(name="rel_uuid", label="Relationship", properties=["uuid"], type=IndexType.RANGE),
     IndexItem(name="rel_identifier", label="Relationship", properties=["name"], type=IndexType.RANGE),
+    attr_value_fulltext_index,
+]
+
+# Range indexes on the time of the relationships when it's stored as a number of microseconds since the epoch,
+# used by the filters on the time of all queries
+temporal_rel_indexes: list[IndexItem] = [
+    IndexItem(name="attr_to", label="HAS_ATTRIBUTE", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="value_to", label="HAS_VALUE", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="part_of_from", label="IS_PART_OF", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="part_of_to", label="IS_PART_OF", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="related_from", label="IS_RELATED", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="related_to", label="IS_RELATED", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="visible_from", label="IS_VISIBLE", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="visible_to", label="IS_VISIBLE", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="protected_from", label="IS_PROTECTED", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="protected_to", label="IS_PROTECTED", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="source_from", label="HAS_SOURCE", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="source_to", label="HAS_SOURCE", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="owner_from", label="HAS_OWNER", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="owner_to", label="HAS_OWNER", properties=["to"], type=IndexType.RANGE),
 ]
 
 rel_indexes: list[IndexItem] = [
@@ -20,3 +46,10 @@ rel_indexes: list[IndexItem] = [
     IndexItem(name="value_from", label="HAS_VALUE", properties=["from"], type=IndexType.RANGE),
     IndexItem(name="value_branch", label="HAS_VALUE", properties=["branch"], type=IndexType.RANGE),
 ]
+
+
+def get_rel_indexes() -> list[IndexItem]:
+    """Return the indexes of the relationships for the temporal format of the graph."""
+    if config.SETTINGS.database.temporal_format == config.TemporalFormat.EPOCH_MICROSECONDS:
+        return rel_indexes + temporal_rel_indexes
+    return rel_indexes
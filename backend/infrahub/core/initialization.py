@@ -25,8 +25,9 @@ from infrahub.core.protocols import CoreAccount
 from infrahub.core.root import Root
 from infrahub.core.schema import SchemaRoot, core_models, internal_schema
 from infrahub.core.schema.manager import SchemaManager
+from infrahub.core.utils import get_temporal_formats
 from infrahub.database import InfrahubDatabase
-from infrahub.exceptions import DatabaseError
+from infrahub.exceptions import DatabaseError, InitializationError
 from infrahub.log import get_logger
 from infrahub.menu.menu import default_menu
 from infrahub.menu.utils import create_menu_children
@@ -131,6 +132,14 @@ async def initialization(db: InfrahubDatabase) -> None:
         log.debug("Checking Root Node")
         await initialize_registry(db=db, initialize=True)
 
+        temporal_formats = await get_temporal_formats(db=db)
+        if temporal_formats - {config.SETTINGS.database.temporal_format}:
+            raise InitializationError(
+                "The times of the graph are stored with the "
+                f"{', '.join(sorted(temporal_format.value for temporal_format in temporal_formats))} format instead of "
+                f"{config.SETTINGS.database.temporal_format.value}, the format can only be converted by the graph migrations"
+            )
+
         # Add Indexes to the database
         if db.manager.index.initialized:
             log.debug("Loading database indexes ..")
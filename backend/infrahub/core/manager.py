@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from functools import reduce
-from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, overload
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, TypeVar, Union, overload
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub.core.constants import BranchSupportType, RelationshipCardinality
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
+    NodeGetListWithAttributesQuery,
     NodeListGetAttributeQuery,
     NodeListGetInfoQuery,
     NodeListGetRelationshipsQuery,
@@ -23,11 +27,14 @@ from infrahub.core.registry import registry
 from infrahub.core.relationship import Relationship
 from infrahub.core.schema import GenericSchema, MainSchemaTypes, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
-from infrahub.exceptions import NodeNotFoundError, ProcessingError, SchemaNotFoundError
+from infrahub.exceptions import NodeNotFoundError, ProcessingError, SchemaNotFoundError, ValidationError
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.constants import RelationshipHierarchyDirection
+    from infrahub.core.constraint.node.runner import NodeConstraintRunner
+    from infrahub.core.query.relationship import RelationshipPeerData
+    from infrahub.core.relationship.model import RelationshipManager
     from infrahub.database import InfrahubDatabase
 
 SchemaProtocol = TypeVar("SchemaProtocol")
@@ -57,9 +64,9 @@ def get_schema(
     db: InfrahubDatabase, branch: Branch, node_schema: type[SchemaProtocol] | MainSchemaTypes | str
 ) -> MainSchemaTypes:
     if isinstance(node_schema, str):
-        return db.schema.get(name=node_schema, branch=branch.name)
+        return db.schema.get(name=node_schema, branch=branch.name, duplicate=False)
     if hasattr(node_schema, "_is_runtime_protocol") and getattr(node_schema, "_is_runtime_protocol"):
-        return db.schema.get(name=node_schema.__name__, branch=branch.name)
+        return db.schema.get(name=node_schema.__name__, branch=branch.name, duplicate=False)
     if not isinstance(node_schema, (MainSchemaTypes)):
         raise ValueError(f"Invalid schema provided {node_schema}")
 
@@ -139,6 +146,8 @@ class NodeManager:
         account=...,
         partial_match: bool = ...,
         branch_agnostic: bool = ...,
+        node_property_map: dict[str, Node] | None = ...,
+        single_query: bool = ...,
     ) -> list[Any]: ...
 
     @overload
@@ -159,6 +168,8 @@ class NodeManager:
         account=...,
         partial_match: bool = ...,
         branch_agnostic: bool = ...,
+        node_property_map: dict[str, Node] | None = ...,
+        single_query: bool = ...,
     ) -> list[SchemaProtocol]: ...
 
     @classmethod
@@ -178,6 +189,8 @@ class NodeManager:
         account=None,
         partial_match: bool = False,
         branch_agnostic: bool = False,
+        node_property_map: dict[str, Node] | None = None,
+        single_query: bool = False,
     ) -> list[Any]:
         """Query one or multiple nodes of a given type based on filter arguments.
 
@@ -188,6 +201,8 @@ class NodeManager:
             limit (int, optional): Maximum numbers of nodes to return. Defaults to 100.
             at (Timestamp or Str, optional): Timestamp for the query. Defaults to None.
             branch (Branch or Str, optional): Branch to query. Defaults to None.
+            node_property_map (dict, optional): Nodes already loaded, indexed by ID, to reuse as source or owner of the attributes.
+            single_query (bool, optional): Filter, paginate and load the attributes of the nodes in a single query. Defaults to False.
 
         Returns:
             list[Node]: List of Node object
@@ -214,6 +229,31 @@ class NodeManager:
             )
             return [node] if node else []
 
+        fields = cls._add_fields_for_display_label_and_hfid(
+            db=db, node_schema=node_schema, branch=branch, fields=fields
+        )
+
+        if single_query:
+            nodes, _ = await cls._query_nodes_with_attributes(
+                db=db,
+                node_schema=node_schema,
+                filters=filters,
+                fields=fields,
+                offset=offset,
+                limit=limit,
+                at=at,
+                branch=branch,
+                include_source=include_source,
+                include_owner=include_owner,
+                prefetch_relationships=prefetch_relationships,
+                account=account,
+                partial_match=partial_match,
+                branch_agnostic=branch_agnostic,
+                node_property_map=node_property_map,
+                include_count=False,
+            )
+            return nodes
+
         # Query the list of nodes matching this Query
         query = await NodeGetListQuery.init(
             db=db,
@@ -229,18 +269,6 @@ class NodeManager:
         await query.execute(db=db)
         node_ids = query.get_node_ids()
 
-        # if display_label or hfid has been requested we need to ensure we are querying the right fields
-        if fields and "display_label" in fields:
-            schema_branch = db.schema.get_schema_branch(name=branch.name)
-            display_label_fields = schema_branch.generate_fields_for_display_label(name=node_schema.kind)
-            if display_label_fields:
-                fields = deep_merge_dict(dicta=fields, dictb=display_label_fields)
-
-        if fields and "hfid" in fields and node_schema.human_friendly_id:
-            hfid_fields = node_schema.generate_fields_for_hfid()
-            if hfid_fields:
-                fields = deep_merge_dict(dicta=fields, dictb=hfid_fields)
-
         response = await cls.get_many(
             ids=node_ids,
             fields=fields,
@@ -252,10 +280,181 @@ class NodeManager:
             db=db,
             prefetch_relationships=prefetch_relationships,
             branch_agnostic=branch_agnostic,
+            node_property_map=node_property_map,
         )
 
+        if fields and "hfid" in fields:
+            await cls.prefetch_hfid_peers(db=db, nodes=response.values(), branch=branch, at=at)
+
         return list(response.values()) if node_ids else []
 
+    @classmethod
+    async def query_with_count(
+        cls,
+        db: InfrahubDatabase,
+        schema: type[SchemaProtocol] | MainSchemaTypes | str,
+        filters: dict | None = None,
+        fields: dict | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        at: Union[Timestamp, str] | None = None,
+        branch: Union[Branch, str] | None = None,
+        include_source: bool = False,
+        include_owner: bool = False,
+        prefetch_relationships: bool = False,
+        account=None,
+        partial_match: bool = False,
+        branch_agnostic: bool = False,
+        node_property_map: dict[str, Node] | None = None,
+    ) -> tuple[list[Any], int]:
+        """Query a page of nodes of a given type and the total number of nodes matching the filters, in a single query.
+
+        The arguments are the same as for `query`, the result is equivalent to calling `query` and `count`.
+
+        Returns:
+            tuple[list[Node], int]: List of Node object and total number of nodes matching the filters
+        """
+
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+
+        if filters and "hfid" in filters:
+            nodes = await cls.query(
+                db=db,
+                schema=schema,
+                filters=filters,
+                fields=fields,
+                at=at,
+                branch=branch,
+                include_source=include_source,
+                include_owner=include_owner,
+                prefetch_relationships=prefetch_relationships,
+                account=account,
+                branch_agnostic=branch_agnostic,
+            )
+            return nodes, len(nodes)
+
+        node_schema = get_schema(db=db, branch=branch, node_schema=schema)
+        fields = cls._add_fields_for_display_label_and_hfid(
+            db=db, node_schema=node_schema, branch=branch, fields=fields
+        )
+
+        nodes, total_count = await cls._query_nodes_with_attributes(
+            db=db,
+            node_schema=node_schema,
+            filters=filters,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            partial_match=partial_match,
+            branch_agnostic=branch_agnostic,
+            node_property_map=node_property_map,
+            include_count=True,
+        )
+
+        if total_count is None:
+            # No node in the requested page, the total can still be greater than zero if the offset is past the last node
+            total_count = 0
+            if offset:
+                total_count = await cls.count(
+                    db=db,
+                    schema=node_schema,
+                    filters=filters,
+                    at=at,
+                    branch=branch,
+                    partial_match=partial_match,
+                    branch_agnostic=branch_agnostic,
+                )
+
+        return nodes, total_count
+
+    @classmethod
+    async def _query_nodes_with_attributes(
+        cls,
+        db: InfrahubDatabase,
+        node_schema: MainSchemaTypes,
+        filters: dict | None,
+        fields: dict | None,
+        offset: int | None,
+        limit: int | None,
+        at: Timestamp,
+        branch: Branch,
+        include_source: bool,
+        include_owner: bool,
+        prefetch_relationships: bool,
+        account,
+        partial_match: bool,
+        branch_agnostic: bool,
+        node_property_map: dict[str, Node] | None,
+        include_count: bool,
+    ) -> tuple[list[Any], Optional[int]]:
+        query = await NodeGetListWithAttributesQuery.init(
+            db=db,
+            schema=node_schema,
+            branch=branch,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            fields=fields,
+            include_source=include_source,
+            include_owner=include_owner,
+            include_count=include_count,
+            at=at,
+            partial_match=partial_match,
+            branch_agnostic=branch_agnostic,
+        )
+        await query.execute(db=db)
+        node_ids = query.get_node_ids()
+        if not node_ids:
+            return [], query.get_total_count()
+
+        nodes_info_by_id: dict[str, NodeToProcess] = {node.node_uuid: node async for node in query.get_nodes(db=db)}
+        response = await cls._build_nodes(
+            db=db,
+            ids=node_ids,
+            nodes_info_by_id=nodes_info_by_id,
+            profile_ids_by_node_id=query.get_profile_ids_by_node_id(),
+            fields=fields,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            branch_agnostic=branch_agnostic,
+            node_property_map=node_property_map,
+            prefetched_attributes=query.get_attributes_group_by_node(),
+        )
+
+        if fields and "hfid" in fields:
+            await cls.prefetch_hfid_peers(db=db, nodes=response.values(), branch=branch, at=at)
+
+        return list(response.values()), query.get_total_count()
+
+    @staticmethod
+    def _add_fields_for_display_label_and_hfid(
+        db: InfrahubDatabase, node_schema: MainSchemaTypes, branch: Branch, fields: dict | None
+    ) -> dict | None:
+        """If display_label or hfid has been requested we need to ensure we are querying the right fields."""
+        if fields and "display_label" in fields:
+            schema_branch = db.schema.get_schema_branch(name=branch.name)
+            display_label_fields = schema_branch.generate_fields_for_display_label(name=node_schema.kind)
+            if display_label_fields:
+                fields = deep_merge_dict(dicta=fields, dictb=display_label_fields)
+
+        if fields and "hfid" in fields and node_schema.human_friendly_id:
+            hfid_fields = node_schema.generate_fields_for_hfid()
+            if hfid_fields:
+                fields = deep_merge_dict(dicta=fields, dictb=hfid_fields)
+
+        return fields
+
     @classmethod
     async def count(
         cls,
@@ -340,6 +539,9 @@ class NodeManager:
         branch: Optional[Union[Branch, str]] = None,
         branch_agnostic: bool = False,
         fetch_peers: bool = False,
+        include_source: bool = False,
+        include_owner: bool = False,
+        node_property_map: Optional[dict[str, Node]] = None,
     ) -> list[Relationship]:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
@@ -381,8 +583,18 @@ class NodeManager:
         if fetch_peers:
             peer_ids = [peer.peer_id for peer in peers_info]
             peer_nodes = await cls.get_many(
-                db=db, ids=peer_ids, fields=fields, at=at, branch=branch, branch_agnostic=branch_agnostic
+                db=db,
+                ids=peer_ids,
+                fields=fields,
+                at=at,
+                branch=branch,
+                branch_agnostic=branch_agnostic,
+                include_source=include_source,
+                include_owner=include_owner,
+                node_property_map=node_property_map,
             )
+            if fields and "hfid" in fields:
+                await cls.prefetch_hfid_peers(db=db, nodes=peer_nodes.values(), branch=branch, at=at)
 
         results = []
         for peer in peers_info:
@@ -399,6 +611,79 @@ class NodeManager:
 
         return results
 
+    @classmethod
+    async def prefetch_hfid_peers(
+        cls,
+        db: InfrahubDatabase,
+        nodes: Iterable[Node],
+        branch: Branch,
+        at: Optional[Union[Timestamp, str]] = None,
+    ) -> None:
+        """Load the peers of the relationships used in the human friendly id of the nodes, for all the nodes at once.
+
+        The relationships and their peers are assigned to the relationship managers of the nodes,
+        the human friendly id of these nodes can then be computed without querying the database again.
+        Relationships already fetched are left untouched.
+        """
+        at = Timestamp(at)
+        schema_branch = db.schema.get_schema_branch(name=branch.name)
+
+        relationships_per_kind: dict[str, list[RelationshipSchema]] = {}
+        nodes_per_relationship: dict[tuple[str, str], dict[str, Node]] = defaultdict(dict)
+        relationship_schemas: dict[tuple[str, str], RelationshipSchema] = {}
+        for node in nodes:
+            node_schema = node.get_schema()
+            if node_schema.kind not in relationships_per_kind:
+                relationships_per_kind[node_schema.kind] = []
+                for item in node_schema.human_friendly_id or []:
+                    schema_path = node_schema.parse_schema_path(path=item, schema=schema_branch)
+                    if (
+                        schema_path.is_type_relationship
+                        and schema_path.relationship_schema
+                        and schema_path.relationship_schema.cardinality == RelationshipCardinality.ONE
+                    ):
+                        relationships_per_kind[node_schema.kind].append(schema_path.relationship_schema)
+
+            for rel_schema in relationships_per_kind[node_schema.kind]:
+                if getattr(node, rel_schema.name).has_fetched_relationships:
+                    continue
+                key = (node_schema.kind, rel_schema.name)
+                nodes_per_relationship[key][node.get_id()] = node
+                relationship_schemas[key] = rel_schema
+
+        for key, nodes_by_id in nodes_per_relationship.items():
+            rel_schema = relationship_schemas[key]
+            branch_agnostic = rel_schema.branch is BranchSupportType.AGNOSTIC
+            query = await RelationshipGetPeerQuery.init(
+                db=db,
+                source_ids=list(nodes_by_id.keys()),
+                source_kind=key[0],
+                schema=rel_schema,
+                filters={},
+                rel=Relationship(schema=rel_schema, branch=branch, node_id="PLACEHOLDER"),
+                at=at,
+                branch_agnostic=branch_agnostic,
+            )
+            await query.execute(db=db)
+
+            peers_per_node: dict[str, list[RelationshipPeerData]] = defaultdict(list)
+            for peer_data in query.get_peers():
+                peers_per_node[peer_data.source_id].append(peer_data)
+
+            peer_ids = {peer_data.peer_id for node_peers in peers_per_node.values() for peer_data in node_peers}
+            peers = await cls.get_many(db=db, ids=list(peer_ids), at=at, branch=branch, branch_agnostic=branch_agnostic)
+
+            for node_id, node in nodes_by_id.items():
+                relm: RelationshipManager = getattr(node, rel_schema.name)
+                for peer_data in peers_per_node.get(node_id, []):
+                    rel = await Relationship(schema=rel_schema, branch=relm.branch, at=relm.at, node=node).load(
+                        db=db, data=peer_data
+                    )
+                    if peer_data.peer_id in peers:
+                        await rel.set_peer(value=peers[peer_data.peer_id])
+                    relm._relationships.append(rel)
+                relm.has_fetched_relationships = True
+
     @classmethod
     async def count_hierarchy(
         cls,
@@ -1076,7 +1361,7 @@ class NodeManager:
         return node
 
     @classmethod
-    async def get_many(  # pylint: disable=too-many-branches,too-many-statements
+    async def get_many(
         cls,
         db: InfrahubDatabase,
         ids: list[str],
@@ -1088,8 +1373,14 @@ class NodeManager:
         prefetch_relationships: bool = False,
         account=None,
         branch_agnostic: bool = False,
+        node_property_map: Optional[dict[str, Node]] = None,
     ) -> dict[str, Node]:
-        """Return a list of nodes based on their IDs."""
+        """Return a list of nodes based on their IDs.
+
+        When include_source or include_owner are enabled and the source or the owner of some attributes are requested
+        in the fields, the nodes referenced by these attributes are all loaded together and assigned to the attributes.
+        `node_property_map` can be provided to share these nodes between multiple calls, each node is only loaded once.
+        """
 
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
@@ -1098,9 +1389,48 @@ class NodeManager:
         query = await NodeListGetInfoQuery.init(
             db=db, ids=ids, branch=branch, account=account, at=at, branch_agnostic=branch_agnostic
         )
-        await query.execute(db=db)
+        await query.execute_group_by(("n", "uuid"), db=db)
         nodes_info_by_id: dict[str, NodeToProcess] = {node.node_uuid: node async for node in query.get_nodes(db=db)}
-        profile_ids_by_node_id = query.get_profile_ids_by_node_id()
+
+        return await cls._build_nodes(
+            db=db,
+            ids=ids,
+            nodes_info_by_id=nodes_info_by_id,
+            profile_ids_by_node_id=query.get_profile_ids_by_node_id(),
+            fields=fields,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            branch_agnostic=branch_agnostic,
+            node_property_map=node_property_map,
+        )
+
+    @classmethod
+    async def _build_nodes(  # pylint: disable=too-many-branches,too-many-statements
+        cls,
+        db: InfrahubDatabase,
+        ids: list[str],
+        nodes_info_by_id: dict[str, NodeToProcess],
+        profile_ids_by_node_id: dict[str, list[str]],
+        fields: Optional[dict],
+        at: Timestamp,
+        branch: Branch,
+        include_source: bool,
+        include_owner: bool,
+        prefetch_relationships: bool,
+        account=None,
+        branch_agnostic: bool = False,
+        node_property_map: Optional[dict[str, Node]] = None,
+        prefetched_attributes: Optional[dict[str, NodeAttributesFromDB]] = None,
+    ) -> dict[str, Node]:
+        """Load the attributes, the profiles and the relationships of some nodes already queried and build them.
+
+        `prefetched_attributes` can be provided when the attributes of the nodes have already been queried,
+        in this case only the attributes of the profiles are queried.
+        """
         all_profile_ids = reduce(
             lambda all_ids, these_ids: all_ids | set(these_ids), profile_ids_by_node_id.values(), set()
         )
@@ -1112,19 +1442,26 @@ class NodeManager:
                 fields["profile_priority"]["value"] = None
 
         # Query list of all Attributes
-        query = await NodeListGetAttributeQuery.init(
-            db=db,
-            ids=list(nodes_info_by_id.keys()) + list(all_profile_ids),
-            fields=fields,
-            branch=branch,
-            include_source=include_source,
-            include_owner=include_owner,
-            account=account,
-            at=at,
-            branch_agnostic=branch_agnostic,
+        ids_to_query = (
+            list(all_profile_ids)
+            if prefetched_attributes is not None
+            else list(nodes_info_by_id.keys()) + list(all_profile_ids)
         )
-        await query.execute(db=db)
-        all_node_attributes = query.get_attributes_group_by_node()
+        all_node_attributes: dict[str, NodeAttributesFromDB] = dict(prefetched_attributes or {})
+        if ids_to_query:
+            query = await NodeListGetAttributeQuery.init(
+                db=db,
+                ids=ids_to_query,
+                fields=fields,
+                branch=branch,
+                include_source=include_source,
+                include_owner=include_owner,
+                account=account,
+                at=at,
+                branch_agnostic=branch_agnostic,
+            )
+            await query.execute_group_by(("n", "uuid"), ("a", "name"), db=db)
+            all_node_attributes.update(query.get_attributes_group_by_node())
         profile_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         node_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         for node_id, attribute_dict in all_node_attributes.items():
@@ -1136,6 +1473,23 @@ class NodeManager:
             profile_attributes_id_map=profile_attributes, profile_ids_by_node_id=profile_ids_by_node_id
         )
 
+        node_properties = cls._get_node_properties_to_prefetch(
+            fields=fields, include_source=include_source, include_owner=include_owner
+        )
+        if node_properties:
+            if node_property_map is None:
+                node_property_map = {}
+            await cls._prefetch_node_properties(
+                db=db,
+                attributes=all_node_attributes.values(),
+                node_properties=node_properties,
+                node_property_map=node_property_map,
+                at=at,
+                branch=branch,
+                account=account,
+                branch_agnostic=branch_agnostic,
+            )
+
         # if prefetch_relationships is enabled
         # Query all the peers associated with all nodes at once.
         peers_per_node = None
@@ -1144,7 +1498,7 @@ class NodeManager:
             query = await NodeListGetRelationshipsQuery.init(
                 db=db, ids=ids, branch=branch, at=at, branch_agnostic=branch_agnostic
             )
-            await query.execute(db=db)
+            await query.execute_group_by(("n", "uuid"), ("rel", "name"), ("peer", "uuid"), db=db)
             peers_per_node = query.get_peers_group_by_node()
             peer_ids = []
 
@@ -1160,6 +1514,7 @@ class NodeManager:
                 db=db,
                 include_owner=include_owner,
                 include_source=include_source,
+                node_property_map=node_property_map,
             )
 
         nodes = {}
@@ -1207,11 +1562,185 @@ class NodeManager:
             node_branch = await registry.get_branch(db=db, branch=node.branch)
             item = await node_class.init(schema=node.schema, branch=node_branch, at=at, db=db)
             await item.load(**new_node_data_with_profile_overrides, db=db)
+            if node_properties and node_property_map:
+                cls._assign_node_properties(
+                    node=item, node_properties=node_properties, node_property_map=node_property_map
+                )
 
             nodes[node_id] = item
 
         return nodes
 
+    @staticmethod
+    def _get_node_properties_to_prefetch(
+        fields: Optional[dict], include_source: bool, include_owner: bool
+    ) -> dict[str, list[str]]:
+        """Return the node properties explicitly requested in the fields, indexed by attribute name.
+
+        Without fields, the source and the owner are not prefetched and are still loaded on demand.
+        """
+        if not fields:
+            return {}
+
+        node_properties = []
+        if include_source:
+            node_properties.append("source")
+        if include_owner:
+            node_properties.append("owner")
+
+        properties_per_attribute: dict[str, list[str]] = {}
+        for field_name, field in fields.items():
+            if not isinstance(field, dict):
+                continue
+            requested_properties = [node_property for node_property in node_properties if node_property in field]
+            if requested_properties:
+                properties_per_attribute[field_name] = requested_properties
+        return properties_per_attribute
+
+    @classmethod
+    async def _prefetch_node_properties(
+        cls,
+        db: InfrahubDatabase,
+        attributes: Iterable[NodeAttributesFromDB],
+        node_properties: dict[str, list[str]],
+        node_property_map: dict[str, Node],
+        at: Timestamp,
+        branch: Branch,
+        account=None,
+        branch_agnostic: bool = False,
+    ) -> None:
+        """Load all the nodes referenced by the node properties of the attributes and not present in node_property_map yet."""
+        ids_to_fetch: set[str] = set()
+        for node_attributes in attributes:
+            for attribute_name, attribute in node_attributes.attrs.items():
+                for node_property in node_properties.get(attribute_name, []):
+                    if node_property not in attribute.node_properties:
+                        continue
+                    peer_id = attribute.node_properties[node_property].uuid
+                    if peer_id not in node_property_map:
+                        ids_to_fetch.add(peer_id)
+
+        if not ids_to_fetch:
+            return
+
+        peers = await cls.get_many(
+            db=db, ids=list(ids_to_fetch), at=at, branch=branch, account=account, branch_agnostic=branch_agnostic
+        )
+        node_property_map.update(peers)
+
+    @staticmethod
+    def _assign_node_properties(
+        node: Node, node_properties: dict[str, list[str]], node_property_map: dict[str, Node]
+    ) -> None:
+        for attribute_name, attribute_properties in node_properties.items():
+            if attribute_name not in node._attributes:
+                continue
+            attribute = getattr(node, attribute_name)
+            for node_property in attribute_properties:
+                peer_id = getattr(attribute, f"{node_property}_id")
+                if peer_id and peer_id in node_property_map:
+                    setattr(attribute, node_property, node_property_map[peer_id])
+
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        schema: Union[NodeSchema, str],
+        data: list[dict[str, Any]],
+        branch: Optional[Union[Branch, str]] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+        batch_size: int = 1000,
+        node_constraint_runner: Optional[NodeConstraintRunner] = None,
+    ) -> list[Node]:
+        """Create multiple nodes of the same kind.
+
+        All the nodes are initialized and validated in memory before anything is written to the database,
+        the nodes are then created by chunks of `batch_size` nodes, with one query and one transaction per chunk.
+        """
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+        node_schema = get_schema(db=db, branch=branch, node_schema=schema)
+        if not isinstance(node_schema, NodeSchema):
+            raise ValueError(f"Only nodes can be created in bulk, {node_schema.kind} is a {type(node_schema).__name__}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+
+        node_class = registry.node.get(node_schema.kind, Node)
+        nodes: list[Node] = []
+        for item in data:
+            node = await node_class.init(db=db, schema=node_schema, branch=branch, at=at)
+            await node.new(db=db, **item)
+            await node.resolve_relationships(db=db)
+            if node_constraint_runner:
+                await node_constraint_runner.check(node=node, field_filters=list(item))
+            nodes.append(node)
+
+        cls._check_batch_uniqueness(db=db, branch=branch, node_schema=node_schema, nodes=nodes)
+
+        # The nodes of a chunk are all created on the same branch, the global branch for the branch agnostic nodes
+        nodes_per_branch: dict[str, list[Node]] = defaultdict(list)
+        for node in nodes:
+            nodes_per_branch[node.get_branch_based_on_support_type().name].append(node)
+
+        for branch_nodes in nodes_per_branch.values():
+            for idx in range(0, len(branch_nodes), batch_size):
+                chunk = branch_nodes[idx : idx + batch_size]
+                if db.is_transaction:
+                    await cls._create_chunk(db=db, nodes=chunk, at=at)
+                    continue
+                async with db.start_transaction() as dbt:
+                    await cls._create_chunk(db=dbt, nodes=chunk, at=at)
+
+        return nodes
+
+    @staticmethod
+    async def _create_chunk(db: InfrahubDatabase, nodes: list[Node], at: Timestamp) -> None:
+        query = await NodeCreateManyQuery.init(
+            db=db, nodes=nodes, branch=nodes[0].get_branch_based_on_support_type(), at=at
+        )
+        await query.execute(db=db)
+        ids_per_node = query.get_ids_per_node()
+        for node in nodes:
+            db_id, new_ids = ids_per_node[node.get_id()]
+            node._set_created(db_id=db_id, new_ids=new_ids, at=at)
+
+    @staticmethod
+    def _check_batch_uniqueness(
+        db: InfrahubDatabase, branch: Branch, node_schema: NodeSchema, nodes: list[Node]
+    ) -> None:
+        """Raise a ValidationError if multiple nodes of the batch share the values of a uniqueness constraint.
+
+        The constraints against the nodes already present in the database are validated by the NodeConstraintRunner.
+        """
+        schema_branch = db.schema.get_schema_branch(name=branch.name)
+        path_groups = node_schema.get_unique_constraint_schema_attribute_paths(
+            schema_branch=schema_branch, include_unique_attributes=True
+        )
+        for path_group in path_groups:
+            field_names = [
+                path.relationship_schema.name if path.relationship_schema else path.attribute_schema.name
+                for path in path_group
+                if path.relationship_schema or path.attribute_schema
+            ]
+            seen: set[tuple[Any, ...]] = set()
+            for node in nodes:
+                values: list[Any] = []
+                for path in path_group:
+                    if path.relationship_schema:
+                        relationships = getattr(node, path.relationship_schema.name)._relationships
+                        values.append(relationships[0].peer_id if relationships else None)
+                    elif path.attribute_schema:
+                        attribute = getattr(node, path.attribute_schema.name)
+                        value = getattr(attribute, path.attribute_property_name or "value")
+                        values.append(value.value if attribute.is_enum and value is not None else value)
+                if any(value is None for value in values):
+                    continue
+                key = tuple(values)
+                if key in seen:
+                    error_msg = f"Violates uniqueness constraint '{'-'.join(field_names)}'"
+                    raise ValidationError([ValidationError({field_name: error_msg}) for field_name in field_names])
+                seen.add(key)
+
     @classmethod
     async def delete(
         cls,
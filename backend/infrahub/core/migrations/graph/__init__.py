@@ -18,6 +18,8 @@ from .m013_convert_git_password_credential import Migration013
 from .m014_remove_index_attr_value import Migration014
 from .m015_diff_format_update import Migration015
 from .m016_diff_delete_bug_fix import Migration016
+from .m017_convert_temporal_format import Migration017
+from .m018_add_attr_value_fulltext_index import Migration018
 
 if TYPE_CHECKING:
     from infrahub.core.root import Root
@@ -41,6 +43,8 @@ MIGRATIONS: list[type[Union[GraphMigration, InternalSchemaMigration, ArbitraryMi
     Migration014,
     Migration015,
     Migration016,
+    Migration017,
+    Migration018,
 ]
 
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from pydantic import Field
+
+from infrahub import config
+from infrahub.config import TemporalFormat
+from infrahub.core.graph.index import temporal_rel_indexes
+from infrahub.core.migrations.shared import MigrationResult
+from infrahub.core.query import Query, QueryType
+from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import count_relationships_with_temporal_format, get_temporal_format_filter
+
+from ..shared import GraphMigration
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+
+class Migration017GetRelationshipTimesQuery(Query):
+    """Return the next batch of relationships with a time stored as a string."""
+
+    name = "migration_017_get_relationship_times"
+    type: QueryType = QueryType.READ
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
+        query = """
+        MATCH ()-[r]->()
+        WHERE %(from_filter)s OR %(to_filter)s
+        """ % {
+            "from_filter": get_temporal_format_filter(db=db, value="r.from", temporal_format=TemporalFormat.ISO8601),
+            "to_filter": get_temporal_format_filter(db=db, value="r.to", temporal_format=TemporalFormat.ISO8601),
+        }
+        self.add_to_query(query)
+        self.return_labels = [f"{db.get_id_function_name()}(r) AS rel_id", "r.from AS from_time", "r.to AS to_time"]
+
+
+class Migration017SetRelationshipTimesQuery(Query):
+    name = "migration_017_set_relationship_times"
+    type: QueryType = QueryType.WRITE
+    insert_return = False
+
+    def __init__(self, rel_times: list[dict[str, Any]], **kwargs: Any):
+        self.rel_times = rel_times
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
+        query = """
+        UNWIND $rel_times AS rel_time
+        MATCH ()-[r]->()
+        WHERE %(id_func)s(r) = rel_time.rel_id
+        SET r.from = rel_time.from_time, r.to = rel_time.to_time
+        """ % {"id_func": db.get_id_function_name()}
+        self.add_to_query(query)
+        self.params["rel_times"] = self.rel_times
+
+
+def convert_time(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    return Timestamp(value).to_epoch_microseconds()
+
+
+class Migration017(GraphMigration):
+    """Convert the from and to properties of all the relationships to the temporal format of the migration.
+
+    The relationships still storing a string are converted in batches, each batch in its own transaction,
+    until none is left, an interrupted conversion is resumed by executing the migration again.
+    With the epoch format, the times are indexed with range indexes to be used by the filters on the time of the queries.
+    Nothing is changed with the default ISO8601 format.
+    """
+
+    name: str = "017_convert_temporal_format"
+    queries: Sequence[type[Query]] = []
+    minimum_version: int = 16
+    temporal_format: TemporalFormat = Field(
+        default=TemporalFormat.ISO8601, description="Format to convert the times of the relationships to"
+    )
+
+    async def execute(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+
+        if self.temporal_format == TemporalFormat.ISO8601:
+            return result
+
+        try:
+            while True:
+                async with db.start_transaction() as ts:
+                    query = await Migration017GetRelationshipTimesQuery.init(
+                        db=ts, limit=config.SETTINGS.database.query_size_limit
+                    )
+                    await query.execute(db=ts)
+                    rel_times = [
+                        {
+                            "rel_id": query_result.get("rel_id"),
+                            "from_time": convert_time(query_result.get("from_time")),
+                            "to_time": convert_time(query_result.get("to_time")),
+                        }
+                        for query_result in query.get_results()
+                    ]
+                    if not rel_times:
+                        break
+                    update_query = await Migration017SetRelationshipTimesQuery.init(db=ts, rel_times=rel_times)
+                    await update_query.execute(db=ts)
+                result.nbr_migrations_executed += len(rel_times)
+
+            async with db.start_transaction() as ts:
+                ts.manager.index.init(nodes=[], rels=temporal_rel_indexes)
+                await ts.manager.index.add()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result.errors.append(str(exc))
+
+        return result
+
+    async def validate_migration(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+
+        for temporal_format in TemporalFormat:
+            if temporal_format == self.temporal_format:
+                continue
+            if await count_relationships_with_temporal_format(db=db, temporal_format=temporal_format, limit=1):
+                result.errors.append(
+                    f"Some relationships still have a time stored with the {temporal_format.value} format "
+                    f"instead of {self.temporal_format.value}"
+                )
+
+        return result
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from infrahub.core.graph.index import attr_value_fulltext_index
+from infrahub.core.migrations.shared import MigrationResult
+from infrahub.core.query import Query  # noqa: TCH001
+from infrahub.database import DatabaseType
+
+from ..shared import GraphMigration
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+
+class Migration018(GraphMigration):
+    name: str = "018_add_attr_value_fulltext_index"
+    queries: Sequence[type[Query]] = []
+    minimum_version: int = 17
+
+    async def execute(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+
+        # Only execute this migration for Neo4j
+        if db.db_type != DatabaseType.NEO4J:
+            return result
+
+        async with db.start_transaction() as ts:
+            try:
+                ts.manager.index.init(nodes=[attr_value_fulltext_index], rels=[])
+                await ts.manager.index.add()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                result.errors.append(str(exc))
+                return result
+
+        return result
+
+    async def validate_migration(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+        return result
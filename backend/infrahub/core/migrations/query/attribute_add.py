@@ -47,7 +47,7 @@ class AttributeAddQuery(Query):
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         self.params["is_protected_default"] = False
@@ -86,21 +86,21 @@ class AttributeRenameQuery(Query):
         self.params["new_attr"] = self.new_attr.model_dump()
         self.params["prev_attr"] = self.previous_attr.model_dump()
 
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props_create"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         self.params["rel_props_delete"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         sub_queries_create = [
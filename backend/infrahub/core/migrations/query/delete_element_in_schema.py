@@ -97,14 +97,14 @@ class DeleteElementInSchemaQuery(Query):
         self.params["node_name"] = self.node_name
         self.params["node_namespace"] = self.node_namespace
 
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props_prev"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         sub_query_out = self._render_sub_query_out()
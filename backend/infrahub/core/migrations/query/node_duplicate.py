@@ -95,7 +95,7 @@ class NodeDuplicateQuery(Query):
         self.params["new_node"] = self.new_node.model_dump()
         self.params["previous_node"] = self.previous_node.model_dump()
 
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.new_node.branch_support
 
@@ -103,14 +103,14 @@ class NodeDuplicateQuery(Query):
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         self.params["rel_props_prev"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         sub_query_out = self._render_sub_query_out()
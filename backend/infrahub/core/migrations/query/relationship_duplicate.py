@@ -90,7 +90,7 @@ class RelationshipDuplicateQuery(Query):
         self.params["new_rel"] = self.new_rel.model_dump()
         self.params["previous_rel"] = self.previous_rel.model_dump()
 
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.new_rel.branch_support
 
@@ -98,14 +98,14 @@ class RelationshipDuplicateQuery(Query):
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         self.params["rel_props_prev"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         sub_query_out = self._render_sub_query_out()
@@ -24,7 +24,7 @@ class NodeAttributeRemoveMigrationQuery01(AttributeMigrationQuery):
 
         self.params["node_kind"] = self.migration.new_schema.kind
         self.params["attr_name"] = self.migration.schema_path.field_name
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.migration.previous_attribute_schema.get_branch().value
 
@@ -32,7 +32,7 @@ class NodeAttributeRemoveMigrationQuery01(AttributeMigrationQuery):
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         def render_sub_query_per_rel_type(rel_type: str, rel_def: FieldInfo) -> str:
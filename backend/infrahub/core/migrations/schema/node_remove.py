@@ -37,14 +37,14 @@ class NodeRemoveMigrationBaseQuery(MigrationQuery):
         self.params.update(branch_params)
 
         self.params["node_kind"] = self.migration.previous_schema.kind
-        self.params["current_time"] = self.at.to_string()
+        self.params["current_time"] = self.at.to_graph()
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props"] = {
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
 
         node_remove_query = self.render_node_remove_query(branch_filter=branch_filter)
@@ -315,10 +315,52 @@ class HashableModel(BaseModel):
 
     _exclude_from_hash: list[str] = []
     _sort_by: list[str] = []
+    _frozen: bool = False
 
     def __hash__(self) -> int:
         return hash(self.get_hash())
 
+    def __eq__(self, other: object) -> bool:
+        # The frozen flag is an implementation detail of the schema cache, it must not influence the comparison
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            self.__class__ is other.__class__
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and self.is_frozen:
+            raise TypeError(
+                f"{self.__class__.__name__} is frozen and can't be modified, use duplicate() to get a copy that can be updated"
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def is_frozen(self) -> bool:
+        private = getattr(self, "__pydantic_private__", None)
+        return bool(private and private.get("_frozen"))
+
+    def freeze(self) -> Self:
+        """Mark the object and all its nested HashableModel as read-only.
+
+        A frozen object can be shared safely between multiple readers, a copy must be created with duplicate() to modify it.
+        """
+        self._set_frozen(value=True)
+        return self
+
+    def _set_frozen(self, value: bool) -> None:
+        for field_name in self.model_fields.keys():
+            field_value = getattr(self, field_name)
+            if isinstance(field_value, HashableModel):
+                field_value._set_frozen(value=value)
+            elif isinstance(field_value, list):
+                for item in field_value:
+                    if isinstance(item, HashableModel):
+                        item._set_frozen(value=value)
+        self._frozen = value
+
     def get_hash(self, display_values: bool = False) -> str:
         """Generate a hash for the object.
 
@@ -404,8 +446,14 @@ class HashableModel(BaseModel):
         return tuple(self_sort_keys) >= tuple(other_sort_keys)
 
     def duplicate(self) -> Self:
-        """Duplicate the current object by doing a deep copy of everything and recreating a new object."""
-        return self.model_copy(deep=True)
+        """Duplicate the current object by doing a deep copy of everything and recreating a new object.
+
+        The new object is never frozen, even if the current one is.
+        """
+        new_object = self.model_copy(deep=True)
+        if self.is_frozen:
+            new_object._set_frozen(value=False)
+        return new_object
 
     @staticmethod
     def is_list_composed_of_hashable_model(items: list[Any]) -> bool:
@@ -203,9 +203,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = db.schema.get(name=schema, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema, branch=branch, duplicate=False)
         elif hasattr(schema, "_is_runtime_protocol") and getattr(schema, "_is_runtime_protocol"):
-            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch, duplicate=False)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -421,7 +421,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         db: InfrahubDatabase,
         id: Optional[str] = None,
         db_id: Optional[str] = None,
-        updated_at: Optional[Union[Timestamp, str]] = None,
+        updated_at: Optional[Union[Timestamp, str, int]] = None,
         **kwargs: Any,
     ) -> Self:
         self.id = id
@@ -443,18 +443,21 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created(db_id=db_id, new_ids=query.get_ids(), at=create_at)
 
-        new_ids = query.get_ids()
+    def _set_created(self, db_id: str, new_ids: dict[str, tuple[str, str]], at: Timestamp) -> None:
+        """Mark the node as existing and assign the IDs generated by the database to its attributes and relationships."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Protocol, Union, runtime_checkable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Protocol, Union, runtime_checkable
 
 from typing_extensions import Self
 
@@ -51,6 +51,10 @@ class InfrahubDatabase(Protocol):
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> tuple[list[Record], dict[str, Any]]: ...
 
+    def stream_query(
+        self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> AsyncIterator[Record]: ...
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> AsyncResult: ...
@@ -84,7 +88,7 @@ class CoreNode(Protocol):
         db: InfrahubDatabase,
         id: Optional[str] = None,
         db_id: Optional[str] = None,
-        updated_at: Optional[Union[Timestamp, str]] = None,
+        updated_at: Optional[Union[Timestamp, str, int]] = None,
         **kwargs: Any,
     ) -> Self: ...
     async def to_graphql(
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional, TypeVar, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Iterator, Optional, TypeVar, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -158,65 +158,83 @@ def cleanup_return_labels(labels: list[str]) -> list[str]:
     return clean_labels
 
 
+@lru_cache(maxsize=1024)
+def _get_label_positions(labels: tuple[str, ...]) -> tuple[list[str], dict[str, int]]:
+    """Return the cleaned up labels and the position of each label, shared by all the results of a query."""
+    clean_labels = cleanup_return_labels(list(labels))
+    positions: dict[str, int] = {}
+    for idx, label in enumerate(clean_labels):
+        positions.setdefault(label, idx)
+    return clean_labels, positions
+
+
 class QueryResult:
+    """Result of a query, a single record returned by the database.
+
+    The scores of the result are calculated from all the relationships of the record the first time one of them is accessed,
+    most results are never compared to each other and don't need them.
+    """
+
+    __slots__ = ("_positions", "_scores", "data", "labels", "permission_score")
+
     def __init__(self, data: list[Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]], labels: list[str]):
         self.data = data
-        self.labels = cleanup_return_labels(labels)
-        self.branch_score: int = 0
-        self.time_score: int = 0
+        self.labels, self._positions = _get_label_positions(tuple(labels))
+        self._scores: Optional[tuple[int, int, bool]] = None
         self.permission_score = PermissionLevel.DEFAULT
-        self.has_deleted_rels: bool = False
 
-        self.calculate_branch_score()
-        self.calculate_time_score()
-        self.check_rels_status()
-
-    def calculate_branch_score(self) -> None:
+    @property
+    def branch_score(self) -> int:
         """The branch score is a simple way to order and classify multiple responses for the same branch.
         If the branch name is not the default branch it will get a higher score
         """
-        self.branch_score = 0
+        return self.scores[0]
 
-        for rel in self.get_rels():
-            branch_level = rel.get("branch_level", None)
-
-            if not branch_level:
-                continue
-
-            self.branch_score += branch_level
-
-    def calculate_time_score(self) -> None:
+    @property
+    def time_score(self) -> int:
         """The time score look into the to and from time all relationships
         if the 'to' field is not defined
         """
-        self.time_score = 0
+        return self.scores[1]
+
+    @property
+    def has_deleted_rels(self) -> bool:
+        """Indicate if some relationships have the status deleted."""
+        return self.scores[2]
 
-        for rel in self.get_rels():
-            branch_name = rel.get("branch", None)
+    @property
+    def scores(self) -> tuple[int, int, bool]:
+        """Return the branch score, the time score and the deleted flag of the result, as used to rank the results."""
+        if self._scores is None:
+            self._scores = self._calculate_scores()
+        return self._scores
 
-            if not branch_name:
+    def _calculate_scores(self) -> tuple[int, int, bool]:
+        branch_score = 0
+        time_score = 0
+        has_deleted_rels = False
+
+        for item in self.data:
+            if not isinstance(item, Neo4jRelationship):
                 continue
 
-            to_time = rel.get("to", None)
+            branch_level = item.get("branch_level")
+            if branch_level:
+                branch_score += branch_level
 
-            if to_time:
-                self.time_score += 1
-            else:
-                self.time_score += 2
+            if item.get("branch"):
+                time_score += 1 if item.get("to") else 2
 
-    def check_rels_status(self) -> None:
-        """Check if some relationships have the status deleted and update the flag `has_deleted_rels`"""
-        for rel in self.get_rels():
-            if rel.get("status", None) == "deleted":
-                self.has_deleted_rels = True
-                return
+            if not has_deleted_rels and item.get("status") == "deleted":
+                has_deleted_rels = True
 
-    def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]:
-        if label not in self.labels:
-            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}")
+        return branch_score, time_score, has_deleted_rels
 
-        return_id = self.labels.index(label)
-        return self.data[return_id]
+    def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]:
+        try:
+            return self.data[self._positions[label]]
+        except KeyError:
+            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}") from None
 
     def get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship]:
         return self._get(label=label)
@@ -343,6 +361,10 @@ class Query(ABC):
     insert_return: bool = True
     insert_limit: bool = True
 
+    # Name of a variable unique per record, when defined the internal pagination of large READ queries
+    # is done with the internal id of this variable (keyset) instead of SKIP/LIMIT
+    keyset_label: Optional[str] = None
+
     def __init__(
         self,
         branch: Optional[Branch] = None,
@@ -458,6 +480,23 @@ class Query(ABC):
 
         return query_str
 
+    def get_keyset_query(self, db: InfrahubDatabase, limit: int) -> str:
+        """Return a version of the query ordered by the internal id of `keyset_label` and starting after `$keyset_cursor`.
+
+        The internal id is returned as an additional column named `keyset_id` to build the cursor of the next page.
+        """
+        if not self.keyset_label:
+            raise ValueError(f"{self.name} doesn't define a keyset_label, unable to use keyset pagination")
+
+        tmp_query_lines = self.query_lines.copy()
+        tmp_query_lines.append(f"WITH *, {db.get_id_function_name()}({self.keyset_label}) AS keyset_id")
+        tmp_query_lines.append("WHERE $keyset_cursor IS NULL OR keyset_id > $keyset_cursor")
+        tmp_query_lines.append("RETURN " + ",".join(self.return_labels + ["keyset_id"]))
+        tmp_query_lines.append("ORDER BY keyset_id")
+        tmp_query_lines.append(f"LIMIT {limit}")
+
+        return "\n".join(tmp_query_lines)
+
     def get_count_query(self, var: bool = False) -> str:
         tmp_query_lines = self.query_lines.copy()
         tmp_query_lines.append("RETURN count(*) as count")
@@ -550,7 +589,68 @@ class Query(ABC):
 
         return self
 
+    async def execute_group_by(self, *args: Any, db: InfrahubDatabase) -> Self:
+        """Execute a READ query in streaming mode and only keep the best result for each group.
+
+        The selection is identical to get_results_group_by() but it's done while the records are received,
+        so the memory used is proportional to the number of groups instead of the number of records.
+        """
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        best_results: dict[tuple, QueryResult] = {}
+        async for result in self.stream(db=db):
+            identifier = self._get_group_identifier(result, *args)
+            current = best_results.get(identifier)
+            if current is None or self._get_group_score(result) > self._get_group_score(current):
+                best_results[identifier] = result
+
+        if not best_results and self.raise_error_if_empty:
+            raise QueryError(query=self.get_query(), params=self.params)
+
+        self.results = list(best_results.values())
+        self.has_been_executed = True
+
+        return self
+
+    async def stream(self, db: InfrahubDatabase) -> AsyncIterator[QueryResult]:
+        """Execute a READ query and yield the results as they are returned by the database.
+
+        The results are not stored in self.results.
+        """
+        if self.type != QueryType.READ:
+            raise TypeError("Only READ queries can be executed in streaming mode.")
+
+        async for record in self._stream_records(db=db):
+            yield QueryResult(data=record, labels=self.return_labels)
+
+        self.has_been_executed = True
+
+    async def _stream_records(self, db: InfrahubDatabase) -> AsyncIterator[Record]:
+        if not self.keyset_label or self.limit or self.offset:
+            async for record in db.stream_query(query=self.get_query(), params=self.params, name=self.name):
+                yield record
+            return
+
+        query_limit = config.SETTINGS.database.query_size_limit
+        query = self.get_keyset_query(db=db, limit=query_limit)
+        cursor = None
+        while True:
+            nbr_records = 0
+            async for record in db.stream_query(
+                query=query, params={**self.params, "keyset_cursor": cursor}, name=self.name
+            ):
+                nbr_records += 1
+                cursor = record["keyset_id"]
+                yield record[:-1]
+
+            if nbr_records < query_limit:
+                return
+
     async def query_with_size_limit(self, db: InfrahubDatabase) -> list[Record]:
+        if self.keyset_label:
+            return [record async for record in self._stream_records(db=db)]
+
         query_limit = config.SETTINGS.database.query_size_limit
         offset = 0
         results: list[Record] = []
@@ -605,55 +705,59 @@ class Query(ABC):
     def get_results(self) -> Generator[QueryResult, None, None]:
         """Get all the results sorted by score."""
 
-        score_idx = {}
-        for idx, result in enumerate(self.results):
-            score_idx[idx] = result.branch_score
+        if not self.results:
+            return
+
+        branch_scores = [result.branch_score for result in self.results]
+        if min(branch_scores) == max(branch_scores):
+            # All the results are on the same branch, they are already in the right order
+            yield from self.results
+            return
 
-        for idx, _ in sorted(score_idx.items(), key=lambda x: x[1], reverse=True):
+        for idx in sorted(range(len(self.results)), key=branch_scores.__getitem__, reverse=True):
             yield self.results[idx]
 
     def get_results_group_by(self, *args: Any) -> Generator[QueryResult, None, None]:
         """Return results group by the labels and attributes provided and filtered by scored.
 
+        Only the best result of each group is kept, if it has some deleted relationships the group is skipped.
+
         Examples:
             get_results_group_by(("n", "uuid"), ("a", "name")):
         """
 
-        attrs_info = defaultdict(list)
-
-        # Extract all attrname and relationships on all branches
-        for idx, result in enumerate(self.results):
-            identifier = []
-            for label, attribute in args:
-                node = result.get(label)
-                if hasattr(node, attribute):
-                    identifier.append(getattr(node, attribute))
-                else:
-                    identifier.append(node.get(attribute, None))
-
-            info = {
-                "idx": idx,
-                "branch_score": result.branch_score,
-                "time_score": result.time_score,
-                "deleted": result.has_deleted_rels,
-            }
-            attrs_info[tuple(identifier)].append(info)
-
-        for values in attrs_info.values():
-            attr_info = sorted(values, key=lambda i: (i["branch_score"], i["time_score"], i["deleted"]), reverse=True)[
-                0
-            ]
-            if attr_info["deleted"]:
-                continue
+        best_results: dict[tuple, QueryResult] = {}
+        for result in self.results:
+            identifier = self._get_group_identifier(result, *args)
+            current = best_results.get(identifier)
+            if current is None or result.scores > current.scores:
+                best_results[identifier] = result
+
+        for result in best_results.values():
+            if not result.has_deleted_rels:
+                yield result
+
+    @staticmethod
+    def _get_group_identifier(result: QueryResult, *args: Any) -> tuple:
+        identifier = []
+        for label, attribute in args:
+            node = result.get(label)
+            if hasattr(node, attribute):
+                identifier.append(getattr(node, attribute))
+            else:
+                identifier.append(node.get(attribute, None))
+        return tuple(identifier)
 
-            yield self.results[attr_info["idx"]]
+    @staticmethod
+    def _get_group_score(result: QueryResult) -> tuple[int, int, bool]:
+        return result.scores
 
     @property
     def num_of_results(self) -> int:
         if not self.has_been_executed:
             raise ValueError("The query hasn't been executed yet")
 
-        return len([result for result in self.results if not result.has_deleted_rels])
+        return sum(1 for result in self.results if not result.has_deleted_rels)
 
     def print_table(self) -> None:
         # pylint: disable=import-outside-toplevel
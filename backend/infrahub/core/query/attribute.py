@@ -52,7 +52,7 @@ class AttributeUpdateValueQuery(AttributeQuery):
         self.params["attr_uuid"] = self.attr.id
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
+        self.params["at"] = at.to_graph()
         content = self.attr.to_db()
         self.params.update(self.attr.to_db())
 
@@ -101,7 +101,7 @@ class AttributeUpdateFlagQuery(AttributeQuery):
         self.params["attr_uuid"] = self.attr.id
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
+        self.params["at"] = at.to_graph()
         self.params["flag_value"] = getattr(self.attr, self.flag_name)
         self.params["flag_type"] = self.attr.get_kind()
 
@@ -138,7 +138,7 @@ class AttributeUpdateNodePropertyQuery(AttributeQuery):
         self.params["attr_uuid"] = self.attr.id
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
+        self.params["at"] = at.to_graph()
         self.params["prop_name"] = self.prop_name
         self.params["prop_id"] = self.prop_id
 
@@ -166,7 +166,7 @@ class AttributeGetQuery(AttributeQuery):
         self.params["node_uuid"] = self.attr.node.id
 
         at = self.at or self.attr.at
-        self.params["at"] = at.to_string()
+        self.params["at"] = at.to_graph()
 
         rels_filter, rels_params = self.branch.get_query_filter_path(at=at.to_string())
         self.params.update(rels_params)
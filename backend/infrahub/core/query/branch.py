@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub import config
 from infrahub.core.constants import RelationshipStatus
@@ -32,7 +32,7 @@ class AddNodeToBranch(Query):
         }
 
         self.params["node_id"] = db.to_database_id(self.node_id)
-        self.params["now"] = self.at.to_string()
+        self.params["now"] = self.at.to_graph()
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["status"] = RelationshipStatus.ACTIVE.value
@@ -72,24 +72,68 @@ class DeleteBranchRelationshipsQuery(Query):
         self.add_to_query(query)
 
 
-class GetAllBranchInternalRelationshipQuery(Query):
-    name: str = "get_internal_relationship"
+# A relationship of the branch must be deleted during a rebase if it has been dropped to solve a conflict,
+# if it has been created after the time of the rebase or if it has been deleted before the time of the rebase
+REBASE_DELETE_FILTER = """
+(
+    coalesce(r.conflict = "drop", FALSE)
+    OR (r.to IS NULL AND r.from > $at)
+    OR (r.to IS NOT NULL AND r.to < $at)
+)
+"""
+
+
+class RebaseBranchRelationshipsQuery(Query):
+    """Return a page of the relationships of the branch, ordered by internal id, and whether they must be deleted during a rebase.
+
+    The page starts after the relationship `after_rel_id` and its size is defined by the limit of the query,
+    the relationships of each page are then deleted or updated with RebaseBranchDeleteRelationshipQuery and RebaseBranchUpdateRelationshipQuery.
+    """
+
+    name: str = "rebase_branch_relationships"
 
     type: QueryType = QueryType.READ
-    insert_return: bool = False
+
+    def __init__(self, after_rel_id: Optional[str] = None, **kwargs: Any) -> None:
+        self.after_rel_id = after_rel_id
+        super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
         query = """
-        MATCH p = ()-[r]-()
+        MATCH ()-[r]->()
         WHERE r.branch = $branch_name
-        RETURN DISTINCT r
-        """
+        AND ($after_rel_id IS NULL OR %(id_func)s(r) > $after_rel_id)
+        """ % {"id_func": db.get_id_function_name()}
         self.add_to_query(query=query)
+
         self.params["branch_name"] = self.branch.name
-        self.return_labels = ["r"]
+        self.params["at"] = self.at.to_graph()
+        self.params["after_rel_id"] = self.after_rel_id
+        self.return_labels = [
+            f"{db.get_id_function_name()}(r) AS rel_id",
+            f"{REBASE_DELETE_FILTER} AS to_delete",
+        ]
+        self.order_by = ["rel_id"]
+
+    def get_rel_ids(self) -> tuple[list[str], list[str]]:
+        """Return the ids of the relationships of the page to delete and the ids of the ones to update."""
+        rel_ids_to_delete: list[str] = []
+        rel_ids_to_update: list[str] = []
+        for result in self.get_results():
+            if result.get("to_delete"):
+                rel_ids_to_delete.append(result.get("rel_id"))
+            else:
+                rel_ids_to_update.append(result.get("rel_id"))
+        return rel_ids_to_delete, rel_ids_to_update
+
+    def get_last_rel_id(self) -> Optional[str]:
+        """Return the id of the last relationship of the page, None if the page is empty."""
+        return self.results[-1].get("rel_id") if self.results else None
 
 
 class RebaseBranchUpdateRelationshipQuery(Query):
+    """Move the start of a batch of relationships of the branch, identified by their internal ids, to the time of the rebase."""
+
     name: str = "rebase_branch_update"
 
     type: QueryType = QueryType.WRITE
@@ -104,49 +148,64 @@ class RebaseBranchUpdateRelationshipQuery(Query):
         WHERE %(id_func)s(r) IN $ids
         SET r.from = $at
         SET r.conflict = NULL
-        """ % {
-            "id_func": db.get_id_function_name(),
-        }
+        """ % {"id_func": db.get_id_function_name()}
 
         self.add_to_query(query=query)
 
-        self.params["at"] = self.at.to_string()
-        self.params["ids"] = [db.to_database_id(id) for id in self.ids]
-        self.return_labels = [f"{db.get_id_function_name()}(r)"]
+        self.params["ids"] = self.ids
+        self.params["at"] = self.at.to_graph()
+        self.return_labels = ["count(r) AS nbr_rels"]
+
+    def get_nbr_rels(self) -> int:
+        result = self.get_result()
+        return result.get_as_type(label="nbr_rels", return_type=int) if result else 0
 
 
 class RebaseBranchDeleteRelationshipQuery(Query):
+    """Delete a batch of relationships of the branch, identified by their internal ids, that are not valid anymore after a rebase.
+
+    The nodes left without any relationship are deleted as well.
+    """
+
     name: str = "rebase_branch_delete"
 
     type: QueryType = QueryType.WRITE
-    insert_return: bool = False
 
     def __init__(self, ids: list[str], **kwargs: Any) -> None:
         self.ids = ids
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        query = """
+        MATCH ()-[r]->()
+        WHERE %(id_func)s(r) IN $ids
+        WITH collect(r) AS rels
+        """ % {"id_func": db.get_id_function_name()}
+        self.add_to_query(query=query)
+
         if config.SETTINGS.database.db_type == config.DatabaseType.MEMGRAPH:
             query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE %(id_func)s(r) IN $ids
-            DELETE r
+            FOREACH (r IN rels | DELETE r)
             """
         else:
             query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE %(id_func)s(r) IN $ids
-            DELETE r
-            WITH *
-            UNWIND nodes(p) AS n
-            MATCH (n)
-            WHERE NOT exists((n)--())
-            DELETE n
+            CALL {
+                WITH rels
+                UNWIND rels AS r
+                WITH r, startNode(r) AS s, endNode(r) AS d
+                DELETE r
+                WITH s, d
+                UNWIND [s, d] AS n
+                WITH DISTINCT n
+                WHERE NOT exists((n)--())
+                DELETE n
+            }
             """
-        query %= {
-            "id_func": db.get_id_function_name(),
-        }
-
         self.add_to_query(query=query)
 
-        self.params["ids"] = [db.to_database_id(id) for id in self.ids]
+        self.params["ids"] = self.ids
+        self.return_labels = ["size(rels) AS nbr_rels"]
+
+    def get_nbr_rels(self) -> int:
+        result = self.get_result()
+        return result.get_as_type(label="nbr_rels", return_type=int) if result else 0
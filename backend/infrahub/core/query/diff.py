@@ -246,8 +246,8 @@ class DiffRelationshipQuery(DiffQuery):
 
         self.add_to_query(query)
         self.params["branch_names"] = self.branch_names
-        self.params["diff_from"] = self.diff_from.to_string()
-        self.params["diff_to"] = self.diff_to.to_string()
+        self.params["diff_from"] = self.diff_from.to_graph()
+        self.params["diff_to"] = self.diff_to.to_graph()
         self.params["branch_support"] = [item.value for item in self.branch_support]
 
         self.return_labels = ["sn", "dn", "rel", "r1", "r2"]
@@ -290,8 +290,8 @@ class DiffRelationshipPropertyQuery(DiffQuery):
 
         self.add_to_query(query)
         self.params["branch_names"] = self.branch_names
-        self.params["diff_from"] = self.diff_from.to_string()
-        self.params["diff_to"] = self.diff_to.to_string()
+        self.params["diff_from"] = self.diff_from.to_graph()
+        self.params["diff_to"] = self.diff_to.to_graph()
 
         self.return_labels = ["sn", "dn", "rel", "rp", "r3", "r1", "r2"]
 
@@ -428,7 +428,7 @@ class DiffRelationshipPropertiesByIDSRangeQuery(Query):
         WHERE %s
         """ % ("\n AND ".join(rels_filter),)
 
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         self.add_to_query(query)
         self.return_labels = ["rl", "rp", "r"]
@@ -466,8 +466,8 @@ class DiffCountChanges(Query):
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
         self.params = {
-            "from_time": self.diff_from.to_string(),
-            "to_time": self.diff_to.to_string(),
+            "from_time": self.diff_from.to_graph(),
+            "to_time": self.diff_to.to_graph(),
             "branch_names": self.branch_names,
         }
         query = """
@@ -522,15 +522,15 @@ class DiffAllPathsQuery(DiffQuery):
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        from_str = self.diff_from.to_string()
+        from_time = self.diff_from.to_graph()
         self.params.update(
             {
                 "base_branch_name": self.base_branch.name,
                 "branch_name": self.branch.name,
                 "global_branch_name": GLOBAL_BRANCH_NAME,
-                "branch_from_time": self.diff_branch_from_time.to_string(),
-                "from_time": from_str,
-                "to_time": self.diff_to.to_string(),
+                "branch_from_time": self.diff_branch_from_time.to_graph(),
+                "from_time": from_time,
+                "to_time": self.diff_to.to_graph(),
                 "branch_support": [item.value for item in self.branch_support],
                 "new_node_field_specifiers": self.new_node_field_specifiers,
                 "current_node_field_specifiers": self.current_node_field_specifiers,
@@ -251,7 +251,7 @@ class IPPrefixUtilization(Query):
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
         self.params["ids"] = [p.get_id() for p in self.ip_prefixes]
-        self.params["time_at"] = self.at.to_string()
+        self.params["time_at"] = self.at.to_graph()
 
         def rel_filter(rel_name: str) -> str:
             return f"{rel_name}.from <= $time_at AND ({rel_name}.to IS NULL OR {rel_name}.to >= $time_at)"
@@ -7,7 +7,12 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, AsyncIterator, Generator, Optional, Union
 
 from infrahub import config
-from infrahub.core.constants import AttributeDBNodeType, RelationshipDirection, RelationshipHierarchyDirection
+from infrahub.core.constants import (
+    AttributeDBNodeType,
+    InfrahubKind,
+    RelationshipDirection,
+    RelationshipHierarchyDirection,
+)
 from infrahub.core.query import Query, QueryResult, QueryType
 from infrahub.core.query.subquery import build_subquery_filter, build_subquery_order
 from infrahub.core.query.utils import find_node_schema
@@ -25,6 +30,7 @@ if TYPE_CHECKING:
     from infrahub.core.schema.attribute_schema import AttributeSchema
     from infrahub.core.schema.profile_schema import ProfileSchema
     from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 # pylint: disable=consider-using-f-string,redefined-builtin,too-many-lines
@@ -38,7 +44,7 @@ class NodeToProcess:
     node_uuid: str
     profile_uuids: list[str]
 
-    updated_at: str
+    updated_at: Union[str, int]
 
     branch: str
 
@@ -65,7 +71,7 @@ class AttributeFromDB:
     value: Any
     content: Any
 
-    updated_at: str
+    updated_at: Union[str, int]
 
     branch: str
 
@@ -115,95 +121,83 @@ class NodeQuery(Query):
         super().__init__(**kwargs)
 
 
-class NodeCreateAllQuery(NodeQuery):
-    name = "node_create_all"
-
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.node._at
-        self.params["uuid"] = self.node.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["kind"] = self.node.get_kind()
-        self.params["branch_support"] = self.node._schema.branch
-
-        attributes: list[AttributeCreateData] = []
-        attributes_iphost: list[AttributeCreateData] = []
-        attributes_ipnetwork: list[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
-
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: list[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.model_dump() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.model_dump() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.model_dump() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
+NODE_CREATE_REL_PROP = (
+    "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
+)
+
+NODE_CREATE_IPHOST_PROP = {
+    "value": "attr.content.value",
+    "is_default": "attr.content.is_default",
+    "binary_address": "attr.content.binary_address",
+    "version": "attr.content.version",
+    "prefixlen": "attr.content.prefixlen",
+}
+
+NODE_CREATE_IPNETWORK_PROP = {
+    "value": "attr.content.value",
+    "is_default": "attr.content.is_default",
+    "binary_address": "attr.content.binary_address",
+    "version": "attr.content.version",
+    "prefixlen": "attr.content.prefixlen",
+    # "num_addresses": "attr.content.num_addresses",
+}
+
+
+async def get_node_create_params(db: InfrahubDatabase, node: Node, branch: Branch, at: Timestamp) -> dict[str, Any]:
+    """Return the parameters describing a new node, its attributes and its relationships for the creation queries."""
+    attributes: list[AttributeCreateData] = []
+    attributes_iphost: list[AttributeCreateData] = []
+    attributes_ipnetwork: list[AttributeCreateData] = []
+
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
+
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: list[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "attrs": [attr.model_dump() for attr in attributes],
+        "attrs_iphost": [attr.model_dump() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.model_dump() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [
             rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
+        ],
+        "rels_in": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "node_branch_prop": {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
             "status": "active",
-            "from": at.to_string(),
-        }
+            "from": at.to_graph(),
+        },
+    }
 
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
 
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
-
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+def get_node_elements_create_query(source: str) -> str:
+    """Return the clauses creating the attributes and the relationships of the node `n`.
 
-        query = """
-        MATCH (root:Root)
-        CREATE (n:Node:%(labels)s $node_prop )
-        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
-        WITH distinct n
-        FOREACH ( attr IN $attrs |
+    `source` is the prefix used to access the list of attributes and relationships,
+    `$` to read them from the parameters of the query or a variable name followed by a dot to read them from a map.
+    """
+    query = """
+        FOREACH ( attr IN %(source)sattrs |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
@@ -221,7 +215,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_iphost |
+        FOREACH ( attr IN %(source)sattrs_iphost |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
@@ -239,7 +233,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_ipnetwork |
+        FOREACH ( attr IN %(source)sattrs_ipnetwork |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
@@ -257,7 +251,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_bidir |
+        FOREACH ( rel IN %(source)srels_bidir |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -275,7 +269,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_out |
+        FOREACH ( rel IN %(source)srels_out |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -293,7 +287,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_in |
+        FOREACH ( rel IN %(source)srels_in |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
@@ -311,16 +305,45 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
+        """ % {
+        "source": source,
+        "rel_prop": NODE_CREATE_REL_PROP,
+        "iphost_prop": ", ".join(f"{key}: {value}" for key, value in NODE_CREATE_IPHOST_PROP.items()),
+        "ipnetwork_prop": ", ".join(f"{key}: {value}" for key, value in NODE_CREATE_IPNETWORK_PROP.items()),
+    }
+    return query
+
+
+class NodeCreateAllQuery(NodeQuery):
+    name = "node_create_all"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        at = self.at or self.node._at
+        self.params["uuid"] = self.node.id
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["kind"] = self.node.get_kind()
+        self.params["branch_support"] = self.node._schema.branch
+        self.params.update(await get_node_create_params(db=db, node=self.node, branch=self.branch, at=at))
+
+        query = """
+        MATCH (root:Root)
+        CREATE (n:Node:%(labels)s $node_prop )
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n
+        %(elements)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "elements": get_node_elements_create_query(source="$"),
         }
 
-        self.params["at"] = at.to_string()
+        self.params["at"] = at.to_graph()
 
         self.add_to_query(query)
         self.return_labels = ["n", "rn", "rv"]
@@ -348,6 +371,73 @@ class NodeCreateAllQuery(NodeQuery):
         return data
 
 
+class NodeCreateManyQuery(Query):
+    """Create multiple nodes of the same kind, with their attributes and relationships, in a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: list[Node], **kwargs: Any) -> None:
+        if not nodes:
+            raise ValueError("At least one node must be provided")
+        if len({node.get_kind() for node in nodes}) > 1:
+            raise ValueError("All the nodes must be of the same kind")
+        self.nodes = nodes
+        kwargs.setdefault("branch", nodes[0].get_branch_based_on_support_type())
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["at"] = self.at.to_graph()
+        self.params["nodes"] = [
+            await get_node_create_params(db=db, node=node, branch=self.branch, at=self.at) for node in self.nodes
+        ]
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node
+        CREATE (n:Node:%(labels)s)
+        SET n = node.node_prop
+        CREATE (n)-[r:IS_PART_OF]->(root)
+        SET r = node.node_branch_prop
+        WITH n, node
+        %(elements)s
+        WITH distinct n
+        OPTIONAL MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "elements": get_node_elements_create_query(source="node."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> dict[str, tuple[str, dict[str, tuple[str, str]]]]:
+        """Return the database ID of each node and the IDs of its attributes and relationships, indexed by the UUID of the node."""
+        data: dict[str, tuple[str, dict[str, tuple[str, str]]]] = {}
+        for result in self.get_results():
+            node = result.get_node("n")
+            if node["uuid"] not in data:
+                data[node["uuid"]] = (node.element_id, {})
+
+            # A node without attribute or relationship is returned once, without element
+            element = result.get("rn")
+            if element is None:
+                continue
+            if "Relationship" in element.labels:
+                peer = result.get_node("rv")
+                name = f"{element.get('name')}::{peer.get('uuid')}"
+            elif "Attribute" in element.labels:
+                name = element.get("name")
+            else:
+                continue
+            data[node["uuid"]][1][name] = (element["uuid"], element.element_id)
+
+        return data
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -366,7 +456,7 @@ class NodeDeleteQuery(NodeQuery):
         CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: "deleted", from: $at }]->(root)
         """
 
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         self.add_to_query(query)
         self.return_labels = ["n"]
@@ -396,6 +486,95 @@ class NodeCheckIDQuery(Query):
         self.return_labels = ["n"]
 
 
+def get_attribute_details_query(branch_filter: str, include_source: bool, include_owner: bool) -> tuple[str, list[str]]:
+    """Return the clauses retrieving the value and the properties of the attributes `a` of the nodes `n`.
+
+    The variables returned along with the query are the ones required by `extract_attribute_data`.
+    """
+    query = """
+    CALL {
+        WITH n, a
+        MATCH (n)-[r:HAS_ATTRIBUTE]-(a:Attribute)
+        WHERE %(branch_filter)s
+        RETURN n as n1, r as r1, a as a1
+        ORDER BY r.branch_level DESC, r.from DESC
+        LIMIT 1
+    }
+    WITH n1 as n, r1, a1 as a
+    WHERE r1.status = "active"
+    WITH n, r1, a
+    MATCH (a)-[:HAS_VALUE]-(av:AttributeValue)
+    CALL {
+        WITH a, av
+        MATCH (a)-[r:HAS_VALUE]-(av:AttributeValue)
+        WHERE %(branch_filter)s
+        RETURN a as a1, r as r2, av as av1
+        ORDER BY r.branch_level DESC, r.from DESC
+        LIMIT 1
+    }
+    WITH n, r1, a1 as a, r2, av1 as av
+    WHERE r2.status = "active"
+    WITH n, a, av, r1, r2
+    MATCH (a)-[rel_isv:IS_VISIBLE]-(isv:Boolean)
+    MATCH (a)-[rel_isp:IS_PROTECTED]-(isp:Boolean)
+    WHERE all(r IN [rel_isv, rel_isp] WHERE ( %(branch_filter)s ))
+    """ % {"branch_filter": branch_filter}
+    return_labels = ["a", "av", "r1", "r2", "isv", "isp", "rel_isv", "rel_isp"]
+
+    if include_source:
+        query += """
+        OPTIONAL MATCH (a)-[rel_source:HAS_SOURCE]-(source)
+        WHERE all(r IN [rel_source] WHERE ( %(branch_filter)s ))
+        """ % {"branch_filter": branch_filter}
+        return_labels.extend(["source", "rel_source"])
+
+    if include_owner:
+        query += """
+        OPTIONAL MATCH (a)-[rel_owner:HAS_OWNER]-(owner)
+        WHERE all(r IN [rel_owner] WHERE ( %(branch_filter)s ))
+        """ % {"branch_filter": branch_filter}
+        return_labels.extend(["owner", "rel_owner"])
+
+    return query, return_labels
+
+
+def extract_attribute_data(
+    result: QueryResult, branch: Branch, include_source: bool, include_owner: bool
+) -> AttributeFromDB:
+    attr = result.get_node("a")
+    attr_value = result.get_node("av")
+
+    data = AttributeFromDB(
+        name=attr.get("name"),
+        attr_labels=list(attr.labels),
+        attr_id=attr.element_id,
+        attr_uuid=attr.get("uuid"),
+        attr_value_id=attr_value.element_id,
+        attr_value_uuid=attr_value.get("uuid"),
+        updated_at=result.get_rel("r2").get("from"),
+        value=attr_value.get("value"),
+        is_default=attr_value.get("is_default"),
+        content=attr_value._properties,
+        branch=branch.name,
+        flag_properties={
+            "is_protected": result.get("isp").get("value"),
+            "is_visible": result.get("isv").get("value"),
+        },
+    )
+
+    if include_source and result.get("source"):
+        data.node_properties["source"] = AttributeNodePropertyFromDB(
+            uuid=result.get_node("source").get("uuid"), labels=list(result.get_node("source").labels)
+        )
+
+    if include_owner and result.get("owner"):
+        data.node_properties["owner"] = AttributeNodePropertyFromDB(
+            uuid=result.get_node("owner").get("uuid"), labels=list(result.get_node("owner").labels)
+        )
+
+    return data
+
+
 class NodeListGetAttributeQuery(Query):
     name: str = "node_list_get_attribute"
 
@@ -442,60 +621,11 @@ class NodeListGetAttributeQuery(Query):
 
         self.add_to_query(query)
 
-        query = """
-        CALL {
-            WITH n, a
-            MATCH (n)-[r:HAS_ATTRIBUTE]-(a:Attribute)
-            WHERE %(branch_filter)s
-            RETURN n as n1, r as r1, a as a1
-            ORDER BY r.branch_level DESC, r.from DESC
-            LIMIT 1
-        }
-        WITH n1 as n, r1, a1 as a
-        WHERE r1.status = "active"
-        WITH n, r1, a
-        MATCH (a)-[:HAS_VALUE]-(av:AttributeValue)
-        CALL {
-            WITH a, av
-            MATCH (a)-[r:HAS_VALUE]-(av:AttributeValue)
-            WHERE %(branch_filter)s
-            RETURN a as a1, r as r2, av as av1
-            ORDER BY r.branch_level DESC, r.from DESC
-            LIMIT 1
-        }
-        WITH n, r1, a1 as a, r2, av1 as av
-        WHERE r2.status = "active"
-        WITH n, a, av, r1, r2
-        """ % {"branch_filter": branch_filter}
-        self.add_to_query(query)
-
-        self.return_labels = ["n", "a", "av", "r1", "r2"]
-
-        # Add Is_Protected and Is_visible
-        query = """
-        MATCH (a)-[rel_isv:IS_VISIBLE]-(isv:Boolean)
-        MATCH (a)-[rel_isp:IS_PROTECTED]-(isp:Boolean)
-        WHERE all(r IN [rel_isv, rel_isp] WHERE ( %(branch_filter)s ))
-        """ % {"branch_filter": branch_filter}
+        query, return_labels = get_attribute_details_query(
+            branch_filter=branch_filter, include_source=self.include_source, include_owner=self.include_owner
+        )
         self.add_to_query(query)
-
-        self.return_labels.extend(["isv", "isp", "rel_isv", "rel_isp"])
-
-        if self.include_source:
-            query = """
-            OPTIONAL MATCH (a)-[rel_source:HAS_SOURCE]-(source)
-            WHERE all(r IN [rel_source] WHERE ( %(branch_filter)s ))
-            """ % {"branch_filter": branch_filter}
-            self.add_to_query(query)
-            self.return_labels.extend(["source", "rel_source"])
-
-        if self.include_owner:
-            query = """
-            OPTIONAL MATCH (a)-[rel_owner:HAS_OWNER]-(owner)
-            WHERE all(r IN [rel_owner] WHERE ( %(branch_filter)s ))
-            """ % {"branch_filter": branch_filter}
-            self.add_to_query(query)
-            self.return_labels.extend(["owner", "rel_owner"])
+        self.return_labels = ["n"] + return_labels
 
     def get_attributes_group_by_node(self) -> dict[str, NodeAttributesFromDB]:
         attrs_by_node: dict[str, NodeAttributesFromDB] = {}
@@ -521,39 +651,13 @@ class NodeListGetAttributeQuery(Query):
         raise IndexError(f"Unable to find the result with ID: {node_id} and NAME: {attr_name}")
 
     def _extract_attribute_data(self, result: QueryResult) -> AttributeFromDB:
-        attr = result.get_node("a")
-        attr_value = result.get_node("av")
-
-        data = AttributeFromDB(
-            name=attr.get("name"),
-            attr_labels=list(attr.labels),
-            attr_id=attr.element_id,
-            attr_uuid=attr.get("uuid"),
-            attr_value_id=attr_value.element_id,
-            attr_value_uuid=attr_value.get("uuid"),
-            updated_at=result.get_rel("r2").get("from"),
-            value=attr_value.get("value"),
-            is_default=attr_value.get("is_default"),
-            content=attr_value._properties,
-            branch=self.branch.name,
-            flag_properties={
-                "is_protected": result.get("isp").get("value"),
-                "is_visible": result.get("isv").get("value"),
-            },
+        return extract_attribute_data(
+            result=result,
+            branch=self.branch,
+            include_source=self.include_source,
+            include_owner=self.include_owner,
         )
 
-        if self.include_source and result.get("source"):
-            data.node_properties["source"] = AttributeNodePropertyFromDB(
-                uuid=result.get_node("source").get("uuid"), labels=list(result.get_node("source").labels)
-            )
-
-        if self.include_owner and result.get("owner"):
-            data.node_properties["owner"] = AttributeNodePropertyFromDB(
-                uuid=result.get_node("owner").get("uuid"), labels=list(result.get_node("owner").labels)
-            )
-
-        return data
-
 
 class NodeListGetRelationshipsQuery(Query):
     name: str = "node_list_get_relationship"
@@ -622,6 +726,7 @@ class NodeGetKindQuery(Query):
 
 class NodeListGetInfoQuery(Query):
     name: str = "node_list_get_info"
+    keyset_label = "n"
 
     def __init__(self, ids: list[str], account=None, **kwargs: Any) -> None:
         self.account = account
@@ -1147,6 +1252,276 @@ class NodeGetListQuery(Query):
         return [str(result.get("n.uuid")) for result in self.get_results()]
 
 
+class NodeGetListWithAttributesQuery(NodeGetListQuery):
+    """Filter, order and paginate the nodes of a given kind and return their info and their attributes in a single query.
+
+    The result is equivalent to NodeGetListQuery followed by NodeListGetInfoQuery and NodeListGetAttributeQuery
+    on the IDs returned, with one record per node containing all the candidates for its attributes.
+    When include_count is enabled, each record also contains the total number of nodes matching the filters.
+    """
+
+    name = "node_get_list_with_attributes"
+
+    def __init__(
+        self,
+        fields: Optional[dict] = None,
+        include_source: bool = False,
+        include_owner: bool = False,
+        include_count: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.fields = fields
+        self.include_source = include_source
+        self.include_owner = include_owner
+        self.include_count = include_count
+        # The pagination is applied to the nodes within the query, before their attributes are collected
+        self.list_limit = limit
+        self.list_offset = offset
+        self.attribute_labels: list[str] = []
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        await super().query_init(db=db, **kwargs)
+
+        branch_filter, _ = self.branch.get_query_filter_path(at=self.at, branch_agnostic=self.branch_agnostic)
+
+        list_order = "ORDER BY " + ", ".join(self.order_by) if self.order_by else ""
+        self.params["list_offset"] = self.list_offset or 0
+        self.params["list_limit"] = self.list_limit
+
+        if self.include_count:
+            pagination_filter = "position >= $list_offset"
+            if self.list_limit is not None:
+                pagination_filter += " AND position < $list_offset + $list_limit"
+            query = """
+            WITH *
+            %(list_order)s
+            WITH collect([n, rb]) AS all_nodes
+            WITH all_nodes, size(all_nodes) AS total_count
+            UNWIND range(0, size(all_nodes) - 1) AS position
+            WITH all_nodes, total_count, position
+            WHERE %(pagination_filter)s
+            WITH all_nodes[position] AS node_rb, position, total_count
+            """ % {"list_order": list_order, "pagination_filter": pagination_filter}
+        else:
+            pagination = "SKIP $list_offset"
+            if self.list_limit is not None:
+                pagination += " LIMIT $list_limit"
+            query = """
+            WITH *
+            %(list_order)s
+            %(pagination)s
+            WITH collect([n, rb]) AS page_nodes
+            UNWIND range(0, size(page_nodes) - 1) AS position
+            WITH page_nodes[position] AS node_rb, position
+            """ % {"list_order": list_order, "pagination": pagination}
+        self.add_to_query(query)
+
+        count_label = ", total_count" if self.include_count else ""
+        query = """
+        WITH node_rb[0] AS n, node_rb[1] AS rb, position%(count_label)s
+        OPTIONAL MATCH profile_path = (n)-[:IS_RELATED]->(profile_r:Relationship)<-[:IS_RELATED]-(profile:Node)-[:IS_PART_OF]->(:Root)
+        WHERE profile_r.name = "node__profile"
+        AND profile.namespace = "Profile"
+        AND all(r in relationships(profile_path) WHERE %(branch_filter)s and r.status = "active")
+        WITH n AS node, rb, position%(count_label)s, collect(profile.uuid) AS profile_uuids
+        """ % {"count_label": count_label, "branch_filter": branch_filter}
+        self.add_to_query(query)
+
+        attribute_filter = ""
+        if self.fields:
+            attribute_filter = "WHERE a.name IN $field_names"
+            self.params["field_names"] = list(self.fields.keys())
+        attribute_query, self.attribute_labels = get_attribute_details_query(
+            branch_filter=branch_filter, include_source=self.include_source, include_owner=self.include_owner
+        )
+        query = """
+        CALL {
+            WITH node
+            WITH node AS n
+            MATCH (n)-[:HAS_ATTRIBUTE]-(a:Attribute)
+            %(attribute_filter)s
+            %(attribute_query)s
+            RETURN collect([%(attribute_labels)s]) AS attributes
+        }
+        """ % {
+            "attribute_filter": attribute_filter,
+            "attribute_query": attribute_query,
+            "attribute_labels": ", ".join(self.attribute_labels),
+        }
+        self.add_to_query(query)
+
+        self.return_labels = ["node AS n", "rb", "profile_uuids", "attributes", "position"]
+        if self.include_count:
+            self.return_labels.append("total_count")
+        self.order_by = ["position"]
+
+    def get_node_ids(self) -> list[str]:
+        """Return the IDs of the nodes, in the order defined by the filters and the schema."""
+        return [result.get_node("n").get("uuid") for result in self.results]
+
+    def get_total_count(self) -> Optional[int]:
+        if not self.include_count or not self.results:
+            return None
+        return self.results[0].get_as_type(label="total_count", return_type=int)
+
+    async def get_nodes(self, db: InfrahubDatabase, duplicate: bool = False) -> AsyncIterator[NodeToProcess]:
+        """Return all the node objects as NodeToProcess."""
+        for result in self.results:
+            node = result.get_node("n")
+            node_branch = self.branch.name
+            if self.branch_agnostic:
+                node_branch = result.get_rel("rb").get("branch")
+            yield NodeToProcess(
+                schema=find_node_schema(db=db, node=node, branch=self.branch, duplicate=duplicate),
+                node_id=node.element_id,
+                node_uuid=node.get("uuid"),
+                profile_uuids=[str(puuid) for puuid in result.get("profile_uuids")],
+                updated_at=result.get_rel("rb").get("from"),
+                branch=node_branch,
+                labels=list(node.labels),
+            )
+
+    def get_profile_ids_by_node_id(self) -> dict[str, list[str]]:
+        return {
+            result.get_node("n").get("uuid"): [str(puuid) for puuid in result.get("profile_uuids")]
+            for result in self.results
+            if result.get("profile_uuids")
+        }
+
+    def get_attributes_group_by_node(self) -> dict[str, NodeAttributesFromDB]:
+        """Return the attributes of each node, keeping the best candidate for each attribute like get_results_group_by."""
+        attrs_by_node: dict[str, NodeAttributesFromDB] = {}
+
+        for result in self.results:
+            node = result.get_node("n")
+            attrs_by_node[node.get("uuid")] = node_attributes = NodeAttributesFromDB(node=node)
+
+            best_candidates: dict[str, QueryResult] = {}
+            for candidate in result.get("attributes"):
+                attribute_result = QueryResult(data=candidate, labels=self.attribute_labels)
+                attr_name = attribute_result.get_node("a").get("name")
+                current = best_candidates.get(attr_name)
+                if current is None or self._get_group_score(attribute_result) > self._get_group_score(current):
+                    best_candidates[attr_name] = attribute_result
+
+            for attr_name, attribute_result in best_candidates.items():
+                if attribute_result.has_deleted_rels:
+                    continue
+                node_attributes.attrs[attr_name] = extract_attribute_data(
+                    result=attribute_result,
+                    branch=self.branch,
+                    include_source=self.include_source,
+                    include_owner=self.include_owner,
+                )
+
+        return attrs_by_node
+
+
+def is_fulltext_searchable(search: str) -> bool:
+    """Indicate if a text can be searched with the full-text index on the values.
+
+    The analyzer of the index splits the values on the separators like `-`, `.`, `/` or `:` and only indexes the strings,
+    so a text is only searchable if all its words are made of letters and digits and aren't numbers.
+    """
+    words = search.split()
+    return bool(words) and all(word.isalnum() and not word.isdigit() for word in words)
+
+
+def build_fulltext_search_query(search: str, partial_match: bool = True) -> str:
+    """Convert a text into a query for the full-text index, all the words of the text must be present."""
+    words = [word.lower() for word in search.split()]
+    if partial_match:
+        return " AND ".join([f"*{word}*" for word in words])
+    return '"' + " ".join(words) + '"'
+
+
+class NodeSearchQuery(Query):
+    """Search the nodes with the value of an attribute matching a text, using the full-text index on the values.
+
+    The full-text index is only used to find candidates, the values are then compared with the text like the `any__value` filter.
+    Only the current value of active attributes of active nodes are considered and the nodes are ordered by their best score,
+    the limit of the query is applied once all the candidates have been filtered.
+    The text must be validated with `is_fulltext_searchable` beforehand.
+    """
+
+    name = "node_search"
+    type = QueryType.READ
+
+    def __init__(self, search: str, index_name: str, partial_match: bool = True, **kwargs: Any) -> None:
+        self.search = search
+        self.index_name = index_name
+        self.partial_match = partial_match
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(
+            at=self.at, branch_agnostic=self.branch_agnostic
+        )
+        self.params.update(branch_params)
+        self.params["index_name"] = self.index_name
+        self.params["search_query"] = build_fulltext_search_query(search=self.search, partial_match=self.partial_match)
+        self.params["search_value"] = self.search
+        self.params["node_kind"] = InfrahubKind.NODE
+
+        if self.partial_match:
+            value_filter = "toLower(toString(av.value)) CONTAINS toLower($search_value)"
+        else:
+            value_filter = "av.value = $search_value"
+
+        query = """
+        CALL db.index.fulltext.queryNodes($index_name, $search_query) YIELD node AS av, score
+        WITH av, score
+        WHERE %(value_filter)s
+        MATCH (n:Node)-[:HAS_ATTRIBUTE]->(a:Attribute)-[:HAS_VALUE]->(av)
+        WHERE $node_kind IN LABELS(n)
+        WITH DISTINCT n, a, av, score
+        CALL {
+            WITH a
+            MATCH (a)-[r:HAS_VALUE]->(v:AttributeValue)
+            WHERE %(branch_filter)s
+            RETURN v AS latest_value, r.status AS value_status
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, a, av, score, latest_value, value_status
+        WHERE latest_value = av AND value_status = "active"
+        CALL {
+            WITH n, a
+            MATCH (n)-[r:HAS_ATTRIBUTE]->(a)
+            WHERE %(branch_filter)s
+            RETURN r.status AS attr_status
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, score, attr_status
+        WHERE attr_status = "active"
+        CALL {
+            WITH n
+            MATCH (:Root)<-[r:IS_PART_OF]-(n)
+            WHERE %(branch_filter)s
+            RETURN r.status AS node_status
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, score, node_status
+        WHERE node_status = "active"
+        WITH n, max(score) AS score
+        """ % {"value_filter": value_filter, "branch_filter": branch_filter}
+        self.add_to_query(query)
+
+        self.return_labels = ["n.uuid AS node_id", "n.kind AS node_kind", "score"]
+        self.order_by = ["score DESC", "node_id"]
+
+    def get_matching_nodes(self) -> list[PeerInfo]:
+        return [
+            PeerInfo(uuid=str(result.get("node_id")), kind=str(result.get("node_kind")))
+            for result in self.get_results()
+        ]
+
+
 class NodeGetHierarchyQuery(Query):
     name = "node_get_hierarchy"
 
@@ -85,7 +85,7 @@ class RelationshipPeerData:
     rels: Optional[list[RelData]] = None
     """Both relationships pointing at this Relationship Node."""
 
-    updated_at: Optional[str] = None
+    updated_at: Optional[Union[str, int]] = None
 
     def rel_ids_per_branch(self) -> dict[str, list[Union[str, int]]]:
         response = defaultdict(list)
@@ -181,7 +181,7 @@ class RelationshipQuery(Query):
             "branch": self.branch.name,
             "branch_level": self.branch.hierarchy_level,
             "status": status.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
         }
         if self.schema.hierarchical:
             rel_prop_dict["hierarchy"] = self.schema.hierarchical
@@ -214,7 +214,7 @@ class RelationshipCreateQuery(RelationshipQuery):
 
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         self.params["is_protected"] = self.rel.is_protected
         self.params["is_visible"] = self.rel.is_visible
@@ -294,7 +294,7 @@ class RelationshipUpdatePropertyQuery(RelationshipQuery):
         self.params["rel_node_id"] = self.data.rel_node_id
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         query = """
         MATCH (rl:Relationship { uuid: $rel_node_id })
@@ -376,7 +376,7 @@ class RelationshipDataDeleteQuery(RelationshipQuery):
         self.params["name"] = self.schema.identifier
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         # -----------------------------------------------------------------------
         # Match all nodes, including properties
@@ -476,7 +476,7 @@ class RelationshipDeleteQuery(RelationshipQuery):
             r2,
         )
 
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
         self.return_labels = ["rl"]
 
         self.add_to_query(query)
@@ -691,7 +691,8 @@ class RelationshipGetPeerQuery(Query):
         return [peer.peer_id for peer in self.get_peers()]
 
     def get_peers(self) -> Generator[RelationshipPeerData, None, None]:
-        for result in self.get_results_group_by(("peer", "uuid")):
+        # Multiple source nodes can share the same peer, the results must be grouped per source and peer
+        for result in self.get_results_group_by(("source_node", "uuid"), ("peer", "uuid")):
             rels = result.get("rels")
             data = RelationshipPeerData(
                 source_id=result.get_node("source_node").get("uuid"),
@@ -760,7 +761,7 @@ class RelationshipGetQuery(RelationshipQuery):
             "\n AND ".join(rels_filter),
         )
 
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         self.add_to_query(query)
         self.return_labels = ["s", "d", "rl", "r1", "r2"]
@@ -802,7 +803,7 @@ class RelationshipGetByIdentifierQuery(Query):
         ]
         self.params["excluded_namespaces"] = self.excluded_namespaces
         self.params["branch"] = self.branch.name
-        self.params["at"] = self.at.to_string()
+        self.params["at"] = self.at.to_graph()
 
         rels_filter, rels_params = self.branch.get_query_filter_relationships(
             rel_labels=["r1", "r2"], at=self.at.to_string(), include_outside_parentheses=True
@@ -89,7 +89,7 @@ class IPAddressPoolSetReserved(Query):
             "branch": global_branch.name,
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
             "identifier": self.identifier,
         }
 
@@ -121,7 +121,7 @@ class NumberPoolGetAllocated(Query):
         self.params["start_range"] = self.pool.start_range.value
         self.params["end_range"] = self.pool.end_range.value
 
-        self.params["time_at"] = self.at.to_string()
+        self.params["time_at"] = self.at.to_graph()
 
         def rel_filter(rel_name: str) -> str:
             return f"{rel_name}.from <= $time_at AND ({rel_name}.to IS NULL OR {rel_name}.to >= $time_at)"
@@ -247,7 +247,7 @@ class NumberPoolSetReserved(Query):
             "branch": global_branch.name,
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
             "identifier": self.identifier,
         }
 
@@ -339,7 +339,7 @@ class PrefixPoolSetReserved(Query):
             "branch": global_branch.name,
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
-            "from": self.at.to_string(),
+            "from": self.at.to_graph(),
             "identifier": self.identifier,
         }
 
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.query import Query, QueryType
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+SCHEMA_NODE_LABELS = ["SchemaNode", "SchemaGeneric", "SchemaAttribute", "SchemaRelationship"]
+
+
+class SchemaLastChangeQuery(Query):
+    """Find the time of the most recent change of the schema stored in the database at a given time.
+
+    All the times between two changes of the schema share the same version of the schema,
+    the time returned by this query can be used to identify this version without loading the schema itself.
+    """
+
+    name: str = "schema_last_change"
+    type: QueryType = QueryType.READ
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs["limit"] = 1
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branches_times = self.branch.get_branches_and_times_to_query_global(at=self.at)
+
+        filters = []
+        for idx, (branch_names, time_to_query) in enumerate(branches_times.items()):
+            self.params[f"branch{idx}"] = list(branch_names)
+            self.params[f"time{idx}"] = time_to_query
+            filters.append(f"(r.branch IN $branch{idx} AND change_time <= $time{idx})")
+
+        query = """
+        MATCH (n:Node)
+        WHERE %(labels_filter)s
+        MATCH (n)-[r1:IS_PART_OF|HAS_ATTRIBUTE|IS_RELATED]-(m)
+        OPTIONAL MATCH (m:Attribute)-[r2:HAS_VALUE]->(:AttributeValue)
+        UNWIND [r1, r2] AS r
+        WITH r
+        WHERE r IS NOT NULL
+        UNWIND [r.from, r.to] AS change_time
+        WITH r, change_time
+        WHERE change_time IS NOT NULL AND (%(branch_filter)s)
+        """ % {
+            "labels_filter": " OR ".join(f"n:{label}" for label in SCHEMA_NODE_LABELS),
+            "branch_filter": " OR ".join(filters),
+        }
+        self.add_to_query(query)
+        self.return_labels = ["change_time"]
+        self.order_by = ["change_time DESC"]
+
+    def get_last_change(self) -> Optional[Timestamp]:
+        result = self.get_result()
+        if not result:
+            return None
+        return result.get_as_optional_type(label="change_time", return_type=Timestamp)
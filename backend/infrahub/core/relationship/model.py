@@ -204,7 +204,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
         db: InfrahubDatabase,
         id: Optional[UUID] = None,
         db_id: Optional[str] = None,
-        updated_at: Optional[Union[Timestamp, str]] = None,
+        updated_at: Optional[Union[Timestamp, str, int]] = None,
         data: Union[dict, RelationshipPeerData, Any] = None,
     ) -> Self:
         hash_before = hash(self)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+
+from .metrics import (
+    SCHEMA_HISTORY_CACHE_EVICTIONS_METRICS,
+    SCHEMA_HISTORY_CACHE_HITS_METRICS,
+    SCHEMA_HISTORY_CACHE_MISSES_METRICS,
+    SCHEMA_HISTORY_CACHE_SIZE_METRICS,
+)
+
+if TYPE_CHECKING:
+    from .schema_branch import SchemaBranch
+
+# (branch name, branched_from of the branch, time of the last change of the schema)
+SchemaVersionKey = tuple[str, str, str]
+# (branch name, hash of the schema)
+SchemaHistoryKey = tuple[str, str]
+
+
+class SchemaHistoryCache:
+    """LRU cache of the past versions of the schema of the branches.
+
+    A version of the schema is identified by the time of the last change of the schema before a given time,
+    multiple versions pointing to the same schema hash share the same SchemaBranch.
+    The SchemaBranch are stored already processed so the GraphQL schema generated for them is reused as well.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._versions: dict[SchemaVersionKey, SchemaHistoryKey] = {}
+        self._schemas: OrderedDict[SchemaHistoryKey, SchemaBranch] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.schema_history_cache_size
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def get(self, version: SchemaVersionKey) -> Optional[SchemaBranch]:
+        branch_name = version[0]
+        key = self._versions.get(version)
+        if key is None or key not in self._schemas:
+            SCHEMA_HISTORY_CACHE_MISSES_METRICS.labels(branch_name).inc()
+            return None
+
+        self._schemas.move_to_end(key)
+        SCHEMA_HISTORY_CACHE_HITS_METRICS.labels(branch_name).inc()
+        return self._schemas[key]
+
+    def set(self, version: SchemaVersionKey, schema: SchemaBranch) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = (version[0], schema.get_hash())
+        self._versions[version] = key
+        self._schemas[key] = schema
+        self._schemas.move_to_end(key)
+
+        while len(self._schemas) > self.max_size:
+            evicted_key, _ = self._schemas.popitem(last=False)
+            self._versions = {
+                version_key: schema_key
+                for version_key, schema_key in self._versions.items()
+                if schema_key != evicted_key
+            }
+            SCHEMA_HISTORY_CACHE_EVICTIONS_METRICS.labels(evicted_key[0]).inc()
+
+        SCHEMA_HISTORY_CACHE_SIZE_METRICS.set(len(self._schemas))
+
+    def clear(self) -> None:
+        self._versions = {}
+        self._schemas = OrderedDict()
+        SCHEMA_HISTORY_CACHE_SIZE_METRICS.set(0)
@@ -13,6 +13,7 @@ from infrahub.core.models import (
     SchemaDiff,
 )
 from infrahub.core.node import Node
+from infrahub.core.query.schema import SchemaLastChangeQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import (
     AttributeSchema,
@@ -28,6 +29,7 @@ from infrahub.exceptions import SchemaNotFoundError
 from infrahub.log import get_logger
 
 from .constants import IGNORE_FOR_NODE
+from .history import SchemaHistoryCache
 from .schema_branch import SchemaBranch
 
 log = get_logger()
@@ -43,6 +45,7 @@ class SchemaManager(NodeManager):
     def __init__(self) -> None:
         self._cache: dict[int, Any] = {}
         self._branches: dict[str, SchemaBranch] = {}
+        self._history = SchemaHistoryCache()
 
     def _get_from_cache(self, key: int) -> Any:
         return self._cache[key]
@@ -545,15 +548,17 @@ class SchemaManager(NodeManager):
         """Load the schema either from the cache or from the database"""
         branch = await registry.get_branch(branch=branch, db=db)
 
-        if not branch.is_default and branch.origin_branch:
-            origin_branch: Branch = await registry.get_branch(branch=branch.origin_branch, db=db)
-
-            if origin_branch.schema_hash.main == branch.schema_hash.main:
-                origin_schema = self.get_schema_branch(name=origin_branch.name)
-                new_branch_schema = origin_schema.duplicate()
-                self.set_schema_branch(name=branch.name, schema=new_branch_schema)
-                log.info("Loading schema from cache")
-                return new_branch_schema
+        # If the same schema is already loaded for another branch, it has already been processed and can be shared
+        identical_schema = (
+            self._get_schema_branch_by_hash(schema_hash=branch.schema_hash.main, exclude=branch.name)
+            if branch.schema_hash
+            else None
+        )
+        if identical_schema:
+            new_branch_schema = identical_schema.duplicate(name=branch.name)
+            self.set_schema_branch(name=branch.name, schema=new_branch_schema)
+            log.info("Loading schema from cache", branch=branch.name, source_branch=identical_schema.name)
+            return new_branch_schema
 
         current_schema = self.get_schema_branch(name=branch.name)
         schema_diff = current_schema.get_hash_full().compare(branch.schema_hash)
@@ -564,6 +569,32 @@ class SchemaManager(NodeManager):
         self.set_schema_branch(name=branch.name, schema=branch_schema)
         return branch_schema
 
+    def _get_schema_branch_by_hash(self, schema_hash: str, exclude: Optional[str] = None) -> Optional[SchemaBranch]:
+        """Return the schema of a branch, other than `exclude`, with a given hash if one is loaded."""
+        for name, schema_branch in self._branches.items():
+            if name != exclude and schema_branch.get_hash() == schema_hash:
+                return schema_branch
+        return None
+
+    async def load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: Timestamp) -> SchemaBranch:
+        """Load the schema of a branch as it was at a given time.
+
+        The time of the last change of the schema before `at` is used to identify the version of the schema,
+        the past versions are kept in a LRU cache to avoid reloading the schema from the database for each query.
+        """
+        query = await SchemaLastChangeQuery.init(db=db, branch=branch, at=at)
+        await query.execute(db=db)
+        last_change = query.get_last_change()
+
+        version = (branch.name, branch.get_branched_from(), last_change.to_string() if last_change else "")
+        schema = self._history.get(version=version)
+        if schema:
+            return schema
+
+        schema = await self.load_schema_from_db(db=db, branch=branch, at=at)
+        self._history.set(version=version, schema=schema)
+        return schema
+
     async def load_schema_from_db(
         self,
         db: InfrahubDatabase,
@@ -639,7 +670,8 @@ class SchemaManager(NodeManager):
                     schema=await self.convert_node_schema_to_schema(schema_node=schema_node, db=db),
                 )
 
-        schema.process(validate_schema=validate_schema)
+        # When only a subset of the schema has been loaded, only these kinds and their dependents need to be processed again
+        schema.process(validate_schema=validate_schema, kinds=schema_diff.to_list() if has_filters else None)
 
         return schema
 
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+METRIC_PREFIX = "infrahub_schema"
+
+SCHEMA_HISTORY_CACHE_HITS_METRICS = Counter(
+    f"{METRIC_PREFIX}_history_cache_hits",
+    "Number of past versions of the schema served from the cache",
+    labelnames=["branch"],
+)
+SCHEMA_HISTORY_CACHE_MISSES_METRICS = Counter(
+    f"{METRIC_PREFIX}_history_cache_misses",
+    "Number of past versions of the schema that had to be loaded from the database",
+    labelnames=["branch"],
+)
+SCHEMA_HISTORY_CACHE_EVICTIONS_METRICS = Counter(
+    f"{METRIC_PREFIX}_history_cache_evictions",
+    "Number of past versions of the schema evicted from the cache",
+    labelnames=["branch"],
+)
+SCHEMA_HISTORY_CACHE_SIZE_METRICS = Gauge(
+    f"{METRIC_PREFIX}_history_cache_size",
+    "Number of past versions of the schema currently in the cache",
+)
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import copy
 import hashlib
 from collections import defaultdict
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Union
 
 from infrahub_sdk.topological_sort import DependencyCycleExistsError, topological_sort
 from infrahub_sdk.utils import compare_lists, deep_merge_dict, duplicates, intersection
 from typing_extensions import Self
 
+from infrahub import config
 from infrahub.core.constants import (
     RESERVED_ATTR_GEN_NAMES,
     RESERVED_ATTR_REL_NAMES,
@@ -46,6 +46,7 @@ from infrahub.core.schema.definitions.core import core_profile_schema_definition
 from infrahub.core.validators import CONSTRAINT_VALIDATOR_MAP
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
 from infrahub.graphql.manager import GraphQLSchemaManager
+from infrahub.graphql.schema_cache import GraphQLSchemaCacheEntry, graphql_schema_cache
 from infrahub.log import get_logger
 from infrahub.types import ATTRIBUTE_TYPES
 from infrahub.utils import format_label
@@ -59,6 +60,8 @@ if TYPE_CHECKING:
     from graphql import GraphQLSchema
     from pydantic import ValidationInfo
 
+    from infrahub.graphql.manager import GraphQLTypes
+
 
 # pylint: disable=redefined-builtin,too-many-public-methods,too-many-lines
 
@@ -71,7 +74,12 @@ class SchemaBranch:
         self.generics: dict[str, str] = {}
         self.profiles: dict[str, str] = {}
         self._graphql_schema: Optional[GraphQLSchema] = None
+        self._graphql_types: Optional[dict[str, GraphQLTypes]] = None
+        self._graphql_schema_hash: Optional[str] = None
         self._graphql_manager: Optional[GraphQLSchemaManager] = None
+        self._kinds_to_process: Optional[set[str]] = None
+        # Indicate if the dictionaries of kinds are shared with another SchemaBranch and must be copied before being modified
+        self._shared_data: bool = False
 
         if data:
             self.nodes = data.get("nodes", {})
@@ -161,13 +169,16 @@ class SchemaBranch:
                 node_hash = node.get_hash()
                 nodes[node_type][node_name] = node_hash
 
-                cache[node_hash] = node
+                cache[node_hash] = node.freeze()
 
         return cls(cache=cache, data=nodes)
 
     def clear_cache(self) -> None:
-        self._graphql_manager = None
+        # The GraphQL manager is preserved, on the next generation it will only regenerate the types
+        # of the kinds that have been modified since the previous one.
         self._graphql_schema = None
+        self._graphql_types = None
+        self._graphql_schema_hash = None
 
     def get_graphql_manager(self) -> GraphQLSchemaManager:
         if not self._graphql_manager:
@@ -182,14 +193,44 @@ class SchemaBranch:
         include_types: bool = True,
     ) -> GraphQLSchema:
         if not self._graphql_schema:
-            self._graphql_schema = self.get_graphql_manager().generate(
-                include_query=include_query,
-                include_mutation=include_mutation,
-                include_subscription=include_subscription,
-                include_types=include_types,
+            key = (
+                self.get_hash(),
+                config.SETTINGS.experimental_features.graphql_enums,
+                include_query,
+                include_mutation,
+                include_subscription,
+                include_types,
             )
+            entry = graphql_schema_cache.get(key=key, branch_name=str(self.name))
+            if not entry:
+                gqlm = self.get_graphql_manager()
+                graphql_schema = gqlm.generate(
+                    include_query=include_query,
+                    include_mutation=include_mutation,
+                    include_subscription=include_subscription,
+                    include_types=include_types,
+                )
+                # The manager works on a copy of its types on each generation, the current dict won't be modified anymore
+                entry = GraphQLSchemaCacheEntry(schema=graphql_schema, types=gqlm._graphql_types)
+                graphql_schema_cache.set(key=key, entry=entry)
+
+            self._graphql_schema = entry.schema
+            self._graphql_types = entry.types
+            self._graphql_schema_hash = key[0]
         return self._graphql_schema
 
+    def get_graphql_types(self) -> dict[str, GraphQLTypes]:
+        """Return the graphene types used to generate the current GraphQL schema."""
+        if self._graphql_types is None:
+            self.get_graphql_schema()
+        return self._graphql_types or {}
+
+    def get_graphql_schema_hash(self) -> str:
+        """Return the hash of the schema the current GraphQL schema has been generated from."""
+        if self._graphql_schema_hash is None:
+            self.get_graphql_schema()
+        return self._graphql_schema_hash or self.get_hash()
+
     def diff(self, other: SchemaBranch) -> SchemaDiff:
         # Identify the nodes or generics that have been added or removed
         local_kind_id_map = self.get_all_kind_id_map(exclude_profiles=True)
@@ -262,18 +303,38 @@ class SchemaBranch:
         return result
 
     def duplicate(self, name: Optional[str] = None) -> SchemaBranch:
-        """Duplicate the current object but conserve the same cache."""
-        return self.__class__(name=name, data=copy.deepcopy(self.to_dict()), cache=self._cache)
+        """Duplicate the current object but conserve the same cache.
+
+        The dictionaries of kinds are shared between both objects until one of them is modified.
+        """
+        new_schema = self.__class__(name=name, data=self.to_dict(), cache=self._cache)
+        self._shared_data = new_schema._shared_data = True
+        return new_schema
+
+    def _unshare_data(self) -> None:
+        """Copy the dictionaries of kinds if they are shared with another SchemaBranch, before modifying them."""
+        if not self._shared_data:
+            return
+        self.nodes = dict(self.nodes)
+        self.generics = dict(self.generics)
+        self.profiles = dict(self.profiles)
+        self._shared_data = False
 
     def set(self, name: str, schema: MainSchemaTypes) -> str:
         """Store a NodeSchema or GenericSchema associated with a specific name.
 
-        The object will be stored in the internal cache based on its hash value.
+        The object will be stored in the internal cache based on its hash value and frozen,
+        it must be duplicated before being modified again.
         If a schema with the same name already exist, it will be replaced
         """
         schema_hash = schema.get_hash()
         if schema_hash not in self._cache:
-            self._cache[schema_hash] = schema
+            self._cache[schema_hash] = schema.freeze()
+
+        if self._shared_data and schema_hash != (
+            self.nodes.get(name) or self.generics.get(name) or self.profiles.get(name)
+        ):
+            self._unshare_data()
 
         if "Node" in schema.__class__.__name__:
             self.nodes[name] = schema_hash
@@ -291,6 +352,7 @@ class SchemaBranch:
         by default the function always returns a copy of the object, not the object itself
 
         If duplicate is set to false, the real object will be returned.
+        Objects in the cache are frozen so the real object can be shared safely with read-only consumers.
         """
         key = None
         if name in self.nodes:
@@ -331,6 +393,7 @@ class SchemaBranch:
         return item
 
     def delete(self, name: str) -> None:
+        self._unshare_data()
         if name in self.nodes:
             del self.nodes[name]
         elif name in self.generics:
@@ -468,11 +531,53 @@ class SchemaBranch:
             new_item.update(node_extension)
             self.set(name=node_extension.kind, schema=new_item)
 
-    def process(self, validate_schema: bool = True) -> None:
-        self.process_pre_validation()
-        if validate_schema:
-            self.process_validate()
-        self.process_post_validation()
+    def process(self, validate_schema: bool = True, kinds: Optional[Iterable[str]] = None) -> None:
+        """Process and validate the schema.
+
+        If a list of kinds is provided, only these kinds and the kinds depending on them will be processed,
+        the other kinds are expected to have been processed already. The validations involving all kinds
+        together (identifiers, parent/component and required relationships) are always executed on the full schema.
+        """
+        self._kinds_to_process = self.get_kinds_to_process(kinds=kinds) if kinds is not None else None
+        try:
+            self.process_pre_validation()
+            if validate_schema:
+                self.process_validate()
+            self.process_post_validation()
+        finally:
+            self._kinds_to_process = None
+
+    def get_kinds_to_process(self, kinds: Iterable[str]) -> set[str]:
+        """Return the kinds that must be processed again after a change of the provided kinds.
+
+        In addition to the kinds themselves, it includes the nodes inheriting from them,
+        the nodes and generics with a relationship pointing to one of them and their profiles.
+        """
+        changed_kinds = {kind for kind in kinds if self.has(name=kind)}
+        kinds_to_process = set(changed_kinds)
+
+        for name in self.node_names:
+            node = self.get_node(name=name, duplicate=False)
+            if node.hierarchy in changed_kinds or changed_kinds.intersection(node.inherit_from):
+                kinds_to_process.add(name)
+
+        impacted_kinds = set(kinds_to_process)
+        for name in self.node_names + self.generic_names:
+            if name in impacted_kinds:
+                continue
+            node = self.get(name=name, duplicate=False)
+            if any(rel.peer in impacted_kinds for rel in node.relationships):
+                kinds_to_process.add(name)
+
+        kinds_to_process.update(
+            [self._get_profile_kind(node_kind=name) for name in kinds_to_process if name not in self.profiles]
+        )
+        return kinds_to_process
+
+    def _filter_kinds_to_process(self, names: Iterable[str]) -> list[str]:
+        if self._kinds_to_process is None:
+            return list(names)
+        return [name for name in names if name in self._kinds_to_process]
 
     def process_pre_validation(self) -> None:
         self.generate_identifiers()
@@ -510,7 +615,7 @@ class SchemaBranch:
 
     def generate_identifiers(self) -> None:
         """Generate the identifier for all relationships if it's not already present."""
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
             rels_missing_identifier = [rel.name for rel in node.relationships if rel.identifier is None]
             if not rels_missing_identifier:
@@ -648,7 +753,7 @@ class SchemaBranch:
         return schema_attribute_path
 
     def sync_uniqueness_constraints_and_unique_attributes(self) -> None:
-        for name in self.generic_names + self.node_names:
+        for name in self._filter_kinds_to_process(self.generic_names + self.node_names):
             node_schema = self.get(name=name, duplicate=False)
 
             if not node_schema.unique_attributes and not node_schema.uniqueness_constraints:
@@ -685,7 +790,7 @@ class SchemaBranch:
             self.set(name=name, schema=node_schema)
 
     def validate_uniqueness_constraints(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node_schema = self.get(name=name, duplicate=False)
 
             if not node_schema.uniqueness_constraints:
@@ -703,7 +808,7 @@ class SchemaBranch:
                     )
 
     def validate_display_labels(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node_schema = self.get(name=name, duplicate=False)
 
             if node_schema.display_labels:
@@ -723,10 +828,12 @@ class SchemaBranch:
 
                 if len(generic_display_labels) == 1:
                     # Only assign node display labels if a single generic has them defined
+                    node_schema = node_schema.duplicate()
                     node_schema.display_labels = generic_display_labels[0]
+                    self.set(name=name, schema=node_schema)
 
     def validate_order_by(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node_schema = self.get(name=name, duplicate=False)
 
             if not node_schema.order_by:
@@ -743,7 +850,7 @@ class SchemaBranch:
                 )
 
     def validate_default_filters(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node_schema = self.get(name=name, duplicate=False)
 
             if not node_schema.default_filter:
@@ -757,7 +864,7 @@ class SchemaBranch:
             )
 
     def validate_default_values(self) -> None:
-        for name in self.generic_names + self.node_names:
+        for name in self._filter_kinds_to_process(self.generic_names + self.node_names):
             node_schema = self.get(name=name, duplicate=False)
             for node_attr in node_schema.local_attributes:
                 if node_attr.default_value is None:
@@ -777,7 +884,7 @@ class SchemaBranch:
                     ) from exc
 
     def validate_human_friendly_id(self) -> None:
-        for name in self.generic_names + self.node_names:
+        for name in self._filter_kinds_to_process(self.generic_names + self.node_names):
             node_schema = self.get(name=name, duplicate=False)
             hf_attr_names = set()
 
@@ -876,7 +983,7 @@ class SchemaBranch:
             )
 
     def validate_names(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             if names_dup := duplicates(node.attribute_names + node.relationship_names):
@@ -899,7 +1006,7 @@ class SchemaBranch:
                     raise ValueError(f"{node.kind}: {rel.name} isn't allowed as a relationship name.")
 
     def validate_kinds(self) -> None:
-        for name in list(self.nodes.keys()):
+        for name in self._filter_kinds_to_process(self.nodes.keys()):
             node = self.get_node(name=name, duplicate=False)
 
             for generic_kind in node.inherit_from:
@@ -923,7 +1030,7 @@ class SchemaBranch:
 
     def validate_count_against_cardinality(self) -> None:
         """Validate every RelationshipSchema cardinality against the min_count and max_count."""
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             for rel in node.relationships:
@@ -943,18 +1050,17 @@ class SchemaBranch:
                         )
 
     def process_dropdowns(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
-            attributes = [attr for attr in node.attributes if attr.kind == "Dropdown"]
-            if not attributes:
+            if not any(attr.kind == "Dropdown" and attr.choices for attr in node.attributes):
                 continue
 
-            node = node.duplicate()
-            changed = False
+            # The choices are updated in place, they must come from a copy of the frozen object stored in the cache
+            updated_node = node.duplicate()
 
-            for attr in attributes:
-                if not attr.choices:
+            for attr in updated_node.attributes:
+                if attr.kind != "Dropdown" or not attr.choices:
                     continue
 
                 sorted_choices = sorted(attr.choices or [], key=lambda x: x.name, reverse=True)
@@ -967,12 +1073,10 @@ class SchemaBranch:
                     if not choice.description:
                         choice.description = ""
 
-                if attr.choices != sorted_choices:
-                    attr.choices = sorted_choices
-                    changed = True
+                attr.choices = sorted_choices
 
-            if changed:
-                self.set(name=name, schema=node)
+            if updated_node != node:
+                self.set(name=name, schema=updated_node)
 
     def process_labels(self) -> None:
         def check_if_need_to_update_label(node) -> bool:
@@ -983,7 +1087,7 @@ class SchemaBranch:
                     return True
             return False
 
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             if not check_if_need_to_update_label(node):
@@ -1004,7 +1108,7 @@ class SchemaBranch:
             self.set(name=name, schema=node)
 
     def process_relationships(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             schema_to_update: Optional[Union[NodeSchema, GenericSchema]] = None
@@ -1024,7 +1128,7 @@ class SchemaBranch:
                 self.set(name=schema_to_update.kind, schema=schema_to_update)
 
     def process_human_friendly_id(self) -> None:
-        for name in self.generic_names + self.node_names:
+        for name in self._filter_kinds_to_process(self.generic_names + self.node_names):
             node = self.get(name=name, duplicate=False)
 
             # If human_friendly_id IS NOT defined
@@ -1066,11 +1170,12 @@ class SchemaBranch:
                     elif schema_attribute_path.is_type_relationship:
                         uniqueness_constraints.append(schema_attribute_path.relationship_schema.name)
 
+                node = node.duplicate()
                 node.uniqueness_constraints = [uniqueness_constraints]
                 self.set(name=node.kind, schema=node)
 
     def process_hierarchy(self) -> None:
-        for name in self.nodes.keys():
+        for name in self._filter_kinds_to_process(self.nodes.keys()):
             node = self.get_node(name=name, duplicate=False)
 
             if not node.hierarchy and not node.parent and not node.children:
@@ -1122,6 +1227,12 @@ class SchemaBranch:
             if not node.inherit_from:
                 continue
 
+            if self._kinds_to_process is not None and name not in self._kinds_to_process:
+                # The node has already been processed, only the generics it inherits from need to be recorded
+                for generic_kind in node.inherit_from:
+                    generics_used_by[generic_kind].append(node.kind)
+                continue
+
             node = node.duplicate()
 
             if InfrahubKind.IPPREFIX in node.inherit_from and InfrahubKind.IPADDRESS in node.inherit_from:
@@ -1157,13 +1268,13 @@ class SchemaBranch:
 
         # Update all generics with the list of nodes referrencing them.
         for generic_name in self.generics.keys():
-            generic = self.get(name=generic_name)
-
-            if generic.kind in generics_used_by:
-                generic.used_by = sorted(generics_used_by[generic.kind])
-            else:
-                generic.used_by = []
+            generic = self.get(name=generic_name, duplicate=False)
+            used_by = sorted(generics_used_by.get(generic.kind, []))
+            if generic.used_by == used_by:
+                continue
 
+            generic = generic.duplicate()
+            generic.used_by = used_by
             self.set(name=generic_name, schema=generic)
 
     def process_branch_support(self) -> None:
@@ -1173,7 +1284,7 @@ class SchemaBranch:
         """
         # pylint: disable=too-many-branches
 
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             # Check if this node requires a change before duplicating
@@ -1215,7 +1326,7 @@ class SchemaBranch:
 
     def process_default_values(self) -> None:
         """Ensure that all attributes with a default value are flagged as optional: True."""
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             attr_names_to_update = [
@@ -1235,7 +1346,7 @@ class SchemaBranch:
         """Ensure that all relationships with a cardinality of ONE have a min_count and max_count of 1."""
         # pylint: disable=too-many-branches
 
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
 
             # Check if this node requires a change before duplicating
@@ -1280,7 +1391,7 @@ class SchemaBranch:
             self.set(name=name, schema=node)
 
     def generate_weight(self) -> None:
-        for name in self.all_names:
+        for name in self._filter_kinds_to_process(self.all_names):
             node = self.get(name=name, duplicate=False)
             items_to_update = [item for item in node.attributes + node.relationships if not item.order_weight]
             if not items_to_update:
@@ -1300,7 +1411,7 @@ class SchemaBranch:
         if not self.has(name=InfrahubKind.GENERICGROUP):
             return
 
-        for node_name in self.all_names:
+        for node_name in self._filter_kinds_to_process(self.all_names):
             schema: MainSchemaTypes = self.get(name=node_name, duplicate=False)
             changed = False
 
@@ -1347,7 +1458,7 @@ class SchemaBranch:
                 self.set(name=node_name, schema=schema)
 
     def add_hierarchy(self) -> None:
-        for generic_name in self.generics.keys():
+        for generic_name in self._filter_kinds_to_process(self.generics.keys()):
             generic = self.get_generic(name=generic_name, duplicate=False)
 
             if not generic.hierarchical:
@@ -1388,7 +1499,7 @@ class SchemaBranch:
 
             self.set(name=generic_name, schema=generic)
 
-        for node_name in self.nodes.keys():
+        for node_name in self._filter_kinds_to_process(self.nodes.keys()):
             node = self.get_node(name=node_name, duplicate=False)
 
             if node.parent is None and node.children is None:
@@ -1438,7 +1549,7 @@ class SchemaBranch:
             core_profile_schema = self.get(name=InfrahubKind.PROFILE, duplicate=False)
 
         profile_schema_kinds = set()
-        for node_name in self.node_names + self.generic_names:
+        for node_name in self._filter_kinds_to_process(self.node_names + self.generic_names):
             node = self.get(name=node_name, duplicate=False)
             if node.namespace in RESTRICTED_NAMESPACES or not node.generate_profile:
                 try:
@@ -1450,6 +1561,10 @@ class SchemaBranch:
             profile = self.generate_profile_from_node(node=node)
             self.set(name=profile.kind, schema=profile)
             profile_schema_kinds.add(profile.kind)
+
+        if self._kinds_to_process is not None:
+            # The profiles of the kinds that have not been processed again are still valid
+            profile_schema_kinds.update(self.profile_names)
         if not profile_schema_kinds:
             return
 
@@ -1475,7 +1590,7 @@ class SchemaBranch:
                 self.set(name=InfrahubKind.NODE, schema=core_node_schema)
 
     def manage_profile_relationships(self) -> None:
-        for node_name in self.node_names + self.generic_names:
+        for node_name in self._filter_kinds_to_process(self.node_names + self.generic_names):
             node = self.get(name=node_name, duplicate=False)
 
             if node.namespace in RESTRICTED_NAMESPACES:
@@ -1,17 +1,36 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+import pendulum
 from infrahub_sdk.timestamp import Timestamp as BaseTimestamp
 
+from infrahub import config
+
 if TYPE_CHECKING:
     from pendulum.datetime import DateTime
 
 
 class Timestamp(BaseTimestamp):
+    def __init__(self, value: Optional[Union[str, int, DateTime, BaseTimestamp]] = None):
+        # An integer is a time stored in the graph as a number of microseconds since the epoch
+        if isinstance(value, int):
+            seconds, microseconds = divmod(value, 1_000_000)
+            value = pendulum.from_timestamp(seconds, tz="UTC").set(microsecond=microseconds)
+        super().__init__(value)
+
     async def to_graphql(self, *args: Any, **kwargs: Any) -> DateTime:  # pylint: disable=unused-argument
         return self.obj
 
+    def to_epoch_microseconds(self) -> int:
+        return self.obj.int_timestamp * 1_000_000 + self.obj.microsecond
+
+    def to_graph(self) -> Union[str, int]:
+        """Return the time in the format of the from and to properties of the relationships of the graph."""
+        if config.SETTINGS.database.temporal_format == config.TemporalFormat.EPOCH_MICROSECONDS:
+            return self.to_epoch_microseconds()
+        return self.to_string()
+
     def get_query_filter_path(self, rel_name: str = "r") -> tuple[str, dict]:
         """
         Generate a CYPHER Query filter based on a path to query a part of the graph at a specific time on all branches.
@@ -19,7 +38,7 @@ class Timestamp(BaseTimestamp):
         There is a currently an assumption that the relationship in the path will be named 'r'
         """
 
-        params = {"at": self.to_string()}
+        params = {"at": self.to_graph()}
 
         filters = [
             f"({rel_name}.from <= $at AND {rel_name}.to IS NULL)",
@@ -5,10 +5,12 @@ import re
 from inspect import isclass
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+from infrahub.config import TemporalFormat
 from infrahub.core.constants import RelationshipStatus
 from infrahub.core.models import NodeKind
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
+from infrahub.database.constants import DatabaseType
 
 if TYPE_CHECKING:
     from neo4j import Record
@@ -40,7 +42,7 @@ async def add_relationship(
     params = {
         "src_node_id": db.to_database_id(src_node_id),
         "dst_node_id": db.to_database_id(dst_node_id),
-        "at": at.to_string(),
+        "at": at.to_graph(),
         "branch": branch_name or registry.default_branch,
         "branch_level": branch_level or 1,
         "status": status.value,
@@ -75,11 +77,52 @@ async def update_relationships_to(ids: list[str], db: InfrahubDatabase, to: Time
     RETURN %(id_func)s(r)
     """ % {"id_func": db.get_id_function_name()}
 
-    params = {"to": to.to_string(), "ids": [db.to_database_id(_id) for _id in ids]}
+    params = {"to": to.to_graph(), "ids": [db.to_database_id(_id) for _id in ids]}
 
     return await db.execute_query(query=query, params=params, name="update_relationships_to")
 
 
+def get_temporal_format_filter(db: InfrahubDatabase, value: str, temporal_format: TemporalFormat) -> str:
+    """Return a CYPHER predicate matching the times stored with the given temporal format."""
+    value_type = "INTEGER" if temporal_format == TemporalFormat.EPOCH_MICROSECONDS else "STRING"
+    if db.db_type == DatabaseType.MEMGRAPH:
+        return f'valueType({value}) = "{value_type}"'
+    return f"{value} IS :: {value_type} NOT NULL"
+
+
+async def count_relationships_with_temporal_format(
+    db: InfrahubDatabase, temporal_format: TemporalFormat, limit: Optional[int] = None
+) -> int:
+    """Count the relationships with a from or a to property stored with the given temporal format."""
+    query = """
+    MATCH ()-[r]->()
+    WHERE %(from_filter)s OR %(to_filter)s
+    WITH r
+    %(limit)s
+    RETURN count(r)
+    """ % {
+        "from_filter": get_temporal_format_filter(db=db, value="r.from", temporal_format=temporal_format),
+        "to_filter": get_temporal_format_filter(db=db, value="r.to", temporal_format=temporal_format),
+        "limit": f"LIMIT {int(limit)}" if limit else "",
+    }
+
+    results = await db.execute_query(query=query, name="count_relationships_with_temporal_format")
+    return results[0][0]
+
+
+async def get_temporal_formats(db: InfrahubDatabase) -> set[TemporalFormat]:
+    """Return the formats of the times stored in the relationships of the database.
+
+    More than one format is returned for a database partially converted by the graph migrations,
+    none for an empty database.
+    """
+    return {
+        temporal_format
+        for temporal_format in TemporalFormat
+        if await count_relationships_with_temporal_format(db=db, temporal_format=temporal_format, limit=1)
+    }
+
+
 async def get_paths_between_nodes(
     db: InfrahubDatabase,
     source_id: str,
@@ -16,6 +16,7 @@ class Neo4jRuntime(str, Enum):
 
 class IndexType(str, Enum):
     TEXT = "text"
+    FULLTEXT = "fulltext"
     RANGE = "range"
     LOOKUP = "lookup"
     NOT_APPLICABLE = "not_applicable"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from pydantic import BaseModel
 
@@ -25,6 +25,10 @@ class IndexItem(BaseModel):
     properties: list[str]
     type: IndexType
 
+    @property
+    def index_name(self) -> str:
+        return self.name
+
     def get_add_query(self) -> str:
         raise NotImplementedError()
 
@@ -49,6 +53,13 @@ class IndexManagerBase(ABC):
     def items(self) -> list[IndexItem]:
         return self.nodes + self.rels
 
+    def get_item(self, name: str, type: IndexType) -> Optional[IndexItem]:  # pylint: disable=redefined-builtin
+        """Return the index with this name and this type if it's managed by this database."""
+        for item in self.items:
+            if item.name == name and item.type == type:
+                return item
+        return None
+
     async def add(self) -> None:
         async with self.db.start_transaction() as dbt:
             for item in self.items:
@@ -3,8 +3,9 @@ from __future__ import annotations
 import os
 import shutil
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, NoReturn, Optional, Union
+from typing import TYPE_CHECKING, Iterator, NoReturn, Optional, Union
 from uuid import UUID  # noqa: TCH003
 
 import git
@@ -29,7 +30,7 @@ from infrahub.exceptions import (
 )
 from infrahub.git.constants import BRANCHES_DIRECTORY_NAME, COMMITS_DIRECTORY_NAME, TEMPORARY_DIRECTORY_NAME
 from infrahub.git.directory import initialize_repositories_directory
-from infrahub.git.worktree import Worktree
+from infrahub.git.worktree import COMMIT_WORKTREES_IN_USE, WORKTREE_INDEXES, Worktree, WorktreeIndex
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices  # noqa: TCH001
 
@@ -310,6 +311,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         # Check if the root, commits and branches directories are already present, create them if needed
         if os.path.isdir(self.directory_root):
             shutil.rmtree(self.directory_root)
+            self.invalidate_worktree_index()
             log.warning(f"Found an existing directory at {self.directory_root}, deleted it", repository=self.name)
         elif os.path.isfile(self.directory_root):
             os.remove(self.directory_root)
@@ -340,43 +342,97 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
     def has_worktree(self, identifier: str) -> bool:
         """Return True if a worktree with a given identifier already exist."""
 
-        worktrees = self.get_worktrees()
-
-        for worktree in worktrees:
-            if worktree.identifier == identifier:
-                return True
-
-        return False
+        return self._find_worktree(identifier=identifier) is not None
 
     def get_worktree(self, identifier: str) -> Worktree:
         """Access a specific worktree by its identifier."""
 
-        worktrees = self.get_worktrees()
-        for worktree in worktrees:
-            if worktree.identifier == identifier:
-                return worktree
+        if worktree := self._find_worktree(identifier=identifier):
+            return worktree
 
         raise RepositoryError(identifier=identifier, message="Unble to get worktree")
 
     def get_commit_worktree(self, commit: str) -> Worktree:
         """Access a specific commit worktree."""
 
-        worktrees = self.get_worktrees()
-
-        for worktree in worktrees:
-            if worktree.identifier == commit:
-                return worktree
+        if worktree := self._find_worktree(identifier=commit):
+            return worktree
 
         # if not worktree exist for this commit already
         # We'll try to create one
         return self.create_commit_worktree(commit=commit)
 
+    @contextmanager
+    def use_commit_worktree(self, commit: str) -> Iterator[Worktree]:
+        """Access a specific commit worktree and protect it from being removed until the end of the context.
+
+        The commit worktrees in use are only tracked within this process.
+        """
+        commit_worktrees_in_use = COMMIT_WORKTREES_IN_USE[self.directory_root]
+        commit_worktrees_in_use[commit] += 1
+        try:
+            yield self.get_commit_worktree(commit=commit)
+        finally:
+            commit_worktrees_in_use[commit] -= 1
+            if not commit_worktrees_in_use[commit]:
+                del commit_worktrees_in_use[commit]
+
     def get_worktrees(self) -> list[Worktree]:
         """Return the list of worktrees configured for this repository."""
         repo = self.get_git_repo_main()
         responses = repo.git.worktree("list", "--porcelain").split("\n\n")
 
-        return [Worktree.init(response) for response in responses]
+        worktrees = [Worktree.init(response) for response in responses]
+        if worktree_index := WORKTREE_INDEXES.get(self.directory_root):
+            worktree_index.refresh(worktrees=worktrees)
+        else:
+            WORKTREE_INDEXES[self.directory_root] = WorktreeIndex(worktrees=worktrees)
+        return worktrees
+
+    def invalidate_worktree_index(self) -> None:
+        """Discard the worktrees indexed for this repository, they will be listed again on the next access."""
+        WORKTREE_INDEXES.pop(self.directory_root, None)
+
+    def _find_worktree(self, identifier: str) -> Optional[Worktree]:
+        worktree_index = WORKTREE_INDEXES.get(self.directory_root)
+        if worktree_index and (worktree := worktree_index.get(identifier=identifier)):
+            if os.path.isdir(worktree.directory):
+                return worktree
+            # The worktree has been removed outside of this process
+            worktree_index.remove(identifier=identifier)
+
+        # The worktree might have been created outside of this process
+        for worktree in self.get_worktrees():
+            if worktree.identifier == identifier:
+                return WORKTREE_INDEXES[self.directory_root].get(identifier=identifier)
+        return None
+
+    def _evict_commit_worktrees(self, protected_commit: str) -> None:
+        """Remove the least recently used commit worktrees above the maximum number configured.
+
+        The protected commit and the commit worktrees in use in this process are never removed.
+        """
+        max_commit_worktrees = config.SETTINGS.git.max_commit_worktrees
+        worktree_index = WORKTREE_INDEXES.get(self.directory_root)
+        if not max_commit_worktrees or not worktree_index:
+            return
+
+        # Refresh the index to protect the commits currently checked out in the main and branch worktrees
+        self.get_worktrees()
+        repo = self.get_git_repo_main()
+        protected_commits = set(COMMIT_WORKTREES_IN_USE.get(self.directory_root, {})) | {protected_commit}
+        for worktree in worktree_index.get_commit_worktrees_to_evict(
+            max_commit_worktrees=max_commit_worktrees, protected_commits=protected_commits
+        ):
+            try:
+                repo.git.worktree("remove", "--force", worktree.directory)
+            except GitCommandError as exc:
+                log.warning(
+                    f"Unable to remove the commit worktree {worktree.commit}", repository=self.name, error=exc.stderr
+                )
+                continue
+            worktree_index.remove(identifier=worktree.identifier)
+            log.debug(f"Commit worktree removed {worktree.commit}", repository=self.name)
 
     async def get_branches_from_graph(self) -> dict[str, BranchInGraph]:
         """Return a dict with all the branches present in the graph.
@@ -499,6 +555,8 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         try:
             repo.git.worktree("add", directory, commit)
             log.debug(f"Commit worktree created {commit}", repository=self.name)
+            WORKTREE_INDEXES[self.directory_root].add(worktree=worktree)
+            self._evict_commit_worktrees(protected_commit=commit)
             return worktree
         except GitCommandError as exc:
             if "invalid reference" in exc.stderr:
@@ -520,6 +578,8 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             repo.git.worktree("add", os.path.join(self.directory_branches, branch_id), branch_name)
         except GitCommandError as exc:
             raise RepositoryError(identifier=self.name, message=exc.stderr) from exc
+        finally:
+            self.invalidate_worktree_index()
 
         log.debug(f"Branch worktree created {branch_name}", repository=self.name)
         return True
@@ -569,6 +629,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc)
 
+        self.invalidate_worktree_index()
         return True
 
     async def compare_local_remote(self) -> tuple[list[str], list[str]]:
@@ -706,10 +767,12 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         return files
 
     async def get_file(self, commit: str, location: str) -> str:
-        commit_worktree = self.get_commit_worktree(commit=commit)
-        path = self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
+        with self.use_commit_worktree(commit=commit) as commit_worktree:
+            path = self.validate_location(
+                commit=commit, worktree_directory=commit_worktree.directory, file_path=location
+            )
 
-        return path.read_text(encoding="UTF-8")
+            return path.read_text(encoding="UTF-8")
 
     def validate_location(self, commit: str, worktree_directory: str, file_path: str) -> Path:
         """Validate that a file is found inside a repository and return a corresponding `pathlib.Path` object for it."""
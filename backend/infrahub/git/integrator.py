@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import importlib
 import os
@@ -7,7 +8,6 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-import jinja2
 import ujson
 import yaml
 from infrahub_sdk import InfrahubClient  # noqa: TCH002
@@ -37,6 +37,7 @@ from pydantic import ValidationError as PydanticValidationError
 from infrahub.core.constants import InfrahubKind, RepositorySyncStatus
 from infrahub.exceptions import CheckError, TransformError
 from infrahub.git.base import InfrahubRepositoryBase, extract_repo_file_information
+from infrahub.git.template_cache import jinja2_environment_cache, render_template
 from infrahub.log import get_logger
 
 if TYPE_CHECKING:
@@ -131,39 +132,42 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         if not commit:
             commit = self.get_commit_value(branch_name=git_branch_name or infrahub_branch_name)
 
-        self.create_commit_worktree(commit)
-        await self._update_sync_status(branch_name=infrahub_branch_name, status=RepositorySyncStatus.SYNCING)
+        # The commit worktree must not be removed by the creation of other commit worktrees during the import
+        with self.use_commit_worktree(commit=commit):
+            await self._update_sync_status(branch_name=infrahub_branch_name, status=RepositorySyncStatus.SYNCING)
 
-        config_file = await self.get_repository_config(branch_name=infrahub_branch_name, commit=commit)
-        sync_status = RepositorySyncStatus.IN_SYNC if config_file else RepositorySyncStatus.ERROR_IMPORT
-        error: Exception | None = None
+            config_file = await self.get_repository_config(branch_name=infrahub_branch_name, commit=commit)
+            sync_status = RepositorySyncStatus.IN_SYNC if config_file else RepositorySyncStatus.ERROR_IMPORT
+            error: Exception | None = None
 
-        try:
-            if config_file:
-                await self.import_schema_files(branch_name=infrahub_branch_name, commit=commit, config_file=config_file)
-
-                await self.import_all_graphql_query(
-                    branch_name=infrahub_branch_name, commit=commit, config_file=config_file
-                )
-
-                await self.import_all_python_files(
-                    branch_name=infrahub_branch_name, commit=commit, config_file=config_file
-                )
-                await self.import_jinja2_transforms(
-                    branch_name=infrahub_branch_name, commit=commit, config_file=config_file
-                )
-                await self.import_artifact_definitions(
-                    branch_name=infrahub_branch_name, commit=commit, config_file=config_file
-                )
-
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            sync_status = RepositorySyncStatus.ERROR_IMPORT
-            error = exc
-
-        await self._update_sync_status(branch_name=infrahub_branch_name, status=sync_status)
-
-        if error:
-            raise error
+            try:
+                if config_file:
+                    await self.import_schema_files(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+
+                    await self.import_all_graphql_query(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+
+                    await self.import_all_python_files(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+                    await self.import_jinja2_transforms(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+                    await self.import_artifact_definitions(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                sync_status = RepositorySyncStatus.ERROR_IMPORT
+                error = exc
+
+            await self._update_sync_status(branch_name=infrahub_branch_name, status=sync_status)
+
+            if error:
+                raise error
 
     async def _update_sync_status(self, branch_name: str, status: RepositorySyncStatus) -> None:
         update_status = """
@@ -1109,18 +1113,19 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         await self.import_generator_definitions(branch_name=branch_name, commit=commit, config_file=config_file)
 
     async def render_jinja2_template(self, commit: str, location: str, data: dict) -> str:
-        commit_worktree = self.get_commit_worktree(commit=commit)
-
-        self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
+        with self.use_commit_worktree(commit=commit) as commit_worktree:
+            self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
-        try:
-            templateLoader = jinja2.FileSystemLoader(searchpath=commit_worktree.directory)
-            templateEnv = jinja2.Environment(loader=templateLoader, trim_blocks=True, lstrip_blocks=True)
-            template = templateEnv.get_template(location)
-            return template.render(**data)
-        except Exception as exc:
-            log.error(str(exc), exc_info=True, repository=self.name, commit=commit, location=location)
-            raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
+            try:
+                environment = jinja2_environment_cache.get(
+                    repository_name=self.name, commit=commit, directory=commit_worktree.directory
+                )
+                return await asyncio.to_thread(render_template, environment, location, data)
+            except Exception as exc:
+                log.error(str(exc), exc_info=True, repository=self.name, commit=commit, location=location)
+                raise TransformError(
+                    repository_name=self.name, commit=commit, location=location, message=str(exc)
+                ) from exc
 
     async def execute_python_check(
         self,
@@ -1133,66 +1138,73 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     ) -> InfrahubCheck:
         """Execute A Python Check stored in the repository."""
 
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        with self.use_commit_worktree(commit=commit) as commit_worktree:
+            self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
-        self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
+            # Ensure the path for this repository is present in sys.path
+            if self.directory_root not in sys.path:
+                sys.path.append(self.directory_root)
 
-        # Ensure the path for this repository is present in sys.path
-        if self.directory_root not in sys.path:
-            sys.path.append(self.directory_root)
+            try:
+                file_info = extract_repo_file_information(
+                    full_filename=os.path.join(commit_worktree.directory, location),
+                    repo_directory=self.directory_root,
+                    worktree_directory=commit_worktree.directory,
+                )
 
-        try:
-            file_info = extract_repo_file_information(
-                full_filename=os.path.join(commit_worktree.directory, location),
-                repo_directory=self.directory_root,
-                worktree_directory=commit_worktree.directory,
-            )
+                module = importlib.import_module(file_info.module_name)
 
-            module = importlib.import_module(file_info.module_name)
+                check_class: InfrahubCheck = getattr(module, class_name)
 
-            check_class: InfrahubCheck = getattr(module, class_name)
+                check = await check_class.init(
+                    root_directory=commit_worktree.directory, branch=branch_name, client=client, params=params
+                )
+                await check.run()
 
-            check = await check_class.init(
-                root_directory=commit_worktree.directory, branch=branch_name, client=client, params=params
-            )
-            await check.run()
+                return check
 
-            return check
+            except ModuleNotFoundError as exc:
+                error_msg = "Unable to load the check file"
+                log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+                raise CheckError(
+                    repository_name=self.name,
+                    class_name=class_name,
+                    commit=commit,
+                    location=location,
+                    message=error_msg,
+                ) from exc
 
-        except ModuleNotFoundError as exc:
-            error_msg = "Unable to load the check file"
-            log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
-            raise CheckError(
-                repository_name=self.name, class_name=class_name, commit=commit, location=location, message=error_msg
-            ) from exc
+            except AttributeError as exc:
+                error_msg = f"Unable to find the class {class_name}"
+                log.error(
+                    error_msg,
+                    repository=self.name,
+                    branch=branch_name,
+                    commit=commit,
+                    class_name=class_name,
+                    location=location,
+                )
+                raise CheckError(
+                    repository_name=self.name,
+                    class_name=class_name,
+                    commit=commit,
+                    location=location,
+                    message=error_msg,
+                ) from exc
 
-        except AttributeError as exc:
-            error_msg = f"Unable to find the class {class_name}"
-            log.error(
-                error_msg,
-                repository=self.name,
-                branch=branch_name,
-                commit=commit,
-                class_name=class_name,
-                location=location,
-            )
-            raise CheckError(
-                repository_name=self.name, class_name=class_name, commit=commit, location=location, message=error_msg
-            ) from exc
-
-        except Exception as exc:
-            log.critical(
-                str(exc),
-                exc_info=True,
-                repository=self.name,
-                branch=branch_name,
-                commit=commit,
-                class_name=class_name,
-                location=location,
-            )
-            raise CheckError(
-                repository_name=self.name, class_name=class_name, commit=commit, location=location, message=str(exc)
-            ) from exc
+            except Exception as exc:
+                log.critical(
+                    str(exc),
+                    exc_info=True,
+                    repository=self.name,
+                    branch=branch_name,
+                    commit=commit,
+                    class_name=class_name,
+                    location=location,
+                )
+                raise CheckError(
+                    repository_name=self.name, class_name=class_name, commit=commit, location=location, message=str(exc)
+                ) from exc
 
     async def execute_python_transform(
         self, branch_name: str, commit: str, location: str, client: InfrahubClient, data: Optional[dict] = None
@@ -1203,57 +1215,58 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             raise ValueError("Transformation location not valid, it must contains a double colons (::)")
 
         file_path, class_name = location.split("::")
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        with self.use_commit_worktree(commit=commit) as commit_worktree:
+            log.debug(
+                f"Will run Python Transform from {class_name} at {location}",
+                repository=self.name,
+                branch=branch_name,
+                commit=commit,
+                location=location,
+            )
 
-        log.debug(
-            f"Will run Python Transform from {class_name} at {location}",
-            repository=self.name,
-            branch=branch_name,
-            commit=commit,
-            location=location,
-        )
+            self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=file_path)
 
-        self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=file_path)
+            # Ensure the path for this repository is present in sys.path
+            if self.directory_root not in sys.path:
+                sys.path.append(self.directory_root)
 
-        # Ensure the path for this repository is present in sys.path
-        if self.directory_root not in sys.path:
-            sys.path.append(self.directory_root)
+            try:
+                file_info = extract_repo_file_information(
+                    full_filename=os.path.join(commit_worktree.directory, file_path),
+                    repo_directory=self.directory_root,
+                    worktree_directory=commit_worktree.directory,
+                )
 
-        try:
-            file_info = extract_repo_file_information(
-                full_filename=os.path.join(commit_worktree.directory, file_path),
-                repo_directory=self.directory_root,
-                worktree_directory=commit_worktree.directory,
-            )
+                module = importlib.import_module(file_info.module_name)
 
-            module = importlib.import_module(file_info.module_name)
+                transform_class: InfrahubTransform = getattr(module, class_name)
 
-            transform_class: InfrahubTransform = getattr(module, class_name)
+                transform = await transform_class.init(
+                    root_directory=commit_worktree.directory, branch=branch_name, client=client
+                )
+                return await transform.run(data=data)
 
-            transform = await transform_class.init(
-                root_directory=commit_worktree.directory, branch=branch_name, client=client
-            )
-            return await transform.run(data=data)
-
-        except ModuleNotFoundError as exc:
-            error_msg = f"Unable to load the transform file {location}"
-            log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
-            raise TransformError(
-                repository_name=self.name, commit=commit, location=location, message=error_msg
-            ) from exc
-
-        except AttributeError as exc:
-            error_msg = f"Unable to find the class {class_name} in {location}"
-            log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
-            raise TransformError(
-                repository_name=self.name, commit=commit, location=location, message=error_msg
-            ) from exc
-
-        except Exception as exc:
-            log.critical(
-                str(exc), exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location
-            )
-            raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
+            except ModuleNotFoundError as exc:
+                error_msg = f"Unable to load the transform file {location}"
+                log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+                raise TransformError(
+                    repository_name=self.name, commit=commit, location=location, message=error_msg
+                ) from exc
+
+            except AttributeError as exc:
+                error_msg = f"Unable to find the class {class_name} in {location}"
+                log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+                raise TransformError(
+                    repository_name=self.name, commit=commit, location=location, message=error_msg
+                ) from exc
+
+            except Exception as exc:
+                log.critical(
+                    str(exc), exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location
+                )
+                raise TransformError(
+                    repository_name=self.name, commit=commit, location=location, message=str(exc)
+                ) from exc
 
     async def artifact_generate(
         self,
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+import jinja2
+
+from infrahub import config
+
+# (name of the repository, commit, directory of the worktree)
+Jinja2EnvironmentCacheKey = tuple[str, str, str]
+
+
+class Jinja2EnvironmentCache:
+    """LRU cache of the Jinja2 environments used to render the templates of a commit of a repository.
+
+    A commit is immutable, so the templates compiled by an environment are reused for every render without checking
+    if the files have changed. The directory is part of the key as the same commit can be checked out in different
+    locations, by several repositories sharing a name in different test runs for example.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Jinja2EnvironmentCacheKey, jinja2.Environment] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.git.jinja2_environment_cache_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, repository_name: str, commit: str, directory: str) -> jinja2.Environment:
+        """Return the environment of a commit, loading the templates from the directory of its worktree."""
+        key = (repository_name, commit, directory)
+        environment = self._entries.get(key)
+        if environment is not None:
+            self._entries.move_to_end(key)
+            return environment
+
+        environment = self._build_environment(directory=directory)
+        if self.max_size <= 0:
+            return environment
+
+        self._entries[key] = environment
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return environment
+
+    def clear(self) -> None:
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def _build_environment(directory: str) -> jinja2.Environment:
+        bytecode_cache: Optional[jinja2.BytecodeCache] = None
+        if bytecode_cache_directory := config.SETTINGS.git.jinja2_bytecode_cache_directory:
+            os.makedirs(bytecode_cache_directory, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(directory=bytecode_cache_directory)
+
+        return jinja2.Environment(
+            loader=jinja2.FileSystemLoader(searchpath=directory),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+
+
+def render_template(environment: jinja2.Environment, location: str, data: dict[str, Any]) -> str:
+    """Load, compile if needed, and render a template, meant to be run outside of the event loop."""
+    template = environment.get_template(location)
+    return template.render(**data)
+
+
+jinja2_environment_cache = Jinja2EnvironmentCache()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter, OrderedDict, defaultdict
 from typing import Optional
 
 from pydantic import BaseModel
@@ -15,6 +16,10 @@ class Worktree(BaseModel):
     commit: str
     branch: Optional[str] = None
 
+    @property
+    def is_commit_worktree(self) -> bool:
+        return self.branch is None and self.identifier == self.commit
+
     @classmethod
     def init(cls, text: str) -> Worktree:
         lines = text.split("\n")
@@ -50,3 +55,69 @@ class Worktree(BaseModel):
             item.branch = lines[2].replace("branch refs/heads/", "")
 
         return item
+
+
+class WorktreeIndex:
+    """In-process index of the worktrees of a repository, to avoid listing them with git on each access.
+
+    The worktrees are ordered from the least to the most recently accessed.
+    """
+
+    def __init__(self, worktrees: list[Worktree]) -> None:
+        self._worktrees: OrderedDict[str, Worktree] = OrderedDict(
+            (worktree.identifier, worktree) for worktree in worktrees
+        )
+
+    def get(self, identifier: str) -> Optional[Worktree]:
+        worktree = self._worktrees.get(identifier)
+        if worktree:
+            self._worktrees.move_to_end(identifier)
+        return worktree
+
+    def add(self, worktree: Worktree) -> None:
+        self._worktrees[worktree.identifier] = worktree
+        self._worktrees.move_to_end(worktree.identifier)
+
+    def remove(self, identifier: str) -> None:
+        self._worktrees.pop(identifier, None)
+
+    def refresh(self, worktrees: list[Worktree]) -> None:
+        """Replace the worktrees of the index, keeping the access order of the ones already known."""
+        current = {worktree.identifier: worktree for worktree in worktrees}
+        for identifier in list(self._worktrees):
+            if identifier in current:
+                self._worktrees[identifier] = current.pop(identifier)
+            else:
+                del self._worktrees[identifier]
+        for identifier, worktree in current.items():
+            self._worktrees[identifier] = worktree
+            self._worktrees.move_to_end(identifier, last=False)
+
+    def get_commit_worktrees_to_evict(
+        self, max_commit_worktrees: int, protected_commits: Optional[set[str]] = None
+    ) -> list[Worktree]:
+        """Return the least recently used commit worktrees above the maximum number allowed.
+
+        The commits checked out in the main or branch worktrees and the protected commits are never returned,
+        the protected commit worktrees are still counted in the number of commit worktrees.
+        """
+        checked_out_commits = {
+            worktree.commit for worktree in self._worktrees.values() if not worktree.is_commit_worktree
+        }
+        commit_worktrees = [
+            worktree
+            for worktree in self._worktrees.values()
+            if worktree.is_commit_worktree and worktree.commit not in checked_out_commits
+        ]
+        evictable_worktrees = [
+            worktree for worktree in commit_worktrees if worktree.commit not in (protected_commits or set())
+        ]
+        return evictable_worktrees[: max(len(commit_worktrees) - max_commit_worktrees, 0)]
+
+
+# Index of the worktrees of each repository, by directory of the repository
+WORKTREE_INDEXES: dict[str, WorktreeIndex] = {}
+
+# Number of users of each commit worktree in this process, by directory of the repository
+# These worktrees are never removed when the number of commit worktrees is above the maximum
+COMMIT_WORKTREES_IN_USE: defaultdict[str, Counter[str]] = defaultdict(Counter)
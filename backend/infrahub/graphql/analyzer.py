@@ -1,33 +1,115 @@
+from inspect import isawaitable
 from typing import Any, Optional
 
-from graphql import GraphQLSchema, OperationType
-from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
+from graphql import (
+    ExecutionContext,
+    ExecutionResult,
+    GraphQLError,
+    GraphQLSchema,
+    Middleware,
+    OperationType,
+    execute,
+    parse,
+)
+from infrahub_sdk.analyzer import GraphQLOperation, GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
 from infrahub.core.branch import Branch
+from infrahub.graphql.document_cache import GraphQLDocumentCacheEntry, graphql_document_cache
 from infrahub.graphql.utils import extract_schema_models
 
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
-    def __init__(
+    def __init__(  # pylint: disable=super-init-not-called
         self,
         query: str,
         query_variables: Optional[dict[str, Any]] = None,
         schema: Optional[GraphQLSchema] = None,
         operation_name: Optional[str] = None,
         branch: Optional[Branch] = None,
+        document: Optional[GraphQLDocumentCacheEntry] = None,
     ) -> None:
         self.branch: Optional[Branch] = branch
         self.operation_name: Optional[str] = operation_name
         self.query_variables: dict[str, Any] = query_variables or {}
-        super().__init__(query=query, schema=schema)
+        # The parent class is not initialized to avoid parsing the query again when it's already available in the cache
+        self.query: str = query
+        self.schema: Optional[GraphQLSchema] = schema
+        self.cache_entry = document or GraphQLDocumentCacheEntry(document=parse(query))
+        self.document = self.cache_entry.document
+        self._fields: Optional[dict] = self.cache_entry.fields
+
+    @classmethod
+    def from_cache(
+        cls,
+        query: str,
+        schema_hash: str,
+        query_variables: Optional[dict[str, Any]] = None,
+        schema: Optional[GraphQLSchema] = None,
+        operation_name: Optional[str] = None,
+        branch: Optional[Branch] = None,
+    ) -> "InfrahubGraphQLQueryAnalyzer":
+        """Initialize the analyzer with the document and the results of a previous analysis of the same query for the same schema."""
+        document = graphql_document_cache.get(
+            schema_hash=schema_hash,
+            query=query,
+            operation_name=operation_name,
+            branch_name=branch.name if branch else "",
+            include_mutation=schema is None or schema.mutation_type is not None,
+            include_subscription=schema is None or schema.subscription_type is not None,
+        )
+        return cls(
+            query=query,
+            query_variables=query_variables,
+            schema=schema,
+            operation_name=operation_name,
+            branch=branch,
+            document=document,
+        )
+
+    @property
+    def is_valid(self) -> tuple[bool, Optional[list[GraphQLError]]]:
+        if self.schema is None:
+            return super().is_valid
+
+        if not self.cache_entry.validated:
+            _, self.cache_entry.validation_errors = super().is_valid
+            self.cache_entry.validated = True
+
+        if self.cache_entry.validation_errors:
+            return False, self.cache_entry.validation_errors
+        return True, None
+
+    @property
+    def operations(self) -> list[GraphQLOperation]:
+        if self.cache_entry.operations is None:
+            self.cache_entry.operations = super().operations
+        return self.cache_entry.operations
 
     @property
     def operation_names(self) -> list[str]:
         return [operation.name for operation in self.operations if operation.name is not None]
 
+    async def calculate_depth(self) -> int:
+        if self.cache_entry.depth is None:
+            self.cache_entry.depth = await super().calculate_depth()
+        return self.cache_entry.depth
+
+    async def calculate_height(self) -> int:
+        if self.cache_entry.height is None:
+            self.cache_entry.height = await super().calculate_height()
+        return self.cache_entry.height
+
+    async def get_fields(self) -> dict[str, Any]:
+        if self.cache_entry.fields is None:
+            self.cache_entry.fields = await super().get_fields()
+        return self.cache_entry.fields
+
     async def get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if self.cache_entry.models_in_use is not None:
+            return self.cache_entry.models_in_use
+
         graphql_types = set()
         models = set()
 
@@ -57,4 +139,36 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
             except ValueError:
                 continue
 
+        self.cache_entry.models_in_use = models
         return models
+
+
+async def execute_analyzed_query(
+    analyzed_query: InfrahubGraphQLQueryAnalyzer,
+    context_value: Any,
+    root_value: Any = None,
+    variable_values: Optional[dict[str, Any]] = None,
+    middleware: Optional[Middleware] = None,
+    execution_context_class: Optional[type[ExecutionContext]] = None,
+) -> ExecutionResult:
+    """Execute a query already parsed and validated by the analyzer, equivalent to graphql.graphql without parsing the query again."""
+    if analyzed_query.schema is None:
+        raise ValueError("Schema must be provided to execute the query.")
+
+    valid, errors = analyzed_query.is_valid
+    if not valid:
+        return ExecutionResult(data=None, errors=errors)
+
+    result = execute(
+        schema=analyzed_query.schema,
+        document=analyzed_query.document,
+        root_value=root_value,
+        context_value=context_value,
+        variable_values=variable_values,
+        operation_name=analyzed_query.operation_name,
+        middleware=middleware,
+        execution_context_class=execution_context_class,
+    )
+    if isawaitable(result):
+        return await result
+    return result
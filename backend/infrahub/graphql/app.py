@@ -5,6 +5,7 @@ This code has been forked from https://github.com/ciscorn/starlette-graphene3 in
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import time
 from inspect import isawaitable
 from typing import (
@@ -27,7 +28,6 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
     parse,
     subscribe,
     validate,
@@ -42,12 +42,13 @@ from starlette.requests import ClientDisconnect, HTTPConnection, Request
 from starlette.responses import JSONResponse, Response
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from infrahub import config
 from infrahub.api.dependencies import api_key_scheme, cookie_auth_scheme, jwt_scheme
 from infrahub.auth import AccountSession, authentication_token
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, execute_analyzed_query
 from infrahub.graphql.initialization import GraphqlParams, prepare_graphql_params
 from infrahub.log import get_logger
 
@@ -93,6 +94,20 @@ ContextValue = Union[Any, Callable[[HTTPConnection], Any]]
 RootValue = Any
 
 
+def render_json(content: Any) -> bytes:
+    return ujson.dumps(content, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+class GraphQLJSONResponse(JSONResponse):
+    """JSONResponse rendered with ujson, faster than the standard library for large GraphQL responses.
+
+    The body is rendered once when the response is created, its size can be read from `body` without rendering it again.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
 class InfrahubGraphQLApp:
     def __init__(
         self,
@@ -182,7 +197,7 @@ class InfrahubGraphQLApp:
 
     async def _handle_http_request(
         self, request: Request, db: InfrahubDatabase, branch: Branch, account_session: AccountSession
-    ) -> JSONResponse:
+    ) -> Response:
         if request.app.state.response_delay:
             self.logger.info(f"Adding response delay of {request.app.state.response_delay} seconds")
             time.sleep(request.app.state.response_delay)
@@ -196,7 +211,9 @@ class InfrahubGraphQLApp:
             return JSONResponse({"errors": [str(exc)]}, status_code=400)
 
         if isinstance(operations, list):
-            return JSONResponse({"errors": ["This server does not support batching"]}, status_code=400)
+            return await self._handle_http_batch_request(
+                request=request, db=db, branch=branch, account_session=account_session, operations=operations
+            )
 
         operation = operations
         query = operation["query"]
@@ -207,8 +224,9 @@ class InfrahubGraphQLApp:
         graphql_params = prepare_graphql_params(
             db=db, branch=branch, at=at, account_session=account_session, request=request
         )
-        analyzed_query = InfrahubGraphQLQueryAnalyzer(
+        analyzed_query = InfrahubGraphQLQueryAnalyzer.from_cache(
             query=query,
+            schema_hash=graphql_params.schema_hash,
             query_variables=variable_values,
             schema=graphql_params.schema,
             operation_name=operation_name,
@@ -226,30 +244,162 @@ class InfrahubGraphQLApp:
         # if the query contains some mutation, it's not currently supported to set AT manually
         if analyzed_query.contains_mutation:
             graphql_params.context.at = Timestamp()
-        elif at and branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
-            schema_branch = await registry.schema.load_schema_from_db(db=db, branch=branch, at=Timestamp(at))
+        elif at:
+            await self._load_schema_at(db=db, branch=branch, at=at)
+
+        labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
+        response = await self._execute_query(
+            branch=branch, graphql_params=graphql_params, analyzed_query=analyzed_query, labels=labels
+        )
+
+        json_response = GraphQLJSONResponse(
+            response,
+            status_code=200,
+            background=graphql_params.context.background,
+        )
+
+        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.body))
+        await self._observe_query_metrics(labels=labels, analyzed_query=analyzed_query, graphql_params=graphql_params)
+
+        return json_response
+
+    async def _handle_http_batch_request(
+        self,
+        request: Request,
+        db: InfrahubDatabase,
+        branch: Branch,
+        account_session: AccountSession,
+        operations: list[Any],
+    ) -> Response:
+        """Execute multiple operations received in a single request and return the list of their responses.
+
+        All the operations share the same database session and GraphqlContext, including the DataLoaders,
+        an error in one operation is reported in its own response and doesn't prevent the others from being executed.
+        Queries are executed concurrently, if the batch contains some mutations all the operations are executed in order.
+        """
+        if not operations:
+            return JSONResponse({"errors": ["The batch must contain at least one operation"]}, status_code=400)
+        max_size = config.SETTINGS.api.graphql_batch_max_size
+        if len(operations) > max_size:
+            return JSONResponse(
+                {"errors": [f"The batch can't contain more than {max_size} operations"]}, status_code=400
+            )
+
+        at = request.query_params.get("at", None)
+        graphql_params = prepare_graphql_params(
+            db=db, branch=branch, at=at, account_session=account_session, request=request
+        )
+
+        analyzed_queries: list[Union[InfrahubGraphQLQueryAnalyzer, dict[str, Any]]] = []
+        for operation in operations:
+            try:
+                if not isinstance(operation, dict) or not isinstance(operation.get("query"), str):
+                    raise ValueError("Each operation of the batch must be an Object with a query")
+                analyzed_query = InfrahubGraphQLQueryAnalyzer.from_cache(
+                    query=operation["query"],
+                    schema_hash=graphql_params.schema_hash,
+                    query_variables=operation.get("variables"),
+                    schema=graphql_params.schema,
+                    operation_name=operation.get("operationName"),
+                    branch=branch,
+                )
+                await self._evaluate_permissions(
+                    db=db,
+                    request=request,
+                    query=analyzed_query,
+                    query_parameters=graphql_params,
+                    account_session=account_session,
+                    branch=branch,
+                )
+                analyzed_queries.append(analyzed_query)
+            except (Error, GraphQLError, ValueError) as exc:
+                analyzed_queries.append(self._format_operation_error(error=exc))
+
+        contains_mutation = any(
+            isinstance(analyzed_query, InfrahubGraphQLQueryAnalyzer) and analyzed_query.contains_mutation
+            for analyzed_query in analyzed_queries
+        )
+        if at and not contains_mutation:
+            await self._load_schema_at(db=db, branch=branch, at=at)
+
+        async def execute(analyzed_query: InfrahubGraphQLQueryAnalyzer) -> dict[str, Any]:
+            labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
+            params = graphql_params
+            if analyzed_query.contains_mutation:
+                params = GraphqlParams(
+                    schema=graphql_params.schema,
+                    context=dataclasses.replace(graphql_params.context, at=Timestamp()),
+                    schema_hash=graphql_params.schema_hash,
+                )
+            response = await self._execute_query(
+                branch=branch, graphql_params=params, analyzed_query=analyzed_query, labels=labels
+            )
+            if analyzed_query.contains_mutation:
+                # The data cached by the DataLoaders might have been modified by the mutation
+                graphql_params.context.dataloaders.clear()
+                graphql_params.context.node_property_map.clear()
+            return response
+
+        responses: list[dict[str, Any]] = [item if isinstance(item, dict) else {} for item in analyzed_queries]
+        to_execute = [
+            (idx, item) for idx, item in enumerate(analyzed_queries) if isinstance(item, InfrahubGraphQLQueryAnalyzer)
+        ]
+        if contains_mutation:
+            for idx, analyzed_query in to_execute:
+                responses[idx] = await execute(analyzed_query)
+        else:
+            results = await asyncio.gather(*[execute(analyzed_query) for _, analyzed_query in to_execute])
+            for (idx, _), result in zip(to_execute, results):
+                responses[idx] = result
+
+        # Each response is rendered separately to measure its size without rendering the body a second time
+        rendered_responses: list[bytes] = []
+        for analyzed_query, response in zip(analyzed_queries, responses):
+            rendered_response = render_json(response)
+            rendered_responses.append(rendered_response)
+            if isinstance(analyzed_query, InfrahubGraphQLQueryAnalyzer):
+                labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
+                GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(rendered_response))
+                await self._observe_query_metrics(
+                    labels=labels, analyzed_query=analyzed_query, graphql_params=graphql_params
+                )
+
+        return Response(
+            content=b"[" + b",".join(rendered_responses) + b"]",
+            status_code=200,
+            media_type="application/json",
+            background=graphql_params.context.background,
+        )
+
+    async def _load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: str) -> None:
+        """Use the version of the schema that was active at the time of the query, if it changed since then."""
+        if branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
+            schema_branch = await registry.schema.load_schema_at(db=db, branch=branch, at=Timestamp(at))
             db.add_schema(name=branch.name, schema=schema_branch)
 
-        if operation_name == "IntrospectionQuery":
+    async def _execute_query(
+        self,
+        branch: Branch,
+        graphql_params: GraphqlParams,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        labels: dict[str, Any],
+    ) -> dict[str, Any]:
+        if analyzed_query.operation_name == "IntrospectionQuery":
             nbr_object_in_schema = len(graphql_params.schema.type_map)
             self.logger.debug(
                 "Processing IntrospectionQuery .. ", branch=branch.name, nbr_object_in_schema=nbr_object_in_schema
             )
 
-        labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
-
         with trace.get_tracer(__name__).start_as_current_span("execute_graphql") as span:
             span.set_attributes(labels)
 
             with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
+                result = await execute_analyzed_query(
+                    analyzed_query=analyzed_query,
                     context_value=graphql_params.context,
                     root_value=self.root_value,
                     middleware=self.middleware,
-                    variable_values=variable_values,
-                    operation_name=operation_name,
+                    variable_values=analyzed_query.query_variables,
                     execution_context_class=self.execution_context_class,
                 )
 
@@ -260,13 +410,11 @@ class InfrahubGraphQLApp:
                     self._log_error(error=error.original_error)
             response["errors"] = [self.error_formatter(error) for error in result.errors]
 
-        json_response = JSONResponse(
-            response,
-            status_code=200,
-            background=graphql_params.context.background,
-        )
+        return response
 
-        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.render(response)))
+    async def _observe_query_metrics(
+        self, labels: dict[str, Any], analyzed_query: InfrahubGraphQLQueryAnalyzer, graphql_params: GraphqlParams
+    ) -> None:
         GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await analyzed_query.calculate_depth())
         GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await analyzed_query.calculate_height())
         # GRAPHQL_QUERY_VARS_METRICS.labels(**labels).observe(len(analyzed_query.variables))
@@ -279,7 +427,17 @@ class InfrahubGraphQLApp:
         if not valid:
             GRAPHQL_QUERY_ERRORS_METRICS.labels(**labels).observe(len(errors))
 
-        return json_response
+    def _format_operation_error(self, error: Exception) -> dict[str, Any]:
+        """Format the error of an operation of a batch the same way the API reports the errors of a single request."""
+        if isinstance(error, GraphQLError):
+            return {"data": None, "errors": [self.error_formatter(error)]}
+
+        http_code = 400
+        message = str(error)
+        if isinstance(error, Error):
+            http_code = error.HTTP_CODE or 500
+            message = str(error.message) if error.message else error.DESCRIPTION
+        return {"data": None, "errors": [{"message": message, "extensions": {"code": http_code}}]}
 
     def _set_labels(self, request: Request, branch: Branch, query: InfrahubGraphQLQueryAnalyzer) -> dict[str, Any]:
         return {
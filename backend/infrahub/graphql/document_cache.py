@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from graphql import parse
+
+from infrahub import config
+
+from .metrics import (
+    GRAPHQL_DOCUMENT_CACHE_HITS_METRICS,
+    GRAPHQL_DOCUMENT_CACHE_MISSES_METRICS,
+    GRAPHQL_DOCUMENT_CACHE_SIZE_METRICS,
+)
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode, GraphQLError
+    from infrahub_sdk.analyzer import GraphQLOperation
+
+# (hash of the schema, includes mutations, includes subscriptions, hash of the query, name of the operation)
+GraphQLDocumentCacheKey = tuple[str, bool, bool, str, Optional[str]]
+
+
+@dataclass
+class GraphQLDocumentCacheEntry:
+    """Parsed query and the results of its analysis, only computed once for a given schema."""
+
+    document: DocumentNode
+    validated: bool = False
+    validation_errors: Optional[list[GraphQLError]] = None
+    operations: Optional[list[GraphQLOperation]] = None
+    fields: Optional[dict[str, Any]] = None
+    depth: Optional[int] = None
+    height: Optional[int] = None
+    models_in_use: Optional[set[str]] = None
+
+
+class GraphQLDocumentCache:
+    """LRU cache of the GraphQL queries already parsed, validated and analyzed for a given schema.
+
+    The same schema hash is used by the GraphQL schemas generated with and without the mutations and the subscriptions,
+    which are part of the key so a query is never considered valid for a schema it hasn't been validated against.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[GraphQLDocumentCacheKey, GraphQLDocumentCacheEntry] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.graphql_document_cache_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(
+        schema_hash: str,
+        query: str,
+        operation_name: Optional[str] = None,
+        include_mutation: bool = True,
+        include_subscription: bool = True,
+    ) -> GraphQLDocumentCacheKey:
+        query_hash = hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+        return (schema_hash, include_mutation, include_subscription, query_hash, operation_name)
+
+    def get(
+        self,
+        schema_hash: str,
+        query: str,
+        operation_name: Optional[str] = None,
+        branch_name: str = "",
+        include_mutation: bool = True,
+        include_subscription: bool = True,
+    ) -> GraphQLDocumentCacheEntry:
+        """Return the entry of a query, the query is parsed and added to the cache if it's not already present.
+
+        A query with a syntax error raises a GraphQLError and is not added to the cache.
+        """
+        key = self.get_key(
+            schema_hash=schema_hash,
+            query=query,
+            operation_name=operation_name,
+            include_mutation=include_mutation,
+            include_subscription=include_subscription,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            GRAPHQL_DOCUMENT_CACHE_HITS_METRICS.labels(branch_name).inc()
+            return entry
+
+        GRAPHQL_DOCUMENT_CACHE_MISSES_METRICS.labels(branch_name).inc()
+        entry = GraphQLDocumentCacheEntry(document=parse(query))
+        if self.max_size <= 0:
+            return entry
+
+        self._entries[key] = entry
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        GRAPHQL_DOCUMENT_CACHE_SIZE_METRICS.set(len(self._entries))
+        return entry
+
+    def clear(self) -> None:
+        self._entries = OrderedDict()
+        GRAPHQL_DOCUMENT_CACHE_SIZE_METRICS.set(0)
+
+
+graphql_document_cache = GraphQLDocumentCache()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Hashable, Optional, Union
 
 from starlette.background import BackgroundTasks
 
@@ -17,7 +17,9 @@ if TYPE_CHECKING:
 
     from infrahub.auth import AccountSession
     from infrahub.core.branch import Branch
+    from infrahub.core.node import Node
     from infrahub.database import InfrahubDatabase
+    from infrahub.graphql.loaders import DataLoader
     from infrahub.services import InfrahubServices
 
 
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 class GraphqlParams:
     schema: GraphQLSchema
     context: GraphqlContext
+    schema_hash: str = ""
 
 
 @dataclass
@@ -38,6 +41,8 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    dataloaders: dict[Hashable, DataLoader] = field(default_factory=dict)
+    node_property_map: dict[str, Node] = field(default_factory=dict)
 
     @property
     def active_account_session(self) -> AccountSession:
@@ -65,7 +70,6 @@ def prepare_graphql_params(
     branch = registry.get_branch_from_registry(branch=branch)
     schema = registry.schema.get_schema_branch(name=branch.name)
 
-    gqlm = schema.get_graphql_manager()
     gql_schema = schema.get_graphql_schema(
         include_query=include_query,
         include_mutation=include_mutation,
@@ -78,11 +82,12 @@ def prepare_graphql_params(
 
     return GraphqlParams(
         schema=gql_schema,
+        schema_hash=schema.get_graphql_schema_hash(),
         context=GraphqlContext(
             db=db,
             branch=branch,
             at=Timestamp(at),
-            types=gqlm._graphql_types,
+            types=schema.get_graphql_types(),
             related_node_ids=set(),
             background=BackgroundTasks(),
             request=request,
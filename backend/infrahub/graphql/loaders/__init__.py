@@ -0,0 +1,4 @@
+from .base import DataLoader
+from .peers import PeerRelationshipsDataLoader, get_peers_loader
+
+__all__ = ["DataLoader", "PeerRelationshipsDataLoader", "get_peers_loader"]
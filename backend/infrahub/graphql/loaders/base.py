@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Hashable, TypeVar
+
+from infrahub.graphql.metrics import (
+    GRAPHQL_DATALOADER_BATCH_SIZE_METRICS,
+    GRAPHQL_DATALOADER_HITS_METRICS,
+    GRAPHQL_DATALOADER_MISSES_METRICS,
+)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert a structure of nested dicts and lists into a hashable equivalent."""
+    if isinstance(value, dict):
+        return tuple(sorted(((key, freeze(item)) for key, item in value.items()), key=lambda pair: str(pair[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+class DataLoader(ABC, Generic[KeyT, ValueT]):
+    """Collect all the keys requested within one tick of the event loop and resolve them with a single batch.
+
+    A DataLoader is meant to live for the duration of a single GraphQL request,
+    the results are memoized per key so a key requested twice will only be loaded once.
+    """
+
+    name: str = "default"
+
+    def __init__(self) -> None:
+        self._cache: dict[KeyT, asyncio.Future[ValueT]] = {}
+        self._queue: list[tuple[KeyT, asyncio.Future[ValueT]]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: KeyT) -> ValueT:
+        if key in self._cache:
+            GRAPHQL_DATALOADER_HITS_METRICS.labels(loader=self.name).inc()
+            return await self._cache[key]
+
+        GRAPHQL_DATALOADER_MISSES_METRICS.labels(loader=self.name).inc()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ValueT] = loop.create_future()
+        self._cache[key] = future
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            # Give all the resolvers already scheduled a chance to register their key before dispatching the batch
+            loop.call_soon(self._schedule_dispatch, loop)
+        return await future
+
+    @abstractmethod
+    async def batch_load(self, keys: list[KeyT]) -> dict[KeyT, ValueT]:
+        raise NotImplementedError
+
+    def _schedule_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        keys = [key for key, _ in queue]
+        GRAPHQL_DATALOADER_BATCH_SIZE_METRICS.labels(loader=self.name).observe(len(keys))
+
+        try:
+            values = await self.batch_load(keys)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for key, future in queue:
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, future in queue:
+            if not future.done():
+                future.set_result(values[key])
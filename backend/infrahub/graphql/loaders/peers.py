@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.constants import BranchSupportType
+from infrahub.core.manager import NodeManager
+
+from .base import DataLoader, freeze
+
+if TYPE_CHECKING:
+    from infrahub.core.relationship import Relationship
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.graphql.initialization import GraphqlContext
+
+
+class PeerRelationshipsDataLoader(DataLoader[str, list["Relationship"]]):
+    """Load the peers of a given relationship for many source nodes with a single query_peers call."""
+
+    name = "peers"
+
+    def __init__(
+        self,
+        context: GraphqlContext,
+        source_kind: str,
+        schema: RelationshipSchema,
+        filters: dict[str, Any],
+        fields: Optional[dict] = None,
+    ) -> None:
+        super().__init__()
+        self.context = context
+        self.source_kind = source_kind
+        self.schema = schema
+        self.filters = filters
+        self.fields = fields
+
+    def _is_node_property_requested(self, node_property: str) -> bool:
+        """Indicate if the node property (source, owner) of at least one attribute of the peers is requested."""
+        if not self.fields:
+            return False
+        return any(isinstance(field, dict) and node_property in field for field in self.fields.values())
+
+    async def batch_load(self, keys: list[str]) -> dict[str, list[Relationship]]:
+        async with self.context.db.start_session() as db:
+            relationships = await NodeManager.query_peers(
+                db=db,
+                ids=keys,
+                source_kind=self.source_kind,
+                schema=self.schema,
+                filters=self.filters,
+                fields=self.fields,
+                at=self.context.at,
+                branch=self.context.branch,
+                branch_agnostic=self.schema.branch is BranchSupportType.AGNOSTIC,
+                fetch_peers=True,
+                include_source=self._is_node_property_requested("source"),
+                include_owner=self._is_node_property_requested("owner"),
+                node_property_map=self.context.node_property_map,
+            )
+
+        peers_by_source: dict[str, list[Relationship]] = defaultdict(list)
+        for relationship in relationships:
+            peers_by_source[relationship.node_id].append(relationship)
+
+        return {key: peers_by_source.get(key, []) for key in keys}
+
+
+def get_peers_loader(
+    context: GraphqlContext,
+    source_kind: str,
+    schema: RelationshipSchema,
+    filters: dict[str, Any],
+    fields: Optional[dict] = None,
+) -> PeerRelationshipsDataLoader:
+    """Return the loader associated with this combination of relationship, fields and filters for the current request."""
+    key = ("peers", source_kind, schema.identifier, schema.name, freeze(filters), freeze(fields))
+    if key not in context.dataloaders:
+        context.dataloaders[key] = PeerRelationshipsDataLoader(
+            context=context, source_kind=source_kind, schema=schema, filters=filters, fields=fields
+        )
+    return context.dataloaders[key]
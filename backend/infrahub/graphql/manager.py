@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
 
 import graphene
 
@@ -16,6 +17,7 @@ from infrahub.core.schema import (
     ProfileSchema,
     RelationshipSchema,
 )
+from infrahub.exceptions import SchemaNotFoundError
 from infrahub.graphql.mutations.attribute import BaseAttributeCreate, BaseAttributeUpdate
 from infrahub.graphql.mutations.graphql_query import InfrahubGraphQLQueryMutation
 from infrahub.types import ATTRIBUTE_TYPES, InfrahubDataType, get_attribute_type
@@ -79,6 +81,12 @@ GraphQLTypes = Union[
     type[InfrahubMutation], type[BaseAttributeType], type[graphene.Interface], type[graphene.ObjectType]
 ]
 
+# Signature of a kind used to identify if the GraphQL types generated for it are still valid,
+# composed of the hash of the schema of the kind and the hash of the schema of all the kinds it depends on.
+KindSignature = tuple[str, ...]
+
+MUTATION_SUFFIXES = ("Create", "Update", "Upsert", "Delete")
+
 
 @dataclass
 class GraphqlMutations:
@@ -105,6 +113,18 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         self.schema = schema
 
         self._graphql_types: dict[str, GraphQLTypes] = {}
+        self._object_types_signatures: dict[str, KindSignature] = {}
+        self._mutations_signatures: dict[str, KindSignature] = {}
+        self._filters_cache: dict[tuple[str, bool, bool], tuple[KindSignature, dict[str, Any]]] = {}
+
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all the types generated previously and reload the base types."""
+        self._graphql_types = {}
+        self._object_types_signatures = {}
+        self._mutations_signatures = {}
+        self._filters_cache = {}
 
         self._load_attribute_types()
         if config.SETTINGS.experimental_features.graphql_enums:
@@ -183,6 +203,74 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
     def set_type(self, name: str, graphql_type: GraphQLTypes) -> None:
         self._graphql_types[name] = graphql_type
 
+    def get_lazy_type(self, name: str) -> Callable[[], type[InfrahubObject]]:
+        """Return a reference to a type that will be resolved only when the GraphQL schema is generated.
+
+        Fields referencing the types of another kind are using a lazy reference
+        so they remain valid when the types of the other kind are regenerated.
+        """
+        return partial(self.get_type, name=name)
+
+    def _get_schema_hash(self, name: str) -> str:
+        return self.schema.nodes.get(name) or self.schema.generics.get(name) or self.schema.profiles.get(name) or ""
+
+    @staticmethod
+    def _get_interfaces(schema: MainSchemaTypes) -> set[str]:
+        interfaces: set[str] = set()
+        if isinstance(schema, (NodeSchema, ProfileSchema)):
+            interfaces.update(schema.inherit_from)
+        if isinstance(schema, NodeSchema) and InfrahubKind.GENERICGROUP not in schema.inherit_from:
+            interfaces.add(InfrahubKind.NODE)
+        return interfaces
+
+    def _get_signature(self, schema: MainSchemaTypes) -> KindSignature:
+        dependencies = self._get_interfaces(schema=schema)
+        dependencies.update(rel.peer for rel in schema.relationships)
+        if isinstance(schema, NodeSchema) and schema.hierarchy:
+            dependencies.add(schema.hierarchy)
+
+        return (self._get_schema_hash(name=schema.kind),) + tuple(
+            f"{name}:{self._get_schema_hash(name=name)}" for name in sorted(dependencies)
+        )
+
+    @staticmethod
+    def _get_kind_type_names(name: str) -> list[str]:
+        return [name, f"Edged{name}", f"NestedEdged{name}", f"Paginated{name}", f"NestedPaginated{name}"] + [
+            f"{name}{suffix}" for suffix in MUTATION_SUFFIXES
+        ]
+
+    def _get_outdated_kinds(
+        self, full_schema: dict[str, MainSchemaTypes], signatures: dict[str, KindSignature]
+    ) -> Optional[set[str]]:
+        """Identify the kinds whose object types must be regenerated since the last generation.
+
+        Return None if all the object types must be regenerated.
+        """
+        if not self._object_types_signatures or config.SETTINGS.experimental_features.graphql_enums:
+            return None
+
+        removed = set(self._object_types_signatures.keys()) - set(full_schema.keys())
+        outdated = {
+            name for name, signature in signatures.items() if self._object_types_signatures.get(name) != signature
+        }
+
+        # The lineage types are referenced directly by all the attributes and relationship properties
+        if {InfrahubKind.LINEAGESOURCE, InfrahubKind.LINEAGEOWNER} & (outdated | removed):
+            return None
+
+        # An object type must be generated again if one of its interfaces is regenerated
+        outdated_generics = {name for name in outdated if isinstance(full_schema[name], GenericSchema)}
+        if outdated_generics:
+            for name, node_schema in full_schema.items():
+                if self._get_interfaces(schema=node_schema) & outdated_generics:
+                    outdated.add(name)
+
+        for name in removed:
+            for type_name in self._get_kind_type_names(name=name):
+                self._graphql_types.pop(type_name, None)
+
+        return outdated
+
     def _load_attribute_types(self) -> None:
         for data_type in ATTRIBUTE_TYPES.values():
             self.set_type(name=data_type.get_graphql_type_name(), graphql_type=data_type.get_graphql_type())
@@ -254,13 +342,29 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         return RelatedNodeInput
 
     def generate_object_types(self) -> None:  # pylint: disable=too-many-branches,too-many-statements
-        """Generate all GraphQL objects for the schema and store them in the internal registry."""
+        """Generate all GraphQL objects for the schema and store them in the internal registry.
+
+        The objects generated previously are reused for the kinds whose schema and dependencies haven't changed,
+        only the objects of the other kinds are generated again.
+        """
 
         full_schema = self.schema.get_all(duplicate=False)
+        signatures = {
+            node_name: self._get_signature(schema=node_schema) for node_name, node_schema in full_schema.items()
+        }
+
+        # Work on a copy of the registry, the current one might still be used by a previous version of the GraphQL schema
+        self._graphql_types = dict(self._graphql_types)
+        outdated_kinds = self._get_outdated_kinds(full_schema=full_schema, signatures=signatures)
+        full_generation = outdated_kinds is None
+        if outdated_kinds is None:
+            if self._object_types_signatures:
+                self._reset()
+            outdated_kinds = set(full_schema.keys())
 
         # Generate all GraphQL Interface  Object first and store them in the registry
         for node_name, node_schema in full_schema.items():
-            if not isinstance(node_schema, GenericSchema):
+            if not isinstance(node_schema, GenericSchema) or node_name not in outdated_kinds:
                 continue
             interface = self.generate_interface_object(schema=node_schema, populate_cache=True)
             edged_interface = self.generate_graphql_edged_object(
@@ -271,7 +375,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         # Define LineageSource and LineageOwner
         data_source = self.get_type(name=InfrahubKind.LINEAGESOURCE)
         data_owner = self.get_type(name=InfrahubKind.LINEAGEOWNER)
-        self.define_relationship_property(data_source=data_source, data_owner=data_owner)
+        if full_generation:
+            self.define_relationship_property(data_source=data_source, data_owner=data_owner)
         relationship_property = self.get_type(name="RelationshipProperty")
         for data_type in ATTRIBUTE_TYPES.values():
             gql_type = self.get_type(name=data_type.get_graphql_type_name())
@@ -280,7 +385,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         # Generate all Nested, Edged and NestedEdged Interfaces and store them in the registry
         for node_name, node_schema in full_schema.items():
-            if not isinstance(node_schema, GenericSchema):
+            if not isinstance(node_schema, GenericSchema) or node_name not in outdated_kinds:
                 continue
             node_interface = self.get_type(name=node_name)
 
@@ -300,7 +405,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         # Generate all GraphQL ObjectType, Nested, Paginated & NestedPaginated and store them in the registry
         for node_name, node_schema in full_schema.items():
-            if isinstance(node_schema, (NodeSchema, ProfileSchema)):
+            if isinstance(node_schema, (NodeSchema, ProfileSchema)) and node_name in outdated_kinds:
                 node_type = self.generate_graphql_object(schema=node_schema, populate_cache=True)
                 node_type_edged = self.generate_graphql_edged_object(
                     schema=node_schema, node=node_type, populate_cache=True
@@ -316,6 +421,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         # Extend all types and related types with Relationships
         for node_name, node_schema in full_schema.items():
+            if node_name not in outdated_kinds:
+                continue
             node_type = self.get_type(name=node_name)
 
             for rel in node_schema.relationships:
@@ -332,11 +439,11 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 peer_filters = self.generate_filters(schema=peer_schema, top_level=False)
 
                 if rel.cardinality == "one":
-                    peer_type = self.get_type(name=f"NestedEdged{peer_schema.kind}")
+                    peer_type = self.get_lazy_type(name=f"NestedEdged{peer_schema.kind}")
                     node_type._meta.fields[rel.name] = graphene.Field(peer_type, resolver=single_relationship_resolver)
 
                 elif rel.cardinality == "many":
-                    peer_type = self.get_type(name=f"NestedPaginated{peer_schema.kind}")
+                    peer_type = self.get_lazy_type(name=f"NestedPaginated{peer_schema.kind}")
 
                     if (isinstance(node_schema, NodeSchema) and node_schema.hierarchy) or (
                         isinstance(node_schema, GenericSchema) and node_schema.hierarchical
@@ -358,8 +465,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                     hierarchy_name = node_schema.kind
 
                 peer_filters = self.generate_filters(schema=schema, top_level=False)
-                peer_type = self.get_type(name=f"NestedPaginated{hierarchy_name}")
-                peer_type_edge = self.get_type(name=f"NestedEdged{hierarchy_name}")
+                peer_type = self.get_lazy_type(name=f"NestedPaginated{hierarchy_name}")
+                peer_type_edge = self.get_lazy_type(name=f"NestedEdged{hierarchy_name}")
 
                 node_type._meta.fields["parent"] = graphene.Field(
                     peer_type_edge, required=False, resolver=single_relationship_resolver
@@ -374,6 +481,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                     peer_type, required=False, resolver=descendants_resolver, **peer_filters
                 )
 
+        self._object_types_signatures = signatures
+
     def generate_query_mixin(self) -> type[object]:
         class_attrs = {}
 
@@ -402,6 +511,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
     def generate_mutation_mixin(self) -> type[object]:
         class_attrs: dict[str, Any] = {}
+        signatures: dict[str, KindSignature] = {}
 
         full_schema = self.schema.get_all(duplicate=False)
 
@@ -409,6 +519,14 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             if node_schema.namespace == "Internal":
                 continue
 
+            # The mutations generated previously are still valid if the kind and its dependencies haven't changed
+            signature = self._get_signature(schema=node_schema)
+            signatures[node_schema.kind] = signature
+            is_valid = (
+                self._mutations_signatures.get(node_schema.kind) == signature
+                and f"{node_schema.kind}Update" in self._graphql_types
+            )
+
             mutation_map: dict[str, type[InfrahubMutation]] = {
                 InfrahubKind.ARTIFACTDEFINITION: InfrahubArtifactDefinitionMutation,
                 InfrahubKind.REPOSITORY: InfrahubRepositoryMutation,
@@ -428,7 +546,15 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 base_class = mutation_map.get(node_schema.kind, InfrahubMutation)
 
             if isinstance(node_schema, (NodeSchema, ProfileSchema)):
-                mutations = self.generate_graphql_mutations(schema=node_schema, base_class=base_class)
+                if is_valid:
+                    mutations = GraphqlMutations(
+                        create=self.get_mutation(name=f"{node_schema.kind}Create"),
+                        update=self.get_mutation(name=f"{node_schema.kind}Update"),
+                        upsert=self.get_mutation(name=f"{node_schema.kind}Upsert"),
+                        delete=self.get_mutation(name=f"{node_schema.kind}Delete"),
+                    )
+                else:
+                    mutations = self.generate_graphql_mutations(schema=node_schema, base_class=base_class)
 
                 class_attrs[f"{node_schema.kind}Create"] = mutations.create.Field()
                 class_attrs[f"{node_schema.kind}Update"] = mutations.update.Field()
@@ -439,13 +565,18 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 isinstance(node_schema, GenericSchema)
                 and (len(node_schema.attributes) + len(node_schema.relationships)) > 0
             ):
-                graphql_mutation_update_input = self.generate_graphql_mutation_update_input(node_schema)
-                update = self.generate_graphql_mutation_update(
-                    schema=node_schema, base_class=base_class, input_type=graphql_mutation_update_input
-                )
-                self.set_type(name=update._meta.name, graphql_type=update)
+                if is_valid:
+                    update = self.get_mutation(name=f"{node_schema.kind}Update")
+                else:
+                    graphql_mutation_update_input = self.generate_graphql_mutation_update_input(node_schema)
+                    update = self.generate_graphql_mutation_update(
+                        schema=node_schema, base_class=base_class, input_type=graphql_mutation_update_input
+                    )
+                    self.set_type(name=update._meta.name, graphql_type=update)
                 class_attrs[f"{node_schema.kind}Update"] = update.Field()
 
+        self._mutations_signatures = signatures
+
         return type("MutationMixin", (object,), class_attrs)
 
     def generate_graphql_object(self, schema: MainSchemaTypes, populate_cache: bool = False) -> type[InfrahubObject]:
@@ -784,6 +915,27 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             dict: A Dictionary containing all the filters with their name as the key and their Type as value
         """
 
+        # The filters are cached only for the schema objects of the current schema
+        cache_key = (schema.kind, top_level, include_properties)
+        signature: Optional[KindSignature] = None
+        try:
+            if self.schema.get(name=schema.kind, duplicate=False) is schema:
+                signature = self._get_signature(schema=schema) if top_level else (self._get_schema_hash(schema.kind),)
+        except SchemaNotFoundError:
+            pass
+
+        if signature and cache_key in self._filters_cache and self._filters_cache[cache_key][0] == signature:
+            return dict(self._filters_cache[cache_key][1])
+
+        filters = self._generate_filters(schema=schema, top_level=top_level, include_properties=include_properties)
+        if signature:
+            self._filters_cache[cache_key] = (signature, filters)
+
+        return dict(filters)
+
+    def _generate_filters(
+        self, schema: MainSchemaTypes, top_level: bool = False, include_properties: bool = True
+    ) -> dict[str, Union[graphene.Scalar, graphene.List]]:
         filters: dict[str, Any] = {"offset": graphene.Int(), "limit": graphene.Int()}
         default_filters: list[str] = list(filters.keys())
 
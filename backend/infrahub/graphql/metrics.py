@@ -1,4 +1,4 @@
-from prometheus_client import Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 METRIC_PREFIX = "infrahub_graphql"
 
@@ -57,3 +57,50 @@ GRAPHQL_TOP_LEVEL_QUERIES_METRICS = Histogram(
     labelnames=["type", "operation", "branch", "name", "query_id"],
     buckets=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 25, 50, 100],
 )
+
+GRAPHQL_DATALOADER_HITS_METRICS = Counter(
+    f"{METRIC_PREFIX}_dataloader_hits",
+    "Number of keys served by a DataLoader without querying the database",
+    labelnames=["loader"],
+)
+GRAPHQL_DATALOADER_MISSES_METRICS = Counter(
+    f"{METRIC_PREFIX}_dataloader_misses",
+    "Number of keys that required a query to the database in a DataLoader",
+    labelnames=["loader"],
+)
+GRAPHQL_DATALOADER_BATCH_SIZE_METRICS = Histogram(
+    f"{METRIC_PREFIX}_dataloader_batch_size",
+    "Number of keys resolved in a single DataLoader batch",
+    labelnames=["loader"],
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500, 1000],
+)
+
+GRAPHQL_SCHEMA_CACHE_HITS_METRICS = Counter(
+    f"{METRIC_PREFIX}_schema_cache_hits",
+    "Number of GraphQL schemas reused from the cache instead of being generated",
+    labelnames=["branch"],
+)
+GRAPHQL_SCHEMA_CACHE_MISSES_METRICS = Counter(
+    f"{METRIC_PREFIX}_schema_cache_misses",
+    "Number of GraphQL schemas that had to be generated",
+    labelnames=["branch"],
+)
+GRAPHQL_SCHEMA_CACHE_SIZE_METRICS = Gauge(
+    f"{METRIC_PREFIX}_schema_cache_size",
+    "Number of GraphQL schemas kept in the cache",
+)
+
+GRAPHQL_DOCUMENT_CACHE_HITS_METRICS = Counter(
+    f"{METRIC_PREFIX}_document_cache_hits",
+    "Number of GraphQL queries served from the cache without being parsed and validated again",
+    labelnames=["branch"],
+)
+GRAPHQL_DOCUMENT_CACHE_MISSES_METRICS = Counter(
+    f"{METRIC_PREFIX}_document_cache_misses",
+    "Number of GraphQL queries that had to be parsed",
+    labelnames=["branch"],
+)
+GRAPHQL_DOCUMENT_CACHE_SIZE_METRICS = Gauge(
+    f"{METRIC_PREFIX}_document_cache_size",
+    "Number of parsed GraphQL queries kept in the cache",
+)
@@ -209,9 +209,13 @@ class BranchRebase(Mutation):
             schema_in_main_before = merger.destination_schema.duplicate()
 
             async with context.db.start_transaction() as dbt:
-                await obj.rebase(db=dbt)
+                nbr_rels_deleted, nbr_rels_updated = await obj.rebase(db=dbt)
                 await task.info(message="Branch successfully rebased", db=dbt)
 
+            await task.info(
+                message=f"{nbr_rels_deleted} relationships deleted and {nbr_rels_updated} relationships updated"
+            )
+
             if obj.has_schema_changes:
                 # NOTE there is a bit additional work in order to calculate a proper diff that will
                 # allow us to pull only the part of the schema that has changed, for now the safest option is to pull
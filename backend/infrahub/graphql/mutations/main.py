@@ -63,6 +63,10 @@ class InfrahubMutationMixin:
         action = MutationAction.UNDEFINED
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
+        # Data loaded by previous operations of this request could be modified by this mutation
+        context.dataloaders.clear()
+        context.node_property_map.clear()
+
         if "Create" in cls.__name__:
             obj, mutation = await cls.mutate_create(info=info, branch=context.branch, at=context.at, **kwargs)
             action = MutationAction.ADDED
@@ -289,7 +293,7 @@ class InfrahubMutationMixin:
         context: GraphqlContext = info.context
         db = database or context.db
 
-        node_schema = db.schema.get(name=schema_name, branch=branch)
+        node_schema = db.schema.get(name=schema_name, branch=branch, duplicate=False)
 
         node = None
         for getter in node_getters:
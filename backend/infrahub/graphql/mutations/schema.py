@@ -262,6 +262,7 @@ async def update_registry(kind: NodeSchema, branch: Branch, db: InfrahubDatabase
             if config.SETTINGS.broker.enable:
                 message = messages.EventSchemaUpdate(
                     branch=branch.name,
+                    schema_hash=branch.active_schema_hash,
                     meta=Meta(initiator_id=WORKER_IDENTITY),
                 )
                 await services.send(message)
@@ -6,7 +6,9 @@ from graphene import Boolean, Field, Int, List, ObjectType, String
 from infrahub_sdk.utils import extract_fields_first_node, is_valid_uuid
 
 from infrahub.core.constants import InfrahubKind
+from infrahub.core.graph.index import attr_value_fulltext_index
 from infrahub.core.manager import NodeManager
+from infrahub.core.query.node import NodeSearchQuery, PeerInfo, is_fulltext_searchable
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
 class Node(ObjectType):
     id = Field(String, required=True)
     kind = Field(String, required=True, description="The node kind")
+    display_label = Field(String, required=False, description="The display label of the node")
 
 
 class NodeEdge(ObjectType):
@@ -38,30 +41,58 @@ async def search_resolver(
 ) -> dict[str, Any]:
     context: GraphqlContext = info.context
     response: dict[str, Any] = {}
-    result: list[CoreNode] = []
+    result: list[PeerInfo] = []
 
     fields = await extract_fields_first_node(info)
+    fulltext_index = context.db.manager.index.get_item(
+        name=attr_value_fulltext_index.name, type=attr_value_fulltext_index.type
+    )
 
     if is_valid_uuid(q):
         matching: Optional[CoreNode] = await NodeManager.get_one(
             db=context.db, branch=context.branch, at=context.at, id=q
         )
         if matching:
-            result.append(matching)
+            result.append(PeerInfo(uuid=matching.id, kind=matching.get_kind()))
+    elif fulltext_index and is_fulltext_searchable(q):
+        # The matching nodes are ranked by the full-text index
+        query = await NodeSearchQuery.init(
+            db=context.db,
+            branch=context.branch,
+            at=context.at,
+            search=q,
+            index_name=fulltext_index.index_name,
+            partial_match=partial_match,
+            limit=limit,
+        )
+        await query.execute(db=context.db)
+        result.extend(query.get_matching_nodes())
     else:
-        result.extend(
-            await NodeManager.query(
-                db=context.db,
-                branch=context.branch,
-                schema=InfrahubKind.NODE,
-                filters={"any__value": q},
-                limit=limit,
-                partial_match=partial_match,
-            )
+        nodes = await NodeManager.query(
+            db=context.db,
+            branch=context.branch,
+            schema=InfrahubKind.NODE,
+            filters={"any__value": q},
+            limit=limit,
+            partial_match=partial_match,
         )
+        result.extend([PeerInfo(uuid=node.id, kind=node.get_kind()) for node in nodes])
 
     if "edges" in fields and result:
-        response["edges"] = [{"node": {"id": obj.id, "kind": obj.get_kind()}} for obj in result]
+        display_labels: dict[str, str] = {}
+        node_fields = (fields["edges"] or {}).get("node") or {}
+        if "display_label" in node_fields:
+            nodes_by_id = await NodeManager.get_many(
+                db=context.db, branch=context.branch, at=context.at, ids=[item.uuid for item in result]
+            )
+            display_labels = {
+                node_id: await node.render_display_label(db=context.db) for node_id, node in nodes_by_id.items()
+            }
+
+        response["edges"] = [
+            {"node": {"id": item.uuid, "kind": item.kind, "display_label": display_labels.get(item.uuid)}}
+            for item in result
+        ]
 
     if "count" in fields:
         response["count"] = len(result)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from graphql import graphql
+from graphql import ExecutionResult, GraphQLError
 
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
@@ -10,11 +10,10 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.protocols import CoreGraphQLQuery
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, execute_analyzed_query
 from infrahub.graphql.initialization import prepare_graphql_params
 
 if TYPE_CHECKING:
-    from graphql.execution import ExecutionResult
-
     from infrahub.database import InfrahubDatabase
 
 
@@ -39,9 +38,18 @@ async def execute_query(
 
     gql_params = prepare_graphql_params(branch=branch, db=db, at=at, include_mutation=False, include_subscription=False)
 
-    result = await graphql(
-        schema=gql_params.schema,
-        source=graphql_query.query.value,
+    try:
+        analyzed_query = InfrahubGraphQLQueryAnalyzer.from_cache(
+            query=graphql_query.query.value,
+            schema_hash=gql_params.schema_hash,
+            schema=gql_params.schema,
+            branch=branch,
+        )
+    except GraphQLError as exc:
+        return ExecutionResult(data=None, errors=[exc])
+
+    result = await execute_analyzed_query(
+        analyzed_query=analyzed_query,
         context_value=gql_params.context,
         root_value=None,
         variable_values=params or {},
@@ -9,6 +9,7 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 from infrahub.exceptions import NodeNotFoundError
 
+from .loaders import get_peers_loader
 from .parser import extract_selection
 from .permissions import get_permissions
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
@@ -92,20 +93,13 @@ async def default_resolver(*args: Any, **kwargs) -> dict | list[dict] | None:
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+    # The peers of all the parents requested within the same execution tick are loaded together
+    loader = get_peers_loader(
+        context=context, source_kind=node_schema.kind, schema=node_rel, filters=filters, fields=fields
+    )
+    objs = await loader.load(parent["id"])
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -159,7 +153,24 @@ async def default_paginated_list_resolver(
                     permission_set = edge["node"]
 
         objs = []
-        if edges or "hfid" in filters:
+        if edges and "count" in fields:
+            # Filter, paginate, count and load the attributes of the nodes in a single query
+            objs, response["count"] = await NodeManager.query_with_count(
+                db=db,
+                schema=schema,
+                filters=filters or None,
+                fields=node_fields,
+                at=context.at,
+                branch=context.branch,
+                limit=limit,
+                offset=offset,
+                account=context.account_session,
+                include_source=True,
+                include_owner=True,
+                partial_match=partial_match,
+                node_property_map=context.node_property_map,
+            )
+        elif edges or "hfid" in filters:
             objs = await NodeManager.query(
                 db=db,
                 schema=schema,
@@ -173,9 +184,10 @@ async def default_paginated_list_resolver(
                 include_source=True,
                 include_owner=True,
                 partial_match=partial_match,
+                node_property_map=context.node_property_map,
             )
 
-        if "count" in fields:
+        if "count" in fields and "count" not in response:
             if filters.get("hfid"):
                 response["count"] = len(objs)
             else:
@@ -237,23 +249,15 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
 
     response: dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+    loader = get_peers_loader(
+        context=context, source_kind=node_schema.kind, schema=node_rel, filters=filters, fields=node_fields
+    )
+    objs = await loader.load(parent["id"])
 
-        if not objs:
-            return response
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -334,20 +338,27 @@ async def many_relationship_resolver(
         if not node_fields:
             return response
 
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=ids,
-            source_kind=source_kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            offset=offset,
-            limit=limit,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+        if offset is None and limit is None and not include_descendants:
+            # Without pagination, the peers of all the parents can be loaded together
+            loader = get_peers_loader(
+                context=context, source_kind=source_kind, schema=node_rel, filters=filters, fields=node_fields
+            )
+            objs = await loader.load(parent["id"])
+        else:
+            objs = await NodeManager.query_peers(
+                db=db,
+                ids=ids,
+                source_kind=source_kind,
+                schema=node_rel,
+                filters=filters,
+                fields=node_fields,
+                offset=offset,
+                limit=limit,
+                at=context.at,
+                branch=context.branch,
+                branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+                fetch_peers=True,
+            )
 
         if not objs:
             return response
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+
+from .metrics import (
+    GRAPHQL_SCHEMA_CACHE_HITS_METRICS,
+    GRAPHQL_SCHEMA_CACHE_MISSES_METRICS,
+    GRAPHQL_SCHEMA_CACHE_SIZE_METRICS,
+)
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from .manager import GraphQLTypes
+
+# (hash of the schema, graphql_enums enabled, include_query, include_mutation, include_subscription, include_types)
+GraphQLSchemaCacheKey = tuple[str, bool, bool, bool, bool, bool]
+
+
+@dataclass
+class GraphQLSchemaCacheEntry:
+    schema: GraphQLSchema
+    types: dict[str, GraphQLTypes]
+
+
+class GraphQLSchemaCache:
+    """LRU cache of the GraphQL schemas generated in this process, indexed by the hash of the schema.
+
+    All the SchemaBranch sharing the same hash, like a new branch and the branch it has been created from
+    or a branch coming back to a schema it had before, reuse the same GraphQL schema and graphene types
+    instead of generating them again.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[GraphQLSchemaCacheKey, GraphQLSchemaCacheEntry] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.graphql_schema_cache_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: GraphQLSchemaCacheKey, branch_name: str) -> Optional[GraphQLSchemaCacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            GRAPHQL_SCHEMA_CACHE_MISSES_METRICS.labels(branch_name).inc()
+            return None
+
+        self._entries.move_to_end(key)
+        GRAPHQL_SCHEMA_CACHE_HITS_METRICS.labels(branch_name).inc()
+        return entry
+
+    def set(self, key: GraphQLSchemaCacheKey, entry: GraphQLSchemaCacheEntry) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        GRAPHQL_SCHEMA_CACHE_SIZE_METRICS.set(len(self._entries))
+
+    def clear(self) -> None:
+        self._entries = OrderedDict()
+        GRAPHQL_SCHEMA_CACHE_SIZE_METRICS.set(0)
+
+
+graphql_schema_cache = GraphQLSchemaCache()
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from pydantic import Field
 
+from infrahub.core.models import SchemaBranchHash
 from infrahub.message_bus import InfrahubMessage
 
 
@@ -7,3 +10,6 @@ class EventSchemaUpdate(InfrahubMessage):
     """Sent when the schema on a branch has been updated."""
 
     branch: str = Field(..., description="The branch where the update occurred")
+    schema_hash: Optional[SchemaBranchHash] = Field(
+        default=None, description="The hash of the schema after the update, for the whole schema and for each kind"
+    )
@@ -1,5 +1,17 @@
+from typing import Optional
+
+from pydantic import Field
+
+from infrahub.core.models import SchemaBranchHash
 from infrahub.message_bus import InfrahubMessage
 
 
 class RefreshRegistryBranches(InfrahubMessage):
     """Sent to indicate that the registry should be refreshed and new branch data loaded."""
+
+    branch: Optional[str] = Field(
+        default=None, description="The branch to refresh, all the branches are refreshed if not provided"
+    )
+    schema_hash: Optional[SchemaBranchHash] = Field(
+        default=None, description="The new hash of the schema of the branch, for the whole schema and for each kind"
+    )
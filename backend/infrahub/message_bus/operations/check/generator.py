@@ -37,40 +37,39 @@ async def run(message: messages.CheckGeneratorRun, service: InfrahubServices) ->
         convert_query_response=message.generator_definition.convert_query_response,
     )
 
-    commit_worktree = repository.get_commit_worktree(commit=message.commit)
-
-    file_info = extract_repo_file_information(
-        full_filename=os.path.join(commit_worktree.directory, generator_definition.file_path.as_posix()),
-        repo_directory=repository.directory_root,
-        worktree_directory=commit_worktree.directory,
-    )
-    generator_instance = await _define_instance(message=message, service=service)
-
-    check_message = "Instance successfully generated"
-    try:
-        generator_class = generator_definition.load_class(
-            import_root=repository.directory_root, relative_path=file_info.relative_repo_path_dir
+    with repository.use_commit_worktree(commit=message.commit) as commit_worktree:
+        file_info = extract_repo_file_information(
+            full_filename=os.path.join(commit_worktree.directory, generator_definition.file_path.as_posix()),
+            repo_directory=repository.directory_root,
+            worktree_directory=commit_worktree.directory,
         )
+        generator_instance = await _define_instance(message=message, service=service)
 
-        generator = generator_class(
-            query=generator_definition.query,
-            client=service.client,
-            branch=message.branch_name,
-            params=message.variables,
-            generator_instance=generator_instance.id,
-            convert_query_response=generator_definition.convert_query_response,
-            infrahub_node=InfrahubNode,
-        )
-        await generator.run(identifier=generator_definition.name)
-        generator_instance.status.value = GeneratorInstanceStatus.READY.value
-    except ModuleImportError as exc:
-        conclusion = ValidatorConclusion.FAILURE
-        generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
-        check_message = f"Failed to import generator: {exc.message}"
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        conclusion = ValidatorConclusion.FAILURE
-        generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
-        check_message = f"Failed to execute generator: {str(exc)}"
+        check_message = "Instance successfully generated"
+        try:
+            generator_class = generator_definition.load_class(
+                import_root=repository.directory_root, relative_path=file_info.relative_repo_path_dir
+            )
+
+            generator = generator_class(
+                query=generator_definition.query,
+                client=service.client,
+                branch=message.branch_name,
+                params=message.variables,
+                generator_instance=generator_instance.id,
+                convert_query_response=generator_definition.convert_query_response,
+                infrahub_node=InfrahubNode,
+            )
+            await generator.run(identifier=generator_definition.name)
+            generator_instance.status.value = GeneratorInstanceStatus.READY.value
+        except ModuleImportError as exc:
+            conclusion = ValidatorConclusion.FAILURE
+            generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
+            check_message = f"Failed to import generator: {exc.message}"
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            conclusion = ValidatorConclusion.FAILURE
+            generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
+            check_message = f"Failed to execute generator: {str(exc)}"
 
     await generator_instance.update(do_full_update=True)
 
@@ -11,7 +11,7 @@ log = get_logger()
 async def update(message: messages.EventSchemaUpdate, service: InfrahubServices) -> None:
     log.info("run_message", branch=message.branch)
 
-    msg = messages.RefreshRegistryBranches()
+    msg = messages.RefreshRegistryBranches(branch=message.branch, schema_hash=message.schema_hash)
 
     msg.assign_meta(parent=message)
     await service.send(message=msg)
@@ -12,7 +12,7 @@ async def branches(message: messages.RefreshRegistryBranches, service: InfrahubS
         return
 
     async with service.database.start_session() as db:
-        await refresh_branches(db=db)
+        await refresh_branches(db=db, branch_name=message.branch, schema_hash=message.schema_hash)
 
     await service.component.refresh_schema_hash()
 
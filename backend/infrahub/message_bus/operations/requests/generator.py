@@ -32,35 +32,34 @@ async def run(message: messages.RequestGeneratorRun, service: InfrahubServices)
         convert_query_response=message.generator_definition.convert_query_response,
     )
 
-    commit_worktree = repository.get_commit_worktree(commit=message.commit)
-
-    file_info = extract_repo_file_information(
-        full_filename=os.path.join(commit_worktree.directory, generator_definition.file_path.as_posix()),
-        repo_directory=repository.directory_root,
-        worktree_directory=commit_worktree.directory,
-    )
-    generator_instance = await _define_instance(message=message, service=service)
-
-    try:
-        generator_class = generator_definition.load_class(
-            import_root=repository.directory_root, relative_path=file_info.relative_repo_path_dir
+    with repository.use_commit_worktree(commit=message.commit) as commit_worktree:
+        file_info = extract_repo_file_information(
+            full_filename=os.path.join(commit_worktree.directory, generator_definition.file_path.as_posix()),
+            repo_directory=repository.directory_root,
+            worktree_directory=commit_worktree.directory,
         )
+        generator_instance = await _define_instance(message=message, service=service)
 
-        generator = generator_class(
-            query=generator_definition.query,
-            client=service.client,
-            branch=message.branch_name,
-            params=message.variables,
-            generator_instance=generator_instance.id,
-            convert_query_response=generator_definition.convert_query_response,
-            infrahub_node=InfrahubNode,
-        )
-        await generator.run(identifier=generator_definition.name)
-        generator_instance.status.value = GeneratorInstanceStatus.READY.value
-    except ModuleImportError:
-        generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
-    except Exception:  # pylint: disable=broad-exception-caught
-        generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
+        try:
+            generator_class = generator_definition.load_class(
+                import_root=repository.directory_root, relative_path=file_info.relative_repo_path_dir
+            )
+
+            generator = generator_class(
+                query=generator_definition.query,
+                client=service.client,
+                branch=message.branch_name,
+                params=message.variables,
+                generator_instance=generator_instance.id,
+                convert_query_response=generator_definition.convert_query_response,
+                infrahub_node=InfrahubNode,
+            )
+            await generator.run(identifier=generator_definition.name)
+            generator_instance.status.value = GeneratorInstanceStatus.READY.value
+        except ModuleImportError:
+            generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
+        except Exception:  # pylint: disable=broad-exception-caught
+            generator_instance.status.value = GeneratorInstanceStatus.ERROR.value
 
     await generator_instance.update(do_full_update=True)
 
@@ -631,9 +631,10 @@ async def run_tests(message: messages.RequestProposedChangeRunTests, service: In
                     repository_kind=repository.kind,
                 )
                 commit = repo.get_commit_value(proposed_change.source_branch.value)
-                worktree_directory = Path(repo.get_commit_worktree(commit=commit).directory)
+                with repo.use_commit_worktree(commit=commit) as commit_worktree:
+                    worktree_directory = Path(commit_worktree.directory)
 
-                return_code = await asyncio.to_thread(_execute, worktree_directory, repository, proposed_change)
+                    return_code = await asyncio.to_thread(_execute, worktree_directory, repository, proposed_change)
                 log.info(
                     event="repository_tests_completed",
                     proposed_change=message.proposed_change,
@@ -1,7 +1,8 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from infrahub import lock
 from infrahub.core import registry
+from infrahub.core.models import SchemaBranchHash
 from infrahub.database import InfrahubDatabase
 from infrahub.log import get_logger
 from infrahub.worker import WORKER_IDENTITY
@@ -12,14 +13,23 @@ if TYPE_CHECKING:
 log = get_logger()
 
 
-async def refresh_branches(db: InfrahubDatabase) -> None:
+async def refresh_branches(
+    db: InfrahubDatabase, branch_name: Optional[str] = None, schema_hash: Optional[SchemaBranchHash] = None
+) -> None:
     """Pull all the branches from the database and update the registry.
 
     If a branch is already present with a different value for the hash
     We pull the new schema from the database and we update the registry.
+
+    When the name of a branch already present in the registry and its new schema hash are provided,
+    only this branch is pulled and its schema is only loaded if it does not have this hash already.
     """
 
     async with lock.registry.local_schema_lock():
+        if branch_name and schema_hash and branch_name in registry.branch:
+            await _refresh_branch_schema(db=db, branch_name=branch_name, schema_hash=schema_hash)
+            return
+
         branches = await registry.branch_object.get_list(db=db)
         active_branches = [branch.name for branch in branches]
         for new_branch in branches:
@@ -45,9 +55,23 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
                 log.info("New branch detected, pulling schema", branch=new_branch.name, worker=WORKER_IDENTITY)
                 await registry.schema.load_schema(db=db, branch=new_branch)
 
-        for branch_name in list(registry.branch.keys()):
-            if branch_name not in active_branches:
-                del registry.branch[branch_name]
+        for registry_branch_name in list(registry.branch.keys()):
+            if registry_branch_name not in active_branches:
+                del registry.branch[registry_branch_name]
                 log.info(
-                    f"Removed branch {branch_name!r} from the registry", branch=branch_name, worker=WORKER_IDENTITY
+                    f"Removed branch {registry_branch_name!r} from the registry",
+                    branch=registry_branch_name,
+                    worker=WORKER_IDENTITY,
                 )
+
+
+async def _refresh_branch_schema(db: InfrahubDatabase, branch_name: str, schema_hash: SchemaBranchHash) -> None:
+    branch = await registry.branch_object.get_by_name(name=branch_name, db=db)
+    registry.branch[branch_name] = branch
+
+    if registry.schema.get_schema_branch(name=branch_name).get_hash() == schema_hash.main:
+        log.debug("Schema already up to date", branch=branch_name, hash=schema_hash.main, worker=WORKER_IDENTITY)
+        return
+
+    log.info("New hash detected", branch=branch_name, hash_new=schema_hash.main, worker=WORKER_IDENTITY)
+    await registry.schema.load_schema(db=db, branch=branch)
@@ -0,0 +1,95 @@
+from copy import deepcopy
+
+import pytest
+
+from infrahub.core.constants.database import DatabaseEdgeType
+from infrahub.core.diff.model.path import BranchTrackingId, EnrichedDiffNode, EnrichedDiffs
+from infrahub.core.diff.repository.deserializer import EnrichedDiffDeserializer
+from infrahub.core.diff.repository.repository import DiffRepository
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+from tests.unit.core.diff.factories import (
+    EnrichedAttributeFactory,
+    EnrichedNodeFactory,
+    EnrichedPropertyFactory,
+    EnrichedRootFactory,
+)
+
+NBR_NODES = 2_000
+
+
+def _build_node() -> EnrichedDiffNode:
+    return EnrichedNodeFactory.build(
+        attributes={
+            EnrichedAttributeFactory.build(
+                properties={EnrichedPropertyFactory.build(property_type=DatabaseEdgeType.HAS_VALUE)}
+            )
+            for _ in range(3)
+        },
+        relationships=set(),
+    )
+
+
+def _build_diffs(from_time: Timestamp, to_time: Timestamp) -> EnrichedDiffs:
+    tracking_id = BranchTrackingId(name="branch")
+    base_diff = EnrichedRootFactory.build(
+        base_branch_name="main",
+        diff_branch_name="main",
+        from_time=from_time,
+        to_time=to_time,
+        nodes=set(),
+        tracking_id=tracking_id,
+    )
+    branch_diff = EnrichedRootFactory.build(
+        base_branch_name="main",
+        diff_branch_name="branch",
+        from_time=from_time,
+        to_time=to_time,
+        nodes={_build_node() for _ in range(NBR_NODES)},
+        tracking_id=tracking_id,
+        partner_uuid=base_diff.uuid,
+    )
+    base_diff.partner_uuid = branch_diff.uuid
+    return EnrichedDiffs(
+        base_branch_name="main", diff_branch_name="branch", base_branch_diff=base_diff, diff_branch_diff=branch_diff
+    )
+
+
+def _update_diffs(previous_diffs: EnrichedDiffs, nbr_changes: int) -> EnrichedDiffs:
+    """Previous diffs extended with a new time window where nbr_changes nodes have been added to the branch."""
+    updated_diffs = deepcopy(previous_diffs)
+    updated_diffs.diff_branch_diff.to_time = Timestamp()
+    updated_diffs.base_branch_diff.to_time = updated_diffs.diff_branch_diff.to_time
+    updated_diffs.diff_branch_diff.nodes |= {_build_node() for _ in range(nbr_changes)}
+    updated_diffs.diff_branch_diff.num_added += nbr_changes
+    return updated_diffs
+
+
+@pytest.mark.parametrize("nbr_changes", [1, 10, 100, 1_000])
+@pytest.mark.parametrize("in_place", [False, True])
+def test_diff_repository_update(benchmark, event_loop, db: InfrahubDatabase, nbr_changes: int, in_place: bool):
+    diff_repository = DiffRepository(db=db, deserializer=EnrichedDiffDeserializer())
+    from_time = Timestamp()
+
+    def setup():
+        previous_diffs = _build_diffs(from_time=from_time, to_time=Timestamp())
+        event_loop.run_until_complete(diff_repository.save(enriched_diffs=previous_diffs))
+        return (previous_diffs, _update_diffs(previous_diffs=previous_diffs, nbr_changes=nbr_changes)), {}
+
+    async def _full_save(previous_diffs: EnrichedDiffs, updated_diffs: EnrichedDiffs) -> None:
+        await diff_repository.delete_diff_roots(
+            diff_root_uuids=[previous_diffs.base_branch_diff.uuid, previous_diffs.diff_branch_diff.uuid]
+        )
+        await diff_repository.save(enriched_diffs=updated_diffs)
+
+    def run_update(previous_diffs: EnrichedDiffs, updated_diffs: EnrichedDiffs) -> None:
+        if in_place:
+            event_loop.run_until_complete(
+                diff_repository.update(enriched_diffs=updated_diffs, previous_diffs=previous_diffs)
+            )
+        else:
+            event_loop.run_until_complete(_full_save(previous_diffs=previous_diffs, updated_diffs=updated_diffs))
+
+    benchmark.pedantic(run_update, setup=setup, rounds=5)
+    benchmark.extra_info["nbr_nodes"] = NBR_NODES
+    benchmark.extra_info["nbr_changes"] = nbr_changes
@@ -2,6 +2,7 @@ from graphql import GraphQLSchema
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.schema import AttributeSchema
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.manager import GraphQLSchemaManager
 
@@ -10,7 +11,28 @@ def test_graphql_generate_schema(
     benchmark, db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
 ):
     schema = registry.schema.get_schema_branch(name=default_branch.name)
+
+    def generate() -> GraphQLSchema:
+        return GraphQLSchemaManager(schema=schema).generate()
+
+    result = benchmark(generate)
+
+    assert isinstance(result, GraphQLSchema)
+
+
+def test_graphql_generate_schema_incremental(
+    benchmark, db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
     gqlm = GraphQLSchemaManager(schema=schema)
-    schema = benchmark(gqlm.generate)
+    gqlm.generate()
+
+    def update_and_generate() -> GraphQLSchema:
+        car_schema = schema.get(name="TestCar")
+        car_schema.attributes.append(AttributeSchema(name=f"extra{len(car_schema.attributes)}", kind="Text"))
+        schema.set(name="TestCar", schema=car_schema)
+        return gqlm.generate()
+
+    result = benchmark(update_and_generate)
 
-    assert isinstance(schema, GraphQLSchema)
+    assert isinstance(result, GraphQLSchema)
@@ -0,0 +1,42 @@
+from typing import Any
+
+import pytest
+from starlette.responses import JSONResponse
+
+from infrahub.graphql.app import GraphQLJSONResponse
+
+NBR_NODES = 10_000
+
+
+@pytest.fixture(scope="module")
+def large_graphql_result() -> dict[str, Any]:
+    edges = [
+        {
+            "node": {
+                "id": f"17a8e1c2-{idx:04x}-4d2e-b3f1-6e0a5c9d{idx:04x}",
+                "display_label": f"device-{idx} (équipement)",
+                "name": {"value": f"device-{idx}"},
+                "description": {"value": None},
+                "status": {"value": "active", "updated_at": "2024-09-01T10:00:00.000000Z"},
+                "interfaces": {"count": 48, "edges": [{"node": {"id": f"{idx}-{port}"}} for port in range(4)]},
+            }
+        }
+        for idx in range(NBR_NODES)
+    ]
+    return {"data": {"InfraDevice": {"count": NBR_NODES, "edges": edges}}}
+
+
+def test_graphql_response_render_json(benchmark, large_graphql_result: dict[str, Any]):
+    def render() -> int:
+        response = JSONResponse(large_graphql_result)
+        return len(response.render(large_graphql_result))
+
+    assert benchmark(render) > 0
+
+
+def test_graphql_response_render_ujson(benchmark, large_graphql_result: dict[str, Any]):
+    def render() -> int:
+        response = GraphQLJSONResponse(large_graphql_result)
+        return len(response.body)
+
+    assert benchmark(render) > 0
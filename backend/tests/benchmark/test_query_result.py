@@ -0,0 +1,78 @@
+import pytest
+from neo4j._codec.hydration.v1 import HydrationHandler
+
+from infrahub.core.query import Query, QueryResult, QueryType
+
+NBR_RECORDS = 1_000_000
+NBR_NODES = 10_000
+LABELS = ["n", "a", "r1", "r2"]
+
+
+class SyntheticQuery(Query):
+    name = "synthetic"
+    type = QueryType.READ
+
+    async def query_init(self, db, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def synthetic_records() -> list[list]:
+    """Records of a node, one of its attributes and 2 relationships, with several versions of each attribute on 2 branches."""
+    graph_hydrator = HydrationHandler().new_hydration_scope()._graph_hydrator
+
+    nodes = [graph_hydrator.hydrate_node(idx, {"Node"}, {"uuid": f"n{idx}"}, str(idx)) for idx in range(NBR_NODES)]
+    attributes = [
+        graph_hydrator.hydrate_node(NBR_NODES + idx, {"Attribute"}, {"name": f"attr{idx}"}, str(NBR_NODES + idx))
+        for idx in range(10)
+    ]
+    rels = [
+        graph_hydrator.hydrate_relationship(
+            idx,
+            0,
+            1,
+            "HAS_ATTRIBUTE",
+            {
+                "branch": "main" if idx % 2 else "branch1",
+                "branch_level": 1 if idx % 2 else 2,
+                "from": "2024-09-01T10:00:00.000000Z",
+                "to": None if idx % 3 else "2024-09-02T10:00:00.000000Z",
+                "status": "deleted" if idx % 50 == 0 else "active",
+            },
+        )
+        for idx in range(100)
+    ]
+
+    return [
+        [nodes[idx % NBR_NODES], attributes[idx % 10], rels[idx % 100], rels[(idx * 7) % 100]]
+        for idx in range(NBR_RECORDS)
+    ]
+
+
+def test_query_result_init(benchmark, synthetic_records: list[list]):
+    def build() -> list[QueryResult]:
+        return [QueryResult(data=record, labels=LABELS) for record in synthetic_records]
+
+    assert len(benchmark(build)) == NBR_RECORDS
+
+
+def test_query_get_results(benchmark, synthetic_records: list[list]):
+    query = SyntheticQuery()
+    query.return_labels = LABELS
+
+    def get_results() -> int:
+        query.results = [QueryResult(data=record, labels=LABELS) for record in synthetic_records]
+        return len(list(query.get_results()))
+
+    assert benchmark(get_results) == NBR_RECORDS
+
+
+def test_query_get_results_group_by(benchmark, synthetic_records: list[list]):
+    query = SyntheticQuery()
+    query.return_labels = LABELS
+
+    def get_results_group_by() -> int:
+        query.results = [QueryResult(data=record, labels=LABELS) for record in synthetic_records]
+        return len(list(query.get_results_group_by(("n", "uuid"), ("a", "name"))))
+
+    assert benchmark(get_results_group_by) > 0
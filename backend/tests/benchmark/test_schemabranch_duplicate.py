@@ -1,8 +1,30 @@
+import tracemalloc
+
 from infrahub.core import registry
+from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.database import InfrahubDatabase
 
+NBR_BRANCHES = 200
+
 
 def test_schemabranch_duplicate(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
     schema = registry.schema.get_schema_branch(name=default_branch.name)
     new_schema = benchmark(schema.duplicate)
     assert new_schema.get_hash() == schema.get_hash()
+
+
+def test_schemabranch_duplicate_memory(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    """Memory allocated to keep the schema of many branches created from the default branch."""
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+
+    def duplicate_branches() -> list[SchemaBranch]:
+        return [schema.duplicate(name=f"branch{idx}") for idx in range(NBR_BRANCHES)]
+
+    tracemalloc.start()
+    branch_schemas = duplicate_branches()
+    memory_usage, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["memory_usage_bytes"] = memory_usage
+
+    benchmark(duplicate_branches)
+    assert all(branch_schema.get_hash() == schema.get_hash() for branch_schema in branch_schemas)
@@ -0,0 +1,52 @@
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.schema import SchemaRoot
+from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.database import InfrahubDatabase
+
+NBR_KINDS = 300
+
+
+@pytest.fixture
+def large_schema_branch(db: InfrahubDatabase, default_branch, register_core_models_schema) -> SchemaBranch:
+    nodes = []
+    for idx in range(NBR_KINDS):
+        nodes.append(
+            {
+                "name": f"Model{idx:03d}",
+                "namespace": "Bench",
+                "default_filter": "name__value",
+                "attributes": [
+                    {"name": "name", "kind": "Text", "unique": True},
+                    {"name": "description", "kind": "Text", "optional": True},
+                    {"name": "status", "kind": "Text", "optional": True},
+                    {"name": "weight", "kind": "Number", "optional": True},
+                ],
+                "relationships": [
+                    {
+                        "name": "previous",
+                        "peer": f"BenchModel{max(idx - 1, 0):03d}",
+                        "identifier": f"bench_model_{idx:03d}__previous",
+                        "cardinality": "one",
+                        "optional": True,
+                    },
+                ],
+            }
+        )
+
+    schema = registry.schema.get_schema_branch(name=default_branch.name).duplicate()
+    schema.load_schema(schema=SchemaRoot(nodes=nodes))
+    schema.process()
+    return schema
+
+
+@pytest.mark.parametrize("duplicate", [True, False])
+def test_schemabranch_get_all_kinds(benchmark, large_schema_branch: SchemaBranch, duplicate: bool):
+    names = large_schema_branch.node_names
+
+    def get_all() -> None:
+        for name in names:
+            large_schema_branch.get(name=name, duplicate=duplicate)
+
+    benchmark(get_all)
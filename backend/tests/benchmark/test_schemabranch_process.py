@@ -1,7 +1,67 @@
+from typing import Optional
+
+import pytest
+
 from infrahub.core import registry
+from infrahub.core.schema import AttributeSchema, SchemaRoot
+from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.database import InfrahubDatabase
 
+NBR_KINDS = 500
+
 
 def test_schemabranch_process(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
     schema = registry.schema.get_schema_branch(name=default_branch.name)
     benchmark(schema.process)
+
+
+@pytest.fixture
+def large_schema(register_core_models_schema: SchemaBranch) -> SchemaBranch:
+    """Core models extended with a generic implemented by many nodes, each node having a relationship to the previous one."""
+    schema = register_core_models_schema.duplicate()
+    schema.load_schema(
+        schema=SchemaRoot(
+            generics=[
+                {
+                    "name": "Item",
+                    "namespace": "Test",
+                    "attributes": [{"name": "name", "kind": "Text", "unique": True}],
+                }
+            ],
+            nodes=[
+                {
+                    "name": f"Item{idx}",
+                    "namespace": "Test",
+                    "inherit_from": ["TestItem"],
+                    "attributes": [{"name": f"value{nbr}", "kind": "Text", "optional": True} for nbr in range(10)],
+                    "relationships": [
+                        {
+                            "name": "previous",
+                            "peer": f"TestItem{max(idx - 1, 0)}",
+                            "cardinality": "one",
+                            "optional": True,
+                        }
+                    ],
+                }
+                for idx in range(NBR_KINDS)
+            ],
+        )
+    )
+    schema.process()
+    return schema
+
+
+def _update_and_process(schema: SchemaBranch, kind: str, kinds: Optional[list[str]]) -> None:
+    updated_schema = schema.get(name=kind)
+    updated_schema.attributes.append(AttributeSchema(name="extra", kind="Text", optional=True))
+    schema.set(name=kind, schema=updated_schema)
+    schema.process(kinds=kinds)
+
+
+@pytest.mark.parametrize("kind", ["TestItem10", "TestItem"])
+@pytest.mark.parametrize("incremental", [False, True])
+def test_schemabranch_process_one_kind_changed(benchmark, large_schema: SchemaBranch, kind: str, incremental: bool):
+    def setup():
+        return (large_schema.duplicate(), kind, [kind] if incremental else None), {}
+
+    benchmark.pedantic(_update_and_process, setup=setup, rounds=10)
@@ -0,0 +1,93 @@
+import inspect
+from pathlib import Path
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.manager import NodeManager
+from infrahub.core.query.node import (
+    NodeGetListQuery,
+    NodeGetListWithAttributesQuery,
+    NodeListGetAttributeQuery,
+    NodeListGetInfoQuery,
+)
+from infrahub.database import QueryConfig
+from infrahub.log import get_logger
+from tests.helpers.query_benchmark.car_person_generators import CarGenerator
+from tests.helpers.query_benchmark.data_generator import load_data_and_profile
+from tests.helpers.query_benchmark.db_query_profiler import BenchmarkConfig, GraphProfileGenerator
+from tests.query_benchmark.conftest import RESULTS_FOLDER
+from tests.query_benchmark.utils import start_db_and_create_default_branch
+
+log = get_logger()
+
+FIELDS = {"name": {"value": None}, "nbr_seats": {"value": None}, "color": {"value": None}}
+
+
+async def benchmark_node_list_query(
+    car_person_schema_root,
+    graph_generator: GraphProfileGenerator,
+    benchmark_config: BenchmarkConfig,
+    nb_cars: int,
+    single_query: bool,
+    test_name: str,
+):
+    """
+    Profile the queries executed to load a page of cars with their count, as done by the paginated GraphQL resolver,
+    either with one query per step or with a single query returning the page, the attributes and the count.
+    """
+
+    # Initialization
+    query_names = [
+        NodeGetListQuery.name,
+        NodeGetListWithAttributesQuery.name,
+        NodeListGetInfoQuery.name,
+        NodeListGetAttributeQuery.name,
+    ]
+    queries_names_to_config = {name: QueryConfig(neo4j_runtime=benchmark_config.neo4j_runtime) for name in query_names}
+    db_profiling_queries, default_branch = await start_db_and_create_default_branch(
+        neo4j_image=benchmark_config.neo4j_image,
+        load_indexes=benchmark_config.load_db_indexes,
+        queries_names_to_config=queries_names_to_config,
+    )
+    registry.schema.register_schema(schema=car_person_schema_root, branch=default_branch.name)
+
+    # Build function to profile
+    async def query_page():
+        if single_query:
+            nodes, count = await NodeManager.query_with_count(
+                db=db_profiling_queries, schema="TestCar", fields=FIELDS, branch=default_branch, offset=50, limit=50
+            )
+        else:
+            nodes = await NodeManager.query(
+                db=db_profiling_queries, schema="TestCar", fields=FIELDS, branch=default_branch, offset=50, limit=50
+            )
+            count = await NodeManager.count(db=db_profiling_queries, schema="TestCar", branch=default_branch)
+        assert len(nodes) == min(max(count - 50, 0), 50)
+
+    cars_generator = CarGenerator(db=db_profiling_queries)
+    module_name = Path(__file__).stem
+    graph_output_location = RESULTS_FOLDER / module_name / test_name
+
+    await load_data_and_profile(
+        data_generator=cars_generator,
+        func_call=query_page,
+        profile_frequency=nb_cars // 100,
+        nb_elements=nb_cars,
+        graphs_output_location=graph_output_location,
+        test_label=f"{nb_cars} cars ; single query: {single_query}",
+        graph_generator=graph_generator,
+    )
+
+
+@pytest.mark.parametrize("nb_cars", [10_000, 100_000])
+@pytest.mark.parametrize("single_query", [False, True])
+async def test_query_page_with_count(nb_cars, single_query, car_person_schema_root, graph_generator):
+    await benchmark_node_list_query(
+        car_person_schema_root=car_person_schema_root,
+        graph_generator=graph_generator,
+        benchmark_config=BenchmarkConfig(),
+        nb_cars=nb_cars,
+        single_query=single_query,
+        test_name=inspect.currentframe().f_code.co_name,
+    )
@@ -51,6 +51,63 @@ async def test_graphql_endpoint(db: InfrahubDatabase, client, client_headers, de
     assert len(result_per_name["Jane"]["node"]["cars"]["edges"]) == 1
 
 
+async def test_graphql_endpoint_batch(
+    db: InfrahubDatabase, client, client_headers, default_branch: Branch, car_person_data
+):
+    query_persons = """
+    query {
+        TestPerson {
+            count
+        }
+    }
+    """
+    query_cars = """
+    query GetCars($name: String!) {
+        TestCar(name__value: $name) {
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    # Must execute in a with block to execute the startup/shutdown events
+    with client:
+        response = client.post(
+            "/graphql",
+            json=[
+                {"query": query_persons},
+                {"query": query_cars, "variables": {"name": "volt"}, "operationName": "GetCars"},
+                {"query": "query { TestPerson {"},
+                {"variables": {}},
+            ],
+            headers=client_headers,
+        )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result) == 4
+    assert result[0] == {"data": {"TestPerson": {"count": 2}}}
+    assert result[1] == {"data": {"TestCar": {"edges": [{"node": {"name": {"value": "volt"}}}]}}}
+    assert result[2]["data"] is None
+    assert "Syntax Error" in result[2]["errors"][0]["message"]
+    assert result[3] == {
+        "data": None,
+        "errors": [
+            {"message": "Each operation of the batch must be an Object with a query", "extensions": {"code": 400}}
+        ],
+    }
+
+    with client:
+        response = client.post("/graphql", json=[], headers=client_headers)
+
+    assert response.status_code == 400
+
+
 async def test_graphql_endpoint_with_timestamp(
     db: InfrahubDatabase, client, client_headers, default_branch: Branch, car_person_data
 ):
@@ -0,0 +1,101 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from infrahub.core.branch import Branch
+from infrahub.core.constants import InfrahubKind
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+
+
+async def test_bulk_create_nodes(
+    db: InfrahubDatabase,
+    client: TestClient,
+    admin_headers,
+    default_branch: Branch,
+    authentication_base,
+    person_albert_main: Node,
+):
+    data = [
+        {"name": {"value": f"car{idx:02d}"}, "nbr_seats": {"value": idx}, "owner": {"id": person_albert_main.id}}
+        for idx in range(3)
+    ]
+
+    with client:
+        response = client.post(
+            "/api/node/bulk", headers=admin_headers, json={"kind": "TestCar", "data": data, "batch_size": 2}
+        )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert set(payload.keys()) == {"kind", "ids", "count", "duration", "throughput"}
+    assert payload["kind"] == "TestCar"
+    assert payload["count"] == 3
+    assert len(payload["ids"]) == 3
+    assert payload["duration"] >= 0
+    assert payload["throughput"] >= 0
+
+    cars = await NodeManager.get_many(db=db, ids=payload["ids"], branch=default_branch)
+    assert [cars[car_id].name.value for car_id in payload["ids"]] == ["car00", "car01", "car02"]
+
+
+@pytest.mark.parametrize(
+    "kind", [InfrahubKind.REPOSITORY, InfrahubKind.GENERICREPOSITORY, InfrahubKind.IPPREFIX, InfrahubKind.ACCOUNTTOKEN]
+)
+async def test_bulk_create_nodes_unsupported_kind(
+    db: InfrahubDatabase,
+    client: TestClient,
+    admin_headers,
+    default_branch: Branch,
+    authentication_base,
+    kind: str,
+):
+    with client:
+        response = client.post("/api/node/bulk", headers=admin_headers, json={"kind": kind, "data": [{}]})
+
+    assert response.status_code == 422
+    assert response.json()["errors"][0]["message"] == f"Nodes of kind {kind} can't be created in bulk"
+
+
+async def test_bulk_create_nodes_invalid_data(
+    db: InfrahubDatabase,
+    client: TestClient,
+    admin_headers,
+    default_branch: Branch,
+    authentication_base,
+    person_albert_main: Node,
+):
+    data = [{"name": {"value": "accord"}, "owner": {"id": person_albert_main.id}}] * 2
+
+    with client:
+        response = client.post("/api/node/bulk", headers=admin_headers, json={"kind": "TestCar", "data": data})
+
+    assert response.status_code == 422
+    assert not await NodeManager.query(db=db, schema="TestCar", branch=default_branch)
+
+
+async def test_bulk_create_nodes_permission_failure(
+    db: InfrahubDatabase,
+    client: TestClient,
+    default_branch: Branch,
+    first_account: Node,
+    authentication_base,
+    person_albert_main: Node,
+):
+    token = await Node.init(db=db, schema=InfrahubKind.ACCOUNTTOKEN)
+    await token.new(db=db, token="unprivileged", account=first_account)
+    await token.save(db=db)
+
+    with client:
+        response = client.post(
+            "/api/node/bulk",
+            headers={"X-INFRAHUB-KEY": "unprivileged"},
+            json={"kind": "TestCar", "data": [{"name": {"value": "accord"}, "owner": {"id": person_albert_main.id}}]},
+        )
+
+    assert response.status_code == 403
+    assert (
+        response.json()["errors"][0]["message"]
+        == f"You are not allowed to change data in the default branch '{default_branch.name}'"
+    )
+    assert not await NodeManager.query(db=db, schema="TestCar", branch=default_branch)
@@ -1,13 +1,16 @@
 from unittest.mock import AsyncMock
 
+from infrahub import config
 from infrahub.core.branch import Branch
 from infrahub.core.constants import DiffAction
 from infrahub.core.constants.database import DatabaseEdgeType
 from infrahub.core.diff.coordinator import DiffCoordinator
 from infrahub.core.diff.data_check_synchronizer import DiffDataCheckSynchronizer
+from infrahub.core.diff.model.path import TimeRange
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.dependencies.registry import get_component_registry
 
@@ -49,3 +52,58 @@ class TestDiffCoordinator:
                 assert prop_diff.action is DiffAction.REMOVED
                 assert prop_diff.conflict is None
                 assert prop_diff.new_value is None
+
+    async def test_branch_diff_updated_in_place(
+        self, db: InfrahubDatabase, default_branch: Branch, person_john_main: Node, person_jane_main: Node
+    ):
+        branch = await create_branch(db=db, branch_name="branch")
+        person_john = await NodeManager.get_one(db=db, branch=branch, id=person_john_main.id)
+        person_john.height.value = 180
+        await person_john.save(db=db)
+
+        component_registry = get_component_registry()
+        diff_coordinator = await component_registry.get_component(DiffCoordinator, db=db, branch=branch)
+        diff_coordinator.data_check_synchronizer = AsyncMock(spec=DiffDataCheckSynchronizer)
+        wrapped_repo = AsyncMock(wraps=diff_coordinator.diff_repo)
+        diff_coordinator.diff_repo = wrapped_repo
+        first_diff = await diff_coordinator.update_branch_diff(base_branch=default_branch, diff_branch=branch)
+        wrapped_repo.save.assert_awaited_once()
+
+        person_jane = await NodeManager.get_one(db=db, branch=branch, id=person_jane_main.id)
+        person_jane.height.value = 165
+        await person_jane.save(db=db)
+        second_diff = await diff_coordinator.update_branch_diff(base_branch=default_branch, diff_branch=branch)
+
+        wrapped_repo.update.assert_awaited_once()
+        wrapped_repo.delete_diff_roots.assert_not_awaited()
+        assert second_diff.uuid == first_diff.uuid
+        assert second_diff.partner_uuid == first_diff.partner_uuid
+        assert {n.uuid for n in second_diff.nodes} == {person_john_main.id, person_jane_main.id}
+        retrieved = await diff_coordinator.diff_repo.get_one(diff_branch_name=branch.name, diff_id=first_diff.uuid)
+        assert retrieved.to_time == second_diff.to_time
+        assert {n.uuid for n in retrieved.nodes} == {person_john_main.id, person_jane_main.id}
+
+    async def test_split_time_range(self, db: InfrahubDatabase, default_branch: Branch, monkeypatch):
+        monkeypatch.setattr(config.SETTINGS.database, "diff_split_threshold", 3600)
+        monkeypatch.setattr(config.SETTINGS.database, "diff_max_concurrency", 4)
+        component_registry = get_component_registry()
+        diff_coordinator = await component_registry.get_component(DiffCoordinator, db=db, branch=default_branch)
+        from_time = Timestamp("2024-10-01T00:00:00Z")
+
+        time_ranges = diff_coordinator._split_time_range(from_time=from_time, to_time=from_time.add_delta(minutes=30))
+        assert time_ranges == [TimeRange(from_time=from_time, to_time=from_time.add_delta(minutes=30))]
+
+        to_time = from_time.add_delta(hours=2, minutes=30)
+        time_ranges = diff_coordinator._split_time_range(from_time=from_time, to_time=to_time)
+        assert [(tr.from_time, tr.to_time) for tr in time_ranges] == [
+            (from_time, from_time.add_delta(minutes=50)),
+            (from_time.add_delta(minutes=50), from_time.add_delta(hours=1, minutes=40)),
+            (from_time.add_delta(hours=1, minutes=40), to_time),
+        ]
+
+        to_time = from_time.add_delta(hours=10)
+        time_ranges = diff_coordinator._split_time_range(from_time=from_time, to_time=to_time)
+        assert len(time_ranges) == 4
+        assert time_ranges[0].from_time == from_time
+        assert time_ranges[1].from_time == from_time.add_delta(hours=2, minutes=30)
+        assert time_ranges[-1].to_time == to_time
@@ -4,7 +4,7 @@ from infrahub.core.branch import Branch
 from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.constants.database import DatabaseEdgeType
 from infrahub.core.diff.calculator import DiffCalculator
-from infrahub.core.diff.model.path import NodeFieldSpecifier
+from infrahub.core.diff.model.path import NodeFieldSpecifier, TimeRange
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -2289,3 +2289,46 @@ async def test_property_update_then_relationship_deleted(
 
     base_diff_root = calculated_diffs.base_branch_diff
     assert base_diff_root.nodes == []
+
+
+async def test_diff_calculated_over_consecutive_time_ranges(
+    db: InfrahubDatabase, default_branch: Branch, person_alfred_main, person_john_main, car_accord_main
+):
+    branch = await create_branch(db=db, branch_name="branch")
+    from_time = Timestamp(branch.created_at)
+    alfred_branch = await NodeManager.get_one(db=db, branch=branch, id=person_alfred_main.id)
+    alfred_branch.name.value = "Little Alfred"
+    await alfred_branch.save(db=db)
+    split_time = Timestamp()
+    alfred_main = await NodeManager.get_one(db=db, branch=default_branch, id=person_alfred_main.id)
+    alfred_main.name.value = "Big Alfred"
+    await alfred_main.save(db=db)
+    john_branch = await NodeManager.get_one(db=db, branch=branch, id=person_john_main.id)
+    john_branch.name.value = "Little John"
+    await john_branch.save(db=db)
+    to_time = Timestamp()
+
+    diff_calculator = DiffCalculator(db=db)
+    first_diffs, second_diffs = await diff_calculator.calculate_diffs(
+        base_branch=default_branch,
+        diff_branch=branch,
+        time_ranges=[
+            TimeRange(from_time=from_time, to_time=split_time),
+            TimeRange(from_time=split_time, to_time=to_time),
+        ],
+    )
+
+    assert first_diffs.diff_branch_diff.from_time == from_time
+    assert first_diffs.diff_branch_diff.to_time == split_time
+    assert {n.uuid for n in first_diffs.diff_branch_diff.nodes} == {person_alfred_main.id}
+    assert first_diffs.base_branch_diff.nodes == []
+    assert second_diffs.diff_branch_diff.from_time == split_time
+    assert second_diffs.diff_branch_diff.to_time == to_time
+    assert {n.uuid for n in second_diffs.diff_branch_diff.nodes} == {person_john_main.id}
+    # the field changed on the branch during the first time range is included in the base diff of the second one
+    base_nodes = second_diffs.base_branch_diff.nodes
+    assert {n.uuid for n in base_nodes} == {person_alfred_main.id}
+    assert len(base_nodes[0].attributes) == 1
+    property_diff = base_nodes[0].attributes[0].properties[0]
+    assert property_diff.property_type == DatabaseEdgeType.HAS_VALUE
+    assert property_diff.new_value == "Big Alfred"
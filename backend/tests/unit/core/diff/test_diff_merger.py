@@ -327,7 +327,8 @@ class TestMergeDiff:
     ):
         empty_diff_root.nodes = {added_person_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_batch.return_value = sorted(empty_diff_root.nodes, key=lambda n: n.uuid)
+        mock_diff_repository.get_conflicted_relationship_elements.return_value = []
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -335,11 +336,16 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.MAX_NODE_BATCH_SIZE,
+                after_node_uuid=None,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_batch.await_args_list == expected_awaits
 
         retrieved_node = await NodeManager.get_one(
             db=db, id=person_node_branch.id, branch=default_branch, include_owner=True, include_source=True
@@ -356,6 +362,47 @@ class TestMergeDiff:
         car_element = car_elements_by_peer_id[car_node_branch.id]
         assert car_element.source_id == car_node_branch.id
 
+    async def test_merge_nodes_in_batches(
+        self,
+        db: InfrahubDatabase,
+        default_branch: Branch,
+        source_branch: Branch,
+        person_node_branch: Node,
+        car_node_branch: Node,
+        mock_diff_repository: DiffRepository,
+        diff_merger: DiffMerger,
+        empty_diff_root: EnrichedDiffRoot,
+        added_person_node_diff: EnrichedDiffNode,
+    ):
+        added_car_node_diff = self._get_empty_node_diff(node=car_node_branch, action=DiffAction.ADDED)
+        node_batches = sorted([added_person_node_diff, added_car_node_diff], key=lambda n: n.uuid)
+        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
+        mock_diff_repository.get_node_batch.side_effect = [[node_batches[0]], [node_batches[1]], []]
+        mock_diff_repository.get_conflicted_relationship_elements.return_value = []
+        diff_merger.MAX_NODE_BATCH_SIZE = 1
+        at = Timestamp()
+
+        await diff_merger.merge_graph(at=at)
+
+        assert mock_diff_repository.get_node_batch.await_args_list == [
+            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid, limit=1, after_node_uuid=None),
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=1,
+                after_node_uuid=node_batches[0].uuid,
+            ),
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=1,
+                after_node_uuid=node_batches[1].uuid,
+            ),
+        ]
+        mock_diff_repository.get_conflicted_relationship_elements.assert_awaited_once_with(diff_id=empty_diff_root.uuid)
+        retrieved_node = await NodeManager.get_one(db=db, id=person_node_branch.id, branch=default_branch)
+        assert retrieved_node.height.value == person_node_branch.height.value
+
     @pytest.mark.parametrize("check_idempotent", [False, True])
     async def test_merge_node_deleted(
         self,
@@ -374,7 +421,8 @@ class TestMergeDiff:
         await person_branch.delete(db=db)
         empty_diff_root.nodes = {deleted_person_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_batch.return_value = sorted(empty_diff_root.nodes, key=lambda n: n.uuid)
+        mock_diff_repository.get_conflicted_relationship_elements.return_value = []
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -382,11 +430,16 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.MAX_NODE_BATCH_SIZE,
+                after_node_uuid=None,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_batch.await_args_list == expected_awaits
 
         with pytest.raises(NodeNotFoundError):
             await NodeManager.get_one(db=db, branch=default_branch, id=person_node_main.id, raise_on_error=True)
@@ -418,13 +471,17 @@ class TestMergeDiff:
         deleted_node_diff.conflict = node_conflict
         empty_diff_root.nodes = {deleted_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_batch.return_value = sorted(empty_diff_root.nodes, key=lambda n: n.uuid)
+        mock_diff_repository.get_conflicted_relationship_elements.return_value = []
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
 
-        mock_diff_repository.get_one.assert_awaited_once_with(
-            diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid
+        mock_diff_repository.get_node_batch.assert_awaited_once_with(
+            diff_branch_name=source_branch.name,
+            diff_id=empty_diff_root.uuid,
+            limit=DiffMerger.MAX_NODE_BATCH_SIZE,
+            after_node_uuid=None,
         )
         if expect_deleted:
             with pytest.raises(NodeNotFoundError):
@@ -634,7 +691,8 @@ class TestMergeDiff:
 
         empty_diff_root.nodes = {updated_person_node_diff, updated_car_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_batch.return_value = sorted(empty_diff_root.nodes, key=lambda n: n.uuid)
+        mock_diff_repository.get_conflicted_relationship_elements.return_value = []
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -642,11 +700,16 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.MAX_NODE_BATCH_SIZE,
+                after_node_uuid=None,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_batch.await_args_list == expected_awaits
         updated_person = await NodeManager.get_one(
             db=db, branch=default_branch, id=person_node_main.id, include_owner=True
         )
@@ -1,4 +1,5 @@
 import random
+from copy import deepcopy
 from dataclasses import replace
 from datetime import UTC
 from uuid import uuid4
@@ -7,10 +8,11 @@ import pytest
 from pendulum.datetime import DateTime
 
 from infrahub import config
-from infrahub.core.constants import DiffAction
+from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.constants.database import DatabaseEdgeType
 from infrahub.core.diff.model.path import (
     BranchTrackingId,
+    ConflictedRelationshipElement,
     EnrichedDiffNode,
     EnrichedDiffRoot,
     EnrichedDiffs,
@@ -25,6 +27,7 @@ from infrahub.exceptions import ResourceNotFoundError
 
 from .factories import (
     EnrichedAttributeFactory,
+    EnrichedConflictFactory,
     EnrichedNodeFactory,
     EnrichedPropertyFactory,
     EnrichedRelationshipElementFactory,
@@ -679,6 +682,131 @@ class TestDiffRepositorySaveAndLoad:
         assert len(retrieved) == len(diffs)
         assert set(retrieved) == set(diffs)
 
+    async def test_update_diff_in_place(self, diff_repository: DiffRepository, reset_database):
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=self._build_nodes(num_nodes=5, num_sub_fields=2),
+            tracking_id=BranchTrackingId(name=self.diff_branch_name),
+        )
+        enriched_diffs = await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        updated_diffs = deepcopy(enriched_diffs)
+        branch_diff = updated_diffs.diff_branch_diff
+        branch_diff.to_time = Timestamp(self.diff_to_time.add(minutes=10))
+        branch_diff.num_added += 1
+        parent_node, parent_rel, removed_node = next(
+            (node, rel, child_node)
+            for node in branch_diff.nodes
+            for rel in node.relationships
+            for child_node in rel.nodes
+            if not child_node.get_all_child_nodes()
+        )
+        parent_rel.nodes.remove(removed_node)
+        branch_diff.nodes.remove(removed_node)
+        updated_node = next(node for node in branch_diff.get_nodes_without_parents() if node.uuid != parent_node.uuid)
+        updated_node.label = "new-label"
+        added_node = self.build_diff_node(num_sub_fields=1)
+        branch_diff.nodes.add(added_node)
+
+        node_uuids_to_save, node_uuids_to_delete = diff_repository._get_changed_node_uuids(
+            diff_root=branch_diff, previous_diff_root=enriched_diffs.diff_branch_diff
+        )
+        assert node_uuids_to_save == {parent_node.uuid, updated_node.uuid, added_node.uuid}
+        assert node_uuids_to_delete == {parent_node.uuid, updated_node.uuid, removed_node.uuid}
+
+        await diff_repository.update(enriched_diffs=updated_diffs, previous_diffs=enriched_diffs)
+
+        retrieved = await diff_repository.get_pairs(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time.add(minutes=10)),
+        )
+        assert len(retrieved) == 1
+        assert retrieved[0] == updated_diffs
+
+    async def test_get_node_batches(self, diff_repository: DiffRepository, reset_database):
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=self._build_nodes(num_nodes=5, num_sub_fields=2),
+        )
+        await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        retrieved_uuids: list[str] = []
+        after_node_uuid = None
+        while True:
+            node_batch = await diff_repository.get_node_batch(
+                diff_branch_name=self.diff_branch_name,
+                diff_id=enriched_diff.uuid,
+                limit=3,
+                after_node_uuid=after_node_uuid,
+            )
+            assert len(node_batch) <= 3
+            if not node_batch:
+                break
+            retrieved_uuids.extend(n.uuid for n in node_batch)
+            after_node_uuid = node_batch[-1].uuid
+
+        assert retrieved_uuids == sorted(n.uuid for n in enriched_diff.nodes)
+
+    async def test_get_conflicted_relationship_elements(self, diff_repository: DiffRepository, reset_database):
+        is_related_property = EnrichedPropertyFactory.build(
+            property_type=DatabaseEdgeType.IS_RELATED, previous_value="peer-1", new_value="peer-2"
+        )
+        conflicted_element = EnrichedRelationshipElementFactory.build(
+            properties={is_related_property}, conflict=EnrichedConflictFactory.build()
+        )
+        node = EnrichedNodeFactory.build(
+            attributes=set(),
+            relationships={
+                EnrichedRelationshipGroupFactory.build(
+                    name="owner",
+                    cardinality=RelationshipCardinality.ONE,
+                    relationships={conflicted_element},
+                ),
+                EnrichedRelationshipGroupFactory.build(
+                    name="tags",
+                    cardinality=RelationshipCardinality.MANY,
+                    relationships={
+                        EnrichedRelationshipElementFactory.build(
+                            properties={EnrichedPropertyFactory.build(property_type=DatabaseEdgeType.IS_RELATED)},
+                            conflict=EnrichedConflictFactory.build(),
+                        )
+                    },
+                ),
+            },
+        )
+        enriched_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes={node} | self._build_nodes(num_nodes=2, num_sub_fields=2),
+        )
+        await self._save_single_diff(diff_repository=diff_repository, enriched_diff=enriched_diff)
+
+        conflicted_elements = await diff_repository.get_conflicted_relationship_elements(diff_id=enriched_diff.uuid)
+
+        assert (
+            ConflictedRelationshipElement(
+                node_uuid=node.uuid,
+                node_kind=node.kind,
+                relationship_name="owner",
+                previous_peer_id="peer-1",
+                new_peer_id="peer-2",
+            )
+            in conflicted_elements
+        )
+        assert all(
+            element.relationship_name != "tags" for element in conflicted_elements if element.node_uuid == node.uuid
+        )
+
     async def test_get_by_tracking_id(self, diff_repository: DiffRepository, reset_database):
         branch_tracking_id = BranchTrackingId(name=self.diff_branch_name)
         name_tracking_id = NameTrackingId(name="an very cool diff")
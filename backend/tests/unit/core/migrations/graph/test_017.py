@@ -0,0 +1,114 @@
+from infrahub import config
+from infrahub.config import TemporalFormat
+from infrahub.core.graph.index import temporal_rel_indexes
+from infrahub.core.migrations.graph.m017_convert_temporal_format import Migration017, convert_time
+from infrahub.core.node import Node
+from infrahub.core.query import Query, QueryType
+from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import get_temporal_formats
+from infrahub.database import DatabaseType, InfrahubDatabase
+
+
+class TimesQuery(Query):
+    name = "test_017_times"
+    type = QueryType.READ
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.add_to_query("MATCH ()-[r]->() WHERE r.from IS NOT NULL")
+        self.return_labels = ["r.from AS from_time", "r.to AS to_time"]
+
+
+async def get_times(db: InfrahubDatabase) -> list:
+    query = await TimesQuery.init(db=db)
+    await query.execute(db=db)
+    return [(result.get("from_time"), result.get("to_time")) for result in query.get_results()]
+
+
+async def test_migration_017_iso8601(db: InfrahubDatabase, default_branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+    times_before = await get_times(db=db)
+
+    migration = Migration017()
+    execution_result = await migration.execute(db=db)
+    assert not execution_result.errors
+    validation_result = await migration.validate_migration(db=db)
+    assert not validation_result.errors
+
+    assert await get_times(db=db) == times_before
+    assert await get_temporal_formats(db=db) == {TemporalFormat.ISO8601}
+
+
+async def test_migration_017_epoch_microseconds(db: InfrahubDatabase, default_branch, car_person_schema, monkeypatch):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+    person.height.value = 185
+    await person.save(db=db)
+    times_before = await get_times(db=db)
+    assert all(isinstance(from_time, str) for from_time, _ in times_before)
+    assert any(isinstance(to_time, str) for _, to_time in times_before)
+
+    db.manager.index.init(nodes=[], rels=temporal_rel_indexes)
+    await db.manager.index.drop()
+    nbr_indexes_before = len(await db.manager.index.list())
+
+    migration = Migration017(temporal_format=TemporalFormat.EPOCH_MICROSECONDS)
+    validation_result = await migration.validate_migration(db=db)
+    assert validation_result.errors
+
+    # Convert a few relationships per batch to go through several transactions
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 3)
+    async with db.start_session() as dbs:
+        execution_result = await migration.execute(db=dbs)
+        assert not execution_result.errors
+        assert execution_result.nbr_migrations_executed == len(times_before)
+
+        validation_result = await migration.validate_migration(db=dbs)
+        assert not validation_result.errors
+
+    times_after = await get_times(db=db)
+    assert len(times_after) == len(times_before)
+    assert all(isinstance(from_time, int) for from_time, _ in times_after)
+    assert all(to_time is None or isinstance(to_time, int) for _, to_time in times_after)
+    assert sorted(times_after, key=str) == sorted(
+        [(convert_time(from_time), convert_time(to_time)) for from_time, to_time in times_before], key=str
+    )
+    assert await get_temporal_formats(db=db) == {TemporalFormat.EPOCH_MICROSECONDS}
+
+    # Executing the migration again has nothing left to convert
+    async with db.start_session() as dbs:
+        execution_result = await migration.execute(db=dbs)
+        assert not execution_result.errors
+        assert execution_result.nbr_migrations_executed == 0
+
+    nbr_indexes_after = len(await db.manager.index.list())
+    if db.db_type == DatabaseType.NEO4J:
+        assert nbr_indexes_after - nbr_indexes_before == len(temporal_rel_indexes)
+    else:
+        assert nbr_indexes_after - nbr_indexes_before == 0
+
+
+async def test_migration_017_partially_converted(db: InfrahubDatabase, default_branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+
+    query = """
+    MATCH ()-[r:IS_PART_OF]->()
+    WITH r LIMIT 1
+    SET r.from = $from_time
+    """
+    await db.execute_query(query=query, params={"from_time": Timestamp().to_epoch_microseconds()})
+    assert await get_temporal_formats(db=db) == {TemporalFormat.ISO8601, TemporalFormat.EPOCH_MICROSECONDS}
+
+    migration = Migration017(temporal_format=TemporalFormat.EPOCH_MICROSECONDS)
+    validation_result = await migration.validate_migration(db=db)
+    assert validation_result.errors
+
+    execution_result = await migration.execute(db=db)
+    assert not execution_result.errors
+    validation_result = await migration.validate_migration(db=db)
+    assert not validation_result.errors
+    assert await get_temporal_formats(db=db) == {TemporalFormat.EPOCH_MICROSECONDS}
@@ -0,0 +1,28 @@
+from infrahub.core.graph.index import attr_value_fulltext_index
+from infrahub.core.migrations.graph.m018_add_attr_value_fulltext_index import Migration018
+from infrahub.database import DatabaseType, InfrahubDatabase
+
+
+async def test_migration_018(
+    db: InfrahubDatabase,
+    reset_registry,
+    default_branch,
+    delete_all_nodes_in_db,
+):
+    db.manager.index.init(nodes=[attr_value_fulltext_index], rels=[])
+    await db.manager.index.drop()
+    nbr_indexes_before = len(await db.manager.index.list())
+
+    async with db.start_session() as dbs:
+        migration = Migration018()
+        execution_result = await migration.execute(db=dbs)
+        assert not execution_result.errors
+
+        validation_result = await migration.validate_migration(db=dbs)
+        assert not validation_result.errors
+
+    nbr_indexes_after = len(await db.manager.index.list())
+    if db.db_type == DatabaseType.NEO4J:
+        assert nbr_indexes_after - nbr_indexes_before == 1
+    else:
+        assert nbr_indexes_after - nbr_indexes_before == 0
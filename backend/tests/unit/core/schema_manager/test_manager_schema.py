@@ -25,6 +25,7 @@ from infrahub.core.schema import (
 )
 from infrahub.core.schema.manager import SchemaManager
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
 
@@ -185,6 +186,36 @@ async def test_schema_branch_process_inheritance_update_inherited_elements(anima
     assert dog.get_relationship(name="owner").optional is True
 
 
+async def test_schema_branch_process_kinds(register_core_models_schema: SchemaBranch, animal_person_schema_dict):
+    schema = register_core_models_schema.duplicate()
+    schema.load_schema(schema=SchemaRoot(**animal_person_schema_dict))
+    schema.process()
+
+    assert schema.get_kinds_to_process(kinds=["TestAnimal"]) == {
+        "TestAnimal",
+        "TestDog",
+        "TestCat",
+        "TestPerson",
+        "ProfileTestAnimal",
+        "ProfileTestDog",
+        "ProfileTestCat",
+        "ProfileTestPerson",
+    }
+    assert schema.get_kinds_to_process(kinds=["TestCat"]) == {"TestCat", "ProfileTestCat"}
+
+    updated_schema = animal_person_schema_dict
+    updated_schema["generics"][0]["attributes"].append({"name": "nickname", "kind": "Text", "optional": True})
+    schema.load_schema(schema=SchemaRoot(**updated_schema))
+
+    full_schema = schema.duplicate()
+    full_schema.process()
+    schema.process(kinds=["TestAnimal"])
+
+    assert schema.get(name="TestDog").get_attribute(name="nickname").inherited
+    assert schema.get(name="ProfileTestDog").get_attribute(name="nickname")
+    assert schema.to_dict() == full_schema.to_dict()
+
+
 @pytest.mark.parametrize(
     ["uniqueness_constraints", "unique_attributes", "human_friendly_id"],
     [
@@ -351,6 +382,33 @@ async def test_schema_branch_process_default_values(schema_all_in_one):
     assert criticality.get_attribute(name="color").optional is True
 
 
+async def test_schema_branch_process_dropdowns():
+    schema = SchemaBranch(cache={}, name="test")
+    schema.load_schema(
+        schema=SchemaRoot(
+            nodes=[
+                {
+                    "name": "Criticality",
+                    "namespace": "Test",
+                    "attributes": [
+                        {"name": "name", "kind": "Text", "unique": True},
+                        {"name": "level", "kind": "Dropdown", "choices": [{"name": "low"}, {"name": "high"}]},
+                    ],
+                }
+            ]
+        )
+    )
+    node = schema.get(name="TestCriticality", duplicate=False)
+
+    # The objects in the cache are frozen, they must be duplicated before being updated
+    schema.process_dropdowns()
+
+    choices = schema.get(name="TestCriticality").get_attribute(name="level").choices
+    assert [choice.name for choice in choices] == ["low", "high"]
+    assert all(choice.color and choice.label for choice in choices)
+    assert not node.get_attribute(name="level").choices[0].label
+
+
 async def test_schema_branch_add_groups(schema_all_in_one):
     schema = SchemaBranch(cache={}, name="test")
     schema.load_schema(schema=SchemaRoot(**schema_all_in_one))
@@ -1478,13 +1536,22 @@ async def test_schema_branch_copy(
 
     schema_branch = SchemaBranch(cache={}, name="test")
     schema_branch.load_schema(schema=SchemaRoot(**FULL_SCHEMA))
+    initial_hash = schema_branch.get_hash()
     new_schema = schema_branch.duplicate()
 
-    assert id(new_schema.nodes) != id(schema_branch.nodes)
+    # The kinds are shared until one of the schema is modified
+    assert new_schema.nodes is schema_branch.nodes
     assert new_schema.get_hash() == schema_branch.get_hash()
 
     new_schema.process()
+    assert new_schema.nodes is not schema_branch.nodes
     assert new_schema.get_hash() != schema_branch.get_hash()
+    assert schema_branch.get_hash() == initial_hash
+
+    other_schema = schema_branch.duplicate()
+    other_schema.delete(name="BuiltinTag")
+    assert other_schema.nodes is not schema_branch.nodes
+    assert schema_branch.has(name="BuiltinTag")
 
 
 async def test_schema_branch_diff_attribute(
@@ -2230,6 +2297,34 @@ async def test_load_schema_from_db(
     assert schema11.get(name="TestGenericInterface").get_hash() == schema2.get(name="TestGenericInterface").get_hash()
 
 
+async def test_load_schema_at(
+    db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
+):
+    FULL_SCHEMA = {
+        "nodes": [
+            {
+                "namespace": "Builtin",
+                "name": "Tag",
+                "label": "Tag",
+                "default_filter": "name__value",
+                "attributes": [
+                    {"name": "name", "kind": "Text", "label": "Name", "unique": True},
+                ],
+            },
+        ],
+    }
+
+    schema1 = registry.schema.register_schema(schema=SchemaRoot(**FULL_SCHEMA), branch=default_branch.name)
+    await registry.schema.load_schema_to_db(schema=schema1, db=db, branch=default_branch.name)
+    time1 = Timestamp()
+
+    schema_at1 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time1)
+    schema_at2 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=Timestamp())
+
+    assert schema_at1.has(name="BuiltinTag")
+    assert schema_at2 is schema_at1
+
+
 async def test_load_schema(
     db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
 ):
@@ -0,0 +1,62 @@
+from infrahub.core.schema import SchemaRoot
+from infrahub.core.schema.history import SchemaHistoryCache
+from infrahub.core.schema.schema_branch import SchemaBranch
+
+
+def _build_schema_branch(name: str) -> SchemaBranch:
+    schema = SchemaBranch(cache={}, name="main")
+    schema.load_schema(
+        schema=SchemaRoot(
+            nodes=[
+                {
+                    "name": name,
+                    "namespace": "Test",
+                    "attributes": [{"name": "name", "kind": "Text"}],
+                }
+            ]
+        )
+    )
+    return schema
+
+
+def test_schema_history_cache_version_share_schema():
+    cache = SchemaHistoryCache(max_size=2)
+    schema1 = _build_schema_branch(name="Car")
+
+    cache.set(version=("main", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z"), schema=schema1)
+    cache.set(version=("main", "2024-01-01T00:00:00Z", "2024-01-03T00:00:00Z"), schema=schema1)
+
+    assert len(cache) == 1
+    assert cache.get(version=("main", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z")) is schema1
+    assert cache.get(version=("main", "2024-01-01T00:00:00Z", "2024-01-03T00:00:00Z")) is schema1
+    assert cache.get(version=("main", "2024-01-01T00:00:00Z", "2024-01-04T00:00:00Z")) is None
+
+
+def test_schema_history_cache_eviction():
+    cache = SchemaHistoryCache(max_size=2)
+    schema1 = _build_schema_branch(name="Car")
+    schema2 = _build_schema_branch(name="Person")
+    schema3 = _build_schema_branch(name="Tag")
+    version1 = ("main", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z")
+    version2 = ("main", "2024-01-01T00:00:00Z", "2024-01-03T00:00:00Z")
+    version3 = ("main", "2024-01-01T00:00:00Z", "2024-01-04T00:00:00Z")
+
+    cache.set(version=version1, schema=schema1)
+    cache.set(version=version2, schema=schema2)
+    # Access the first version to make the second one the least recently used
+    assert cache.get(version=version1) is schema1
+    cache.set(version=version3, schema=schema3)
+
+    assert len(cache) == 2
+    assert cache.get(version=version1) is schema1
+    assert cache.get(version=version2) is None
+    assert cache.get(version=version3) is schema3
+
+
+def test_schema_history_cache_disabled():
+    cache = SchemaHistoryCache(max_size=0)
+    version = ("main", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z")
+    cache.set(version=version, schema=_build_schema_branch(name="Car"))
+
+    assert len(cache) == 0
+    assert cache.get(version=version) is None
@@ -1,3 +1,4 @@
+from infrahub import config
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.initialization import create_branch
@@ -27,6 +28,25 @@ async def test_rebase_graph(db: InfrahubDatabase, base_dataset_02, register_core
     assert cars[2].name.value == "volt"
 
 
+async def test_rebase_graph_in_batches(db: InfrahubDatabase, base_dataset_02, register_core_models_schema, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.database, "rebase_batch_size", 2)
+
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    p3 = await NodeManager.get_one(id="p3", branch=branch1, db=db)
+    await p3.delete(db=db)
+
+    await branch1.rebase(db=db)
+
+    cars = sorted(await NodeManager.query(schema="TestCar", branch=branch1, db=db), key=lambda c: c.id)
+    assert len(cars) == 3
+    assert cars[0].nbr_seats.value == 4
+    assert cars[0].nbr_seats.is_protected is True
+    assert cars[2].name.value == "volt"
+
+    persons = sorted(await NodeManager.query(schema="TestPerson", branch=branch1, db=db), key=lambda p: p.id)
+    assert len(persons) == 2
+
+
 async def test_rebase_graph_delete(db: InfrahubDatabase, base_dataset_02, register_core_models_schema):
     branch1 = await Branch.get_by_name(name="branch1", db=db)
 
@@ -247,6 +247,43 @@ async def test_get_one_by_hfid(
         await NodeManager.get_one_by_hfid(db=db, hfid=["Not", "Dog"], kind=dog_schema.kind, raise_on_error=True)
 
 
+async def test_query_prefetch_hfid_peers(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    animal_person_schema: SchemaBranch,
+):
+    person_schema = animal_person_schema.get(name="TestPerson")
+    dog_schema = animal_person_schema.get(name="TestDog")
+
+    persons = {}
+    for name in ["Jack", "Jim"]:
+        persons[name] = await Node.init(db=db, schema=person_schema, branch=default_branch)
+        await persons[name].new(db=db, name=name)
+        await persons[name].save(db=db)
+
+    for name, breed, owner in [("Rocky", "Labrador", "Jack"), ("Bella", "Bulldog", "Jack"), ("Max", "Beagle", "Jim")]:
+        dog = await Node.init(db=db, schema=dog_schema, branch=default_branch)
+        await dog.new(db=db, name=name, breed=breed, owner=persons[owner])
+        await dog.save(db=db)
+
+    dogs = await NodeManager.query(
+        db=db, schema=dog_schema, fields={"hfid": None, "name": {"value": None}}, branch=default_branch
+    )
+
+    assert len(dogs) == 3
+    for dog in dogs:
+        # The owners of all the dogs have been loaded together, including the owners shared by multiple dogs
+        assert dog.owner.has_fetched_relationships
+        assert len(dog.owner._relationships) == 1
+        assert dog.owner._relationships[0]._peer is not None
+
+    assert sorted([await dog.get_hfid(db=db) for dog in dogs]) == [
+        ["Jack", "Bella"],
+        ["Jack", "Rocky"],
+        ["Jim", "Max"],
+    ]
+
+
 async def test_get_many(db: InfrahubDatabase, default_branch: Branch, criticality_low, criticality_medium):
     nodes = await NodeManager.get_many(db=db, ids=[criticality_low.id, criticality_medium.id])
     assert len(nodes) == 2
@@ -263,6 +300,73 @@ async def test_get_many_prefetch(db: InfrahubDatabase, default_branch: Branch, p
     assert tags[1]._peer
 
 
+async def test_get_many_prefetch_node_properties(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema, first_account, second_account
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4, _source=first_account, _owner=second_account)
+    await obj1.save(db=db)
+    obj2 = await Node.init(db=db, schema=criticality_schema)
+    await obj2.new(db=db, name="medium", level={"value": 3, "source": second_account.id}, _source=first_account)
+    await obj2.save(db=db)
+
+    node_property_map: dict[str, Node] = {}
+    nodes = await NodeManager.get_many(
+        db=db,
+        ids=[obj1.id, obj2.id],
+        fields={"name": {"value": None, "source": None, "owner": None}, "level": {"value": None, "source": None}},
+        include_source=True,
+        include_owner=True,
+        node_property_map=node_property_map,
+    )
+
+    assert set(node_property_map.keys()) == {first_account.id, second_account.id}
+    # The source and the owner are available without querying the database again
+    assert nodes[obj1.id].name.source.id == first_account.id
+    assert nodes[obj1.id].name.owner.id == second_account.id
+    assert nodes[obj2.id].level.source.id == second_account.id
+    # All the attributes referencing the same node share the same object
+    assert nodes[obj1.id].name.source is nodes[obj2.id].name.source
+    assert nodes[obj1.id].name.owner is nodes[obj2.id].level.source
+
+
+async def test_get_many_prefetch_node_properties_requested_attributes(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema, first_account, second_account
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(
+        db=db, name={"value": "low", "source": first_account.id}, level={"value": 4, "source": second_account.id}
+    )
+    await obj1.save(db=db)
+
+    node_property_map: dict[str, Node] = {}
+    nodes = await NodeManager.get_many(
+        db=db,
+        ids=[obj1.id],
+        fields={"name": {"value": None, "source": None}, "level": {"value": None}},
+        include_source=True,
+        include_owner=True,
+        node_property_map=node_property_map,
+    )
+
+    # Only the source of the attribute requesting it is prefetched
+    assert set(node_property_map.keys()) == {first_account.id}
+    assert nodes[obj1.id].name.source.id == first_account.id
+    assert nodes[obj1.id].level.source_id == second_account.id
+
+
+def test_get_node_properties_to_prefetch():
+    fields = {"name": {"value": None, "source": None, "owner": None}, "level": {"value": None}, "id": None}
+
+    assert NodeManager._get_node_properties_to_prefetch(fields=fields, include_source=True, include_owner=True) == {
+        "name": ["source", "owner"]
+    }
+    assert NodeManager._get_node_properties_to_prefetch(fields=fields, include_source=False, include_owner=True) == {
+        "name": ["owner"]
+    }
+    assert NodeManager._get_node_properties_to_prefetch(fields=None, include_source=True, include_owner=True) == {}
+
+
 async def test_get_many_with_profile(db: InfrahubDatabase, default_branch: Branch, criticality_low, criticality_medium):
     profile_schema = registry.schema.get("ProfileTestCriticality", branch=default_branch)
     crit_profile_1 = await Node.init(db=db, schema=profile_schema)
@@ -371,6 +475,59 @@ async def test_query_no_filter(
     assert len(nodes) == 3
 
 
+async def test_query_single_query(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    criticality_schema: NodeSchema,
+    criticality_low: Node,
+    criticality_medium: Node,
+    criticality_high: Node,
+):
+    fields = {"name": {"value": None}, "level": {"value": None}}
+    expected = await NodeManager.query(db=db, schema=criticality_schema, fields=fields)
+    nodes = await NodeManager.query(db=db, schema=criticality_schema, fields=fields, single_query=True)
+    assert [node.id for node in nodes] == [node.id for node in expected]
+    assert [(node.name.value, node.level.value) for node in nodes] == [
+        (node.name.value, node.level.value) for node in expected
+    ]
+
+    nodes = await NodeManager.query(
+        db=db, schema=criticality_schema, filters={"color__value": "#333333"}, single_query=True
+    )
+    assert sorted(node.id for node in nodes) == sorted([criticality_medium.id, criticality_high.id])
+
+
+async def test_query_with_count(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    criticality_schema: NodeSchema,
+    criticality_low: Node,
+    criticality_medium: Node,
+    criticality_high: Node,
+):
+    expected = await NodeManager.query(db=db, schema=criticality_schema)
+
+    nodes, count = await NodeManager.query_with_count(db=db, schema=criticality_schema, offset=1, limit=1)
+    assert count == 3
+    assert [node.id for node in nodes] == [expected[1].id]
+
+    nodes, count = await NodeManager.query_with_count(
+        db=db, schema=criticality_schema, filters={"color__value": "#333333"}
+    )
+    assert count == 2
+    assert len(nodes) == 2
+
+    nodes, count = await NodeManager.query_with_count(db=db, schema=criticality_schema, offset=5, limit=2)
+    assert count == 3
+    assert nodes == []
+
+    nodes, count = await NodeManager.query_with_count(
+        db=db, schema=criticality_schema, filters={"name__value": "unknown"}
+    )
+    assert count == 0
+    assert nodes == []
+
+
 async def test_query_protocol(
     db: InfrahubDatabase,
     default_branch: Branch,
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pytest
 from deepdiff import DeepDiff
 
 from infrahub.core.constants import HashableModelState
@@ -55,6 +56,36 @@ def test_model_hashing():
     assert node1.get_hash() == node2.get_hash()
 
 
+def test_model_freeze():
+    class MySubElement(HashableModel):
+        _sort_by: list[str] = ["name"]
+        name: str
+
+    class MyTopElement(HashableModel):
+        _sort_by: list[str] = ["name"]
+        name: str
+        subs: list[MySubElement]
+
+    node = MyTopElement(name="node1", subs=[MySubElement(name="orange"), MySubElement(name="apple")]).freeze()
+
+    assert node.is_frozen
+    assert node.subs[0].is_frozen
+    with pytest.raises(TypeError):
+        node.name = "node2"
+    with pytest.raises(TypeError):
+        node.subs[0].name = "banana"
+
+    node2 = node.duplicate()
+    assert not node2.is_frozen
+    assert not node2.subs[0].is_frozen
+    assert node2 == node
+
+    node2.name = "node2"
+    node2.subs[0].name = "banana"
+    assert node.name == "node1"
+    assert node.subs[0].name == "orange"
+
+
 def test_hashing_dict():
     class MySubElement(HashableModel):
         _sort_by: list[str] = ["name"]
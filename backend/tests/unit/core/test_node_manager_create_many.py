@@ -0,0 +1,90 @@
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.constraint.node.runner import NodeConstraintRunner
+from infrahub.core.initialization import create_branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import SchemaRoot
+from infrahub.database import InfrahubDatabase
+from infrahub.dependencies.registry import get_component_registry
+from infrahub.exceptions import ValidationError
+
+
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node):
+    data = [{"name": f"car{idx:02d}", "nbr_seats": idx, "owner": person_albert_main} for idx in range(10)]
+    nodes = await NodeManager.create_many(db=db, schema="TestCar", data=data, branch=default_branch, batch_size=3)
+
+    assert len(nodes) == 10
+    assert all(node._existing for node in nodes)
+
+    cars = await NodeManager.get_many(db=db, ids=[node.id for node in nodes], branch=default_branch)
+    assert sorted(car.name.value for car in cars.values()) == [item["name"] for item in data]
+    for car in cars.values():
+        owner = await car.owner.get_peer(db=db)
+        assert owner.id == person_albert_main.id
+
+    albert = await NodeManager.get_one(db=db, id=person_albert_main.id, branch=default_branch)
+    assert len(await albert.cars.get_peers(db=db)) == 10
+
+
+async def test_create_many_duplicate_in_batch(db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node):
+    data = [{"name": "accord", "owner": person_albert_main}, {"name": "accord", "owner": person_albert_main}]
+
+    with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+        await NodeManager.create_many(db=db, schema="TestCar", data=data, branch=default_branch)
+
+    assert not await NodeManager.query(db=db, schema="TestCar", branch=default_branch)
+
+
+async def test_create_many_existing_node(
+    db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node, car_accord_main: Node
+):
+    component_registry = get_component_registry()
+    node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=default_branch)
+    data = [{"name": "civic", "owner": person_albert_main}, {"name": "accord", "owner": person_albert_main}]
+
+    with pytest.raises(ValidationError):
+        await NodeManager.create_many(
+            db=db,
+            schema="TestCar",
+            data=data,
+            branch=default_branch,
+            node_constraint_runner=node_constraint_runner,
+        )
+
+    cars = await NodeManager.query(db=db, schema="TestCar", branch=default_branch)
+    assert [car.id for car in cars] == [car_accord_main.id]
+
+
+async def test_create_many_without_attributes(db: InfrahubDatabase, default_branch: Branch, person_albert_main: Node):
+    schema = SchemaRoot(
+        nodes=[
+            {
+                "name": "Marker",
+                "namespace": "Test",
+                "relationships": [{"name": "person", "peer": "TestPerson", "optional": True, "cardinality": "one"}],
+            }
+        ]
+    )
+    registry.schema.register_schema(schema=schema, branch=default_branch.name)
+
+    # The first node has neither attribute nor relationship in the database
+    data = [{}, {"person": person_albert_main}]
+    nodes = await NodeManager.create_many(db=db, schema="TestMarker", data=data, branch=default_branch)
+
+    assert all(node._existing for node in nodes)
+    markers = await NodeManager.query(db=db, schema="TestMarker", branch=default_branch)
+    assert sorted(marker.id for marker in markers) == sorted(node.id for node in nodes)
+
+
+async def test_create_many_branch_agnostic(db: InfrahubDatabase, default_branch: Branch, car_person_schema_global):
+    branch2 = await create_branch(branch_name="branch2", db=db)
+
+    data = [{"name": f"person{idx:02d}"} for idx in range(5)]
+    nodes = await NodeManager.create_many(db=db, schema="TestPerson", data=data, branch=branch2, batch_size=2)
+
+    # The branch agnostic nodes are created on the global branch, like with Node.save
+    persons = await NodeManager.get_many(db=db, ids=[node.id for node in nodes], branch=default_branch)
+    assert sorted(person.name.value for person in persons.values()) == [item["name"] for item in data]
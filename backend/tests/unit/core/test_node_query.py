@@ -1,5 +1,7 @@
 from typing import Dict
 
+import pytest
+
 from infrahub.core.branch import Branch
 from infrahub.core.constants import (
     InfrahubKind,
@@ -23,6 +25,8 @@ from infrahub.core.query.node import (
     NodeListGetAttributeQuery,
     NodeListGetInfoQuery,
     NodeListGetRelationshipsQuery,
+    build_fulltext_search_query,
+    is_fulltext_searchable,
 )
 from infrahub.core.registry import registry
 from infrahub.core.utils import count_nodes, get_nodes
@@ -102,6 +106,16 @@ async def test_query_NodeListGetInfoQuery(
     assert len(list(query.get_results_group_by(("n", "uuid")))) == 3
 
 
+async def test_query_NodeListGetInfoQuery_execute_group_by(
+    db: InfrahubDatabase, person_john_main, person_jim_main, person_albert_main, person_alfred_main, branch: Branch
+):
+    ids = [person_john_main.id, person_jim_main.id, person_albert_main.id]
+    query = await NodeListGetInfoQuery.init(db=db, branch=branch, ids=ids)
+    await query.execute_group_by(("n", "uuid"), db=db)
+    assert len(query.results) == 3
+    assert sorted([node.node_uuid async for node in query.get_nodes(db=db)]) == sorted(ids)
+
+
 async def test_query_NodeListGetInfoQuery_with_profiles(
     db: InfrahubDatabase, person_john_main, person_jim_main, person_albert_main, person_alfred_main, branch: Branch
 ):
@@ -419,3 +433,28 @@ async def test_query_NodeGetHierarchyQuery_filters(
     descendants_names = [ids_to_names[descendants_id].name.value for descendants_id in descendants_ids]
 
     assert sorted(descendants_names) == ["london", "london-r1", "paris", "paris-r1"]
+
+
+@pytest.mark.parametrize(
+    "search,expected",
+    [
+        ("prius", True),
+        ("Toyota prius", True),
+        ("ethernet1", True),
+        ("", False),
+        ("   ", False),
+        ("my-device", False),
+        ("10.0.0.0/24", False),
+        ("Ethernet1/1", False),
+        ("aa:bb", False),
+        ("42", False),
+        ("car 5", False),
+    ],
+)
+def test_is_fulltext_searchable(search: str, expected: bool):
+    assert is_fulltext_searchable(search) is expected
+
+
+def test_build_fulltext_search_query():
+    assert build_fulltext_search_query(search="Toyota Prius") == "*toyota* AND *prius*"
+    assert build_fulltext_search_query(search="Toyota Prius", partial_match=False) == '"toyota prius"'
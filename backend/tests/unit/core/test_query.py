@@ -1,6 +1,7 @@
 import pendulum
 import pytest
 
+from infrahub import config
 from infrahub.core.query import (
     Query,
     QueryNode,
@@ -41,6 +42,21 @@ class Query02(Query):
         self.add_to_query(query)
 
 
+class Query03(Query):
+    keyset_label = "at"
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        query = """
+        MATCH (n) WHERE n.uuid = $uuid
+        MATCH (n)-[r1]-(at:Attribute)-[r2]-(av)
+        """
+
+        self.return_labels = ["n", "at", "av", "r1", "r2"]
+        self.params["uuid"] = "5ffa45d4"
+
+        self.add_to_query(query)
+
+
 def test_cleanup_return_labels():
     assert cleanup_return_labels(["r", "n", "l"]) == ["r", "n", "l"]
     assert cleanup_return_labels(["r.uuid", "n", "l"]) == ["r.uuid", "n", "l"]
@@ -140,6 +156,49 @@ async def test_query_async(db: InfrahubDatabase, simple_dataset_01):
     assert query.results[0].get("at") is not None
 
 
+async def test_query_stream(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+
+    results = [result async for result in query.stream(db=db)]
+
+    assert query.has_been_executed is True
+    assert not query.results
+    assert len(results) == 3
+    assert [result.get("at").get("name") for result in results] == sorted(
+        result.get("at").get("name") for result in results
+    )
+
+
+async def test_query_stream_write(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query02.init(db=db)
+
+    with pytest.raises(TypeError):
+        async for _ in query.stream(db=db):
+            pass
+
+
+async def test_query_keyset(db: InfrahubDatabase, simple_dataset_01, monkeypatch):
+    query = await Query03.init(db=db)
+    id_function = db.get_id_function_name()
+    expected_query = (
+        "MATCH (n) WHERE n.uuid = $uuid\nMATCH (n)-[r1]-(at:Attribute)-[r2]-(av)\n"
+        f"WITH *, {id_function}(at) AS keyset_id\n"
+        "WHERE $keyset_cursor IS NULL OR keyset_id > $keyset_cursor\n"
+        "RETURN n,at,av,r1,r2,keyset_id\nORDER BY keyset_id\nLIMIT 2"
+    )
+    assert query.get_keyset_query(db=db, limit=2) == expected_query
+
+    query_without_keyset = await Query01.init(db=db)
+    with pytest.raises(ValueError):
+        query_without_keyset.get_keyset_query(db=db, limit=2)
+
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 2)
+    await query.execute(db=db)
+    assert query.num_of_results == 3
+    assert {result.get("av").get("value") for result in query.results} == {"accord", "volt", 5}
+    assert len(query.results[0].data) == 5
+
+
 async def test_query_count(db: InfrahubDatabase, simple_dataset_01):
     query = await Query01.init(db=db)
     assert await query.count(db=db) == 3
@@ -189,6 +248,45 @@ async def test_query_result_getters(neo4j_factory):
         qr.get("r3")
 
 
+async def test_query_result_scores(neo4j_factory):
+    n1 = neo4j_factory.hydrate_node(444, {"Car"}, {"uuid": "n1"}, "444")
+    a1 = neo4j_factory.hydrate_node(555, {"Attribute"}, {"name": "name"}, "555")
+    a2 = neo4j_factory.hydrate_node(666, {"Attribute"}, {"name": "color"}, "666")
+    r_main = neo4j_factory.hydrate_relationship(
+        4445551, 444, 555, "HAS_ATTRIBUTE", {"branch": "main", "branch_level": 1, "to": None, "status": "active"}
+    )
+    r_branch = neo4j_factory.hydrate_relationship(
+        4445552, 444, 555, "HAS_ATTRIBUTE", {"branch": "branch1", "branch_level": 2, "to": None, "status": "active"}
+    )
+    r_deleted = neo4j_factory.hydrate_relationship(
+        4446661, 444, 666, "HAS_ATTRIBUTE", {"branch": "branch1", "branch_level": 2, "to": None, "status": "deleted"}
+    )
+    r_old = neo4j_factory.hydrate_relationship(
+        4446662,
+        444,
+        666,
+        "HAS_ATTRIBUTE",
+        {"branch": "main", "branch_level": 1, "to": "2024-09-01", "status": "active"},
+    )
+
+    qr1 = QueryResult(data=[n1, a1, r_main], labels=["n", "a AS attr", "r"])
+    qr2 = QueryResult(data=[n1, a1, r_branch], labels=["n", "a AS attr", "r"])
+    qr3 = QueryResult(data=[n1, a2, r_deleted], labels=["n", "a AS attr", "r"])
+    qr4 = QueryResult(data=[n1, a2, r_old], labels=["n", "a AS attr", "r"])
+
+    assert qr1.labels == ["n", "attr", "r"]
+    assert qr1.get("attr") == a1
+    assert qr1.scores == (1, 2, False)
+    assert qr2.scores == (2, 2, False)
+    assert (qr3.branch_score, qr3.time_score, qr3.has_deleted_rels) == (2, 2, True)
+    assert qr4.scores == (1, 1, False)
+
+    query = await Query01.init(db=None)
+    query.results = [qr1, qr2, qr3, qr4]
+    assert list(query.get_results()) == [qr2, qr3, qr1, qr4]
+    assert list(query.get_results_group_by(("n", "uuid"), ("attr", "name"))) == [qr2]
+
+
 async def test_sort_results_by_time(neo4j_factory):
     time0 = pendulum.now(tz="UTC")
 
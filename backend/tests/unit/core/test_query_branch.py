@@ -1,16 +1,33 @@
 from infrahub.core.branch import Branch
-from infrahub.core.query.branch import GetAllBranchInternalRelationshipQuery
+from infrahub.core.query.branch import RebaseBranchRelationshipsQuery
 from infrahub.core.registry import registry
 from infrahub.database import InfrahubDatabase
 
 
-async def test_GetAllBranchInternalRelationshipQuery(db: InfrahubDatabase, default_branch: Branch, base_dataset_02):
+async def test_RebaseBranchRelationshipsQuery(db: InfrahubDatabase, default_branch: Branch, base_dataset_02):
     branch1 = await registry.get_branch(branch="branch1", db=db)
 
-    query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=branch1)
+    query = await RebaseBranchRelationshipsQuery.init(db=db, branch=branch1)
     await query.execute(db=db)
 
     assert len(query.results)
 
-    unique_ids = set([result.get("r").element_id for result in query.results])
-    assert len(unique_ids) == len(query.results)
+    rel_ids_to_delete, rel_ids_to_update = query.get_rel_ids()
+    rel_ids = [result.get("rel_id") for result in query.results]
+    assert len(rel_ids_to_delete) + len(rel_ids_to_update) == len(rel_ids)
+    assert len(set(rel_ids)) == len(rel_ids)
+
+    # The relationships are returned by pages ordered by internal id
+    page_rel_ids = []
+    after_rel_id = None
+    while True:
+        page_query = await RebaseBranchRelationshipsQuery.init(
+            db=db, branch=branch1, after_rel_id=after_rel_id, limit=2
+        )
+        await page_query.execute(db=db)
+        page_rel_ids.extend([result.get("rel_id") for result in page_query.results])
+        if len(page_query.results) < 2:
+            break
+        after_rel_id = page_query.get_last_rel_id()
+
+    assert page_rel_ids == rel_ids
@@ -401,6 +401,34 @@ async def test_query_RelationshipGetPeerQuery(
     assert isinstance(peers[0].properties["is_protected"].prop_db_id, str)
 
 
+async def test_query_RelationshipGetPeerQuery_shared_peers(
+    db: InfrahubDatabase, tag_blue_main: Node, tag_red_main: Node, person_jack_tags_main: Node, branch: Branch
+):
+    person_schema = registry.schema.get(name="TestPerson")
+    rel_schema = person_schema.get_relationship("tags")
+    person_jim = await Node.init(db=db, schema="TestPerson")
+    await person_jim.new(db=db, firstname="Jim", lastname="Beam", tags=[tag_blue_main])
+    await person_jim.save(db=db)
+
+    query = await RelationshipGetPeerQuery.init(
+        db=db,
+        source_ids=[person_jack_tags_main.id, person_jim.id],
+        schema=rel_schema,
+        rel=Relationship,
+        branch=branch,
+        at=Timestamp(),
+    )
+    await query.execute(db=db)
+
+    # The blue tag is returned for both persons
+    peers = {(peer.source_id, peer.peer_id) for peer in query.get_peers()}
+    assert peers == {
+        (person_jack_tags_main.id, tag_blue_main.id),
+        (person_jack_tags_main.id, tag_red_main.id),
+        (person_jim.id, tag_blue_main.id),
+    }
+
+
 async def test_query_RelationshipGetPeerQuery_with_filter(
     db: InfrahubDatabase,
     person_john_main,
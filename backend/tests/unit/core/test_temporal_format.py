@@ -0,0 +1,63 @@
+import pytest
+
+from infrahub import config
+from infrahub.config import TemporalFormat
+from infrahub.core.branch import Branch
+from infrahub.core.diff.coordinator import DiffCoordinator
+from infrahub.core.initialization import create_branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.merge import BranchMerger
+from infrahub.core.node import Node
+from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import get_temporal_formats
+from infrahub.database import InfrahubDatabase
+from infrahub.dependencies.registry import get_component_registry
+
+
+@pytest.fixture
+def epoch_temporal_format(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.database, "temporal_format", TemporalFormat.EPOCH_MICROSECONDS)
+
+
+async def test_epoch_microseconds_create_update_diff_merge(
+    epoch_temporal_format, db: InfrahubDatabase, default_branch: Branch, car_person_schema
+):
+    john = await Node.init(db=db, schema="TestPerson")
+    await john.new(db=db, name="John", height=180)
+    await john.save(db=db)
+    time_created = Timestamp()
+
+    john = await NodeManager.get_one(db=db, id=john.id)
+    john.height.value = 185
+    await john.save(db=db)
+
+    persons = await NodeManager.query(db=db, schema="TestPerson")
+    assert [(person.name.value, person.height.value) for person in persons] == [("John", 185)]
+    john_before_update = await NodeManager.get_one(db=db, id=john.id, at=time_created)
+    assert john_before_update.height.value == 180
+
+    branch2 = await create_branch(branch_name="branch2", db=db)
+    john_branch = await NodeManager.get_one(db=db, id=john.id, branch=branch2)
+    john_branch.height.value = 190
+    await john_branch.save(db=db)
+    jane = await Node.init(db=db, schema="TestPerson", branch=branch2)
+    await jane.new(db=db, name="Jane", height=170)
+    await jane.save(db=db)
+
+    persons = await NodeManager.query(db=db, schema="TestPerson")
+    assert [(person.name.value, person.height.value) for person in persons] == [("John", 185)]
+
+    component_registry = get_component_registry()
+    diff_coordinator = await component_registry.get_component(DiffCoordinator, db=db, branch=branch2)
+    diff = await diff_coordinator.update_branch_diff(base_branch=default_branch, diff_branch=branch2)
+    assert {node.uuid for node in diff.nodes} == {john.id, jane.id}
+
+    merger = BranchMerger(db=db, source_branch=branch2)
+    await merger.merge_graph(at=Timestamp())
+
+    persons = await NodeManager.query(db=db, schema="TestPerson")
+    assert sorted((person.name.value, person.height.value) for person in persons) == [("Jane", 170), ("John", 190)]
+    john_before_merge = await NodeManager.get_one(db=db, id=john.id, at=time_created)
+    assert john_before_merge.height.value == 180
+
+    assert await get_temporal_formats(db=db) == {TemporalFormat.EPOCH_MICROSECONDS}
@@ -0,0 +1,21 @@
+from infrahub import config
+from infrahub.config import TemporalFormat
+from infrahub.core.timestamp import Timestamp
+
+
+def test_timestamp_epoch_microseconds():
+    time = Timestamp("2024-06-04T03:13:19.123456Z")
+
+    assert time.to_epoch_microseconds() == 1717470799123456
+    assert Timestamp(time.to_epoch_microseconds()) == time
+    assert Timestamp(0).to_string() == "1970-01-01T00:00:00Z"
+
+
+def test_timestamp_to_graph(monkeypatch):
+    time = Timestamp("2024-06-04T03:13:19.123456Z")
+
+    monkeypatch.setattr(config.SETTINGS.database, "temporal_format", TemporalFormat.ISO8601)
+    assert time.to_graph() == time.to_string()
+
+    monkeypatch.setattr(config.SETTINGS.database, "temporal_format", TemporalFormat.EPOCH_MICROSECONDS)
+    assert time.to_graph() == 1717470799123456
@@ -19,10 +19,18 @@ from infrahub.core.constants import InfrahubKind
 from infrahub.core.schema import SchemaRoot, core_models
 from infrahub.git import InfrahubRepository
 from infrahub.git.repository import InfrahubReadOnlyRepository
+from infrahub.git.template_cache import jinja2_environment_cache
 from infrahub.utils import find_first_file_in_directory, get_fixtures_dir
 from tests.helpers.test_client import dummy_async_request
 
 
+@pytest.fixture(autouse=True)
+def clear_jinja2_environment_cache():
+    jinja2_environment_cache.clear()
+    yield
+    jinja2_environment_cache.clear()
+
+
 @pytest.fixture
 def client() -> InfrahubClient:
     return InfrahubClient(config=Config(address="http://mock", insert_tracker=True))
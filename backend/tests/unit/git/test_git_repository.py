@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from git import Repo
@@ -9,7 +10,8 @@ from infrahub_sdk.node import InfrahubNode
 from infrahub_sdk.uuidt import UUIDT
 from pytest_httpx._httpx_mock import HTTPXMock
 
-from infrahub.core.constants import InfrahubKind
+from infrahub import config
+from infrahub.core.constants import InfrahubKind, RepositorySyncStatus
 from infrahub.exceptions import (
     CheckError,
     CommitNotFoundError,
@@ -203,6 +205,106 @@ async def test_get_commit_worktree(git_repo_01: InfrahubRepository):
     assert repo.has_worktree(identifier=commit) is True
 
 
+async def test_get_commit_worktree_from_index(git_repo_01: InfrahubRepository):
+    repo = git_repo_01
+    commit = repo.get_commit_value(branch_name="main")
+    worktree = repo.get_commit_worktree(commit=commit)
+
+    with patch.object(InfrahubRepository, "get_worktrees", side_effect=AssertionError("git called")):
+        assert repo.get_commit_worktree(commit=commit) == worktree
+        assert repo.has_worktree(identifier="main")
+
+
+async def test_evict_commit_worktrees(git_repo_01: InfrahubRepository, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.git, "max_commit_worktrees", 1)
+    repo = git_repo_01
+    git_repo = repo.get_git_repo_main()
+    initial_commit = repo.get_commit_value(branch_name="main")
+
+    first_file = find_first_file_in_directory(repo.directory_default)
+    commits = []
+    for idx in range(3):
+        with Path(os.path.join(repo.directory_default, first_file)).open(mode="a", encoding="utf-8") as file:
+            file.write(f"new line {idx}\n")
+        git_repo.index.add([first_file])
+        commits.append(str(git_repo.index.commit(f"Change first file {idx}")))
+
+    repo.get_commit_worktree(commit=commits[0])
+    repo.get_commit_worktree(commit=commits[1])
+
+    worktree_identifiers = {worktree.identifier for worktree in repo.get_worktrees()}
+    assert worktree_identifiers == {"main", commits[1]}
+    assert not os.path.isdir(os.path.join(repo.directory_commits, initial_commit))
+    assert not os.path.isdir(os.path.join(repo.directory_commits, commits[0]))
+
+    # The commit checked out in the main worktree is never removed
+    repo.get_commit_worktree(commit=commits[2])
+    repo.get_commit_worktree(commit=commits[0])
+    worktree_identifiers = {worktree.identifier for worktree in repo.get_worktrees()}
+    assert worktree_identifiers == {"main", commits[2], commits[0]}
+
+
+async def test_evict_commit_worktrees_in_use(git_repo_01: InfrahubRepository, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.git, "max_commit_worktrees", 1)
+    repo = git_repo_01
+    git_repo = repo.get_git_repo_main()
+
+    first_file = find_first_file_in_directory(repo.directory_default)
+    commits = []
+    for idx in range(4):
+        with Path(os.path.join(repo.directory_default, first_file)).open(mode="a", encoding="utf-8") as file:
+            file.write(f"new line {idx}\n")
+        git_repo.index.add([first_file])
+        commits.append(str(git_repo.index.commit(f"Change first file {idx}")))
+
+    with repo.use_commit_worktree(commit=commits[0]) as worktree:
+        # Neither the commit worktree in use nor the one just created are removed
+        repo.get_commit_worktree(commit=commits[1])
+        assert os.path.isdir(worktree.directory)
+        assert os.path.isdir(os.path.join(repo.directory_commits, commits[1]))
+
+        repo.get_commit_worktree(commit=commits[2])
+        assert os.path.isdir(worktree.directory)
+        assert not os.path.isdir(os.path.join(repo.directory_commits, commits[1]))
+
+    # The commit worktree is removed once it's not in use anymore
+    repo.get_commit_worktree(commit=commits[1])
+    worktree_identifiers = {worktree.identifier for worktree in repo.get_worktrees()}
+    assert worktree_identifiers == {"main", commits[1]}
+
+
+async def test_import_objects_from_files_commit_worktree_in_use(git_repo_01: InfrahubRepository, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.git, "max_commit_worktrees", 1)
+    repo = git_repo_01
+    git_repo = repo.get_git_repo_main()
+
+    first_file = find_first_file_in_directory(repo.directory_default)
+    commits = []
+    for idx in range(3):
+        with Path(os.path.join(repo.directory_default, first_file)).open(mode="a", encoding="utf-8") as file:
+            file.write(f"new line {idx}\n")
+        git_repo.index.add([first_file])
+        commits.append(str(git_repo.index.commit(f"Change first file {idx}")))
+
+    async def update_sync_status(self, branch_name: str, status: RepositorySyncStatus) -> None:
+        pass
+
+    worktree_exists_during_import = []
+
+    async def get_repository_config(self, branch_name: str, commit: str) -> None:
+        # Other commit worktrees are created while the import is running
+        repo.get_commit_worktree(commit=commits[1])
+        repo.get_commit_worktree(commit=commits[2])
+        worktree_exists_during_import.append(os.path.isdir(os.path.join(repo.directory_commits, commit)))
+
+    monkeypatch.setattr(InfrahubRepository, "_update_sync_status", update_sync_status)
+    monkeypatch.setattr(InfrahubRepository, "get_repository_config", get_repository_config)
+
+    await repo.import_objects_from_files(infrahub_branch_name="main", commit=commits[0])
+
+    assert worktree_exists_during_import == [True]
+
+
 async def test_get_branch_worktree(git_repo_01: InfrahubRepository, branch99: BranchData):
     repo = git_repo_01
     git_repo = repo.get_git_repo_main()
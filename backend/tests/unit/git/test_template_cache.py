@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from infrahub import config
+from infrahub.git.template_cache import Jinja2EnvironmentCache, render_template
+
+
+def test_jinja2_environment_cache_eviction(tmp_path: Path):
+    cache = Jinja2EnvironmentCache(max_size=2)
+
+    environment1 = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path))
+    environment2 = cache.get(repository_name="repo01", commit="commit2", directory=str(tmp_path))
+    # Access the first environment to make the second one the least recently used
+    assert cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path)) is environment1
+    cache.get(repository_name="repo02", commit="commit1", directory=str(tmp_path))
+
+    assert len(cache) == 2
+    assert cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path)) is environment1
+    assert cache.get(repository_name="repo01", commit="commit2", directory=str(tmp_path)) is not environment2
+
+
+def test_jinja2_environment_cache_directory(tmp_path: Path):
+    cache = Jinja2EnvironmentCache(max_size=2)
+    for directory in ("worktree1", "worktree2"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "template.j2").write_text(directory, encoding="utf-8")
+
+    environment1 = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path / "worktree1"))
+    environment2 = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path / "worktree2"))
+
+    assert environment1 is not environment2
+    assert render_template(environment=environment2, location="template.j2", data={}) == "worktree2"
+
+
+def test_jinja2_environment_cache_disabled(tmp_path: Path):
+    cache = Jinja2EnvironmentCache(max_size=0)
+
+    environment = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path))
+
+    assert len(cache) == 0
+    assert cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path)) is not environment
+
+
+def test_jinja2_environment_reuses_compiled_templates(tmp_path: Path):
+    cache = Jinja2EnvironmentCache(max_size=2)
+    template_file = tmp_path / "template.j2"
+    template_file.write_text("{% for item in items %}\n{{ item }}\n{% endfor %}\n", encoding="utf-8")
+    environment = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path))
+
+    assert render_template(environment=environment, location="template.j2", data={"items": ["a", "b"]}) == "a\nb\n"
+
+    # The files of a commit can't change, the template compiled during the first render is reused
+    template_file.write_text("changed", encoding="utf-8")
+    environment = cache.get(repository_name="repo01", commit="commit1", directory=str(tmp_path))
+    assert render_template(environment=environment, location="template.j2", data={"items": ["c"]}) == "c\n"
+
+
+def test_jinja2_bytecode_cache(tmp_path: Path, monkeypatch):
+    bytecode_directory = tmp_path / "bytecode"
+    monkeypatch.setattr(config.SETTINGS.git, "jinja2_bytecode_cache_directory", str(bytecode_directory))
+    templates_directory = tmp_path / "templates"
+    templates_directory.mkdir()
+    (templates_directory / "template.j2").write_text("{{ name }}", encoding="utf-8")
+    cache = Jinja2EnvironmentCache(max_size=2)
+
+    environment = cache.get(repository_name="repo01", commit="commit1", directory=str(templates_directory))
+
+    assert render_template(environment=environment, location="template.j2", data={"name": "infrahub"}) == "infrahub"
+    assert len(list(bytecode_directory.iterdir())) == 1
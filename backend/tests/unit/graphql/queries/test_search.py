@@ -1,8 +1,10 @@
+import pytest
 from graphql import graphql
 
 from infrahub.core.branch import Branch
+from infrahub.core.graph.index import attr_value_fulltext_index
 from infrahub.core.node import Node
-from infrahub.database import InfrahubDatabase
+from infrahub.database import DatabaseType, InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
 
 SEARCH_QUERY = """
@@ -93,3 +95,128 @@ async def test_search_anywhere_by_string(
 
     assert sorted(node_ids) == sorted([person_john_main.id, person_jane_main.id])
     assert sorted(node_kinds) == sorted([person_john_main.get_kind(), person_jane_main.get_kind()])
+
+
+SEARCH_QUERY_DISPLAY_LABEL = """
+query ($search: String!) {
+    InfrahubSearchAnywhere(q: $search) {
+        count
+        edges {
+            node {
+                id
+                kind
+                display_label
+            }
+        }
+    }
+}
+"""
+
+
+async def test_search_anywhere_fulltext_index(
+    db: InfrahubDatabase,
+    person_john_main: Node,
+    person_jane_main: Node,
+    car_accord_main: Node,
+    car_camry_main: Node,
+    car_volt_main: Node,
+    car_prius_main: Node,
+    car_yaris_main: Node,
+    branch: Branch,
+):
+    if db.db_type != DatabaseType.NEO4J:
+        pytest.skip("Full-text indexes are only supported with Neo4j")
+
+    db.manager.index.init(nodes=[attr_value_fulltext_index], rels=[])
+    await db.manager.index.add()
+    await db.execute_query(query="CALL db.awaitIndexes()", name="index_await")
+
+    try:
+        gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+
+        result = await graphql(
+            schema=gql_params.schema,
+            source=SEARCH_QUERY_DISPLAY_LABEL,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"search": "PRIUS"},
+        )
+
+        assert result.errors is None
+        assert result.data
+        assert result.data["InfrahubSearchAnywhere"]["count"] == 1
+        node = result.data["InfrahubSearchAnywhere"]["edges"][0]["node"]
+        assert node["id"] == car_prius_main.id
+        assert node["kind"] == car_prius_main.get_kind()
+        assert node["display_label"] == await car_prius_main.render_display_label(db=db)
+
+        result = await graphql(
+            schema=gql_params.schema,
+            source=SEARCH_QUERY,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"search": "j"},
+        )
+
+        assert result.errors is None
+        assert result.data
+        node_ids = [edge["node"]["id"] for edge in result.data["InfrahubSearchAnywhere"]["edges"]]
+        assert sorted(node_ids) == sorted([person_john_main.id, person_jane_main.id])
+    finally:
+        await db.manager.index.drop()
+        db.manager.index.init(nodes=[], rels=[])
+
+
+async def test_search_anywhere_fulltext_index_fallback(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    person_john_main: Node,
+    car_volt_main: Node,
+    car_yaris_main: Node,
+    branch: Branch,
+):
+    if db.db_type != DatabaseType.NEO4J:
+        pytest.skip("Full-text indexes are only supported with Neo4j")
+
+    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+    await car.new(db=db, name="model-s/p100d", nbr_seats=7, is_electric=True, owner=person_john_main.id)
+    await car.save(db=db)
+
+    db.manager.index.init(nodes=[attr_value_fulltext_index], rels=[])
+    await db.manager.index.add()
+    await db.execute_query(query="CALL db.awaitIndexes()", name="index_await")
+
+    try:
+        gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+
+        # The analyzer of the full-text index splits the values on the separators
+        result = await graphql(
+            schema=gql_params.schema,
+            source=SEARCH_QUERY,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"search": "l-s/p1"},
+        )
+
+        assert result.errors is None
+        assert result.data
+        node_ids = [edge["node"]["id"] for edge in result.data["InfrahubSearchAnywhere"]["edges"]]
+        assert node_ids == [car.id]
+
+        # The numbers aren't indexed by the full-text index
+        result = await graphql(
+            schema=gql_params.schema,
+            source=SEARCH_QUERY,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"search": "4"},
+        )
+
+        assert result.errors is None
+        assert result.data
+        node_ids = [edge["node"]["id"] for edge in result.data["InfrahubSearchAnywhere"]["edges"]]
+        assert car_volt_main.id in node_ids
+        assert car_yaris_main.id in node_ids
+    finally:
+        await db.manager.index.drop()
+        db.manager.index.init(nodes=[], rels=[])
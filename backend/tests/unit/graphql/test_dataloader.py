@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from infrahub.graphql.loaders.base import DataLoader, freeze
+
+
+class CountingDataLoader(DataLoader[str, str]):
+    name = "counting"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def batch_load(self, keys: list[str]) -> dict[str, str]:
+        self.batches.append(keys)
+        return {key: key.upper() for key in keys}
+
+
+class FailingDataLoader(DataLoader[str, str]):
+    async def batch_load(self, keys: list[str]) -> dict[str, str]:
+        raise ValueError("unable to load")
+
+
+async def test_dataloader_batches_keys_within_same_tick():
+    loader = CountingDataLoader()
+
+    results = await asyncio.gather(*[loader.load(key) for key in ["a", "b", "c", "a"]])
+
+    assert results == ["A", "B", "C", "A"]
+    assert loader.batches == [["a", "b", "c"]]
+
+
+async def test_dataloader_caches_previous_results():
+    loader = CountingDataLoader()
+
+    assert await loader.load("a") == "A"
+    assert await loader.load("a") == "A"
+    assert await loader.load("b") == "B"
+
+    assert loader.batches == [["a"], ["b"]]
+
+
+async def test_dataloader_propagates_errors():
+    loader = FailingDataLoader()
+
+    with pytest.raises(ValueError, match="unable to load"):
+        await asyncio.gather(loader.load("a"), loader.load("b"))
+
+    assert not loader._cache
+
+
+def test_freeze():
+    assert freeze({"b": [1, 2], "a": {"c": None}}) == freeze({"a": {"c": None}, "b": [1, 2]})
+    assert freeze({"a": [1, 2]}) != freeze({"a": [2, 1]})
+    hash(freeze({"a": {"b": [{"c": {1, 2}}]}}))
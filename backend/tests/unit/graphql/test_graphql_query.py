@@ -79,6 +79,55 @@ async def test_simple_query(db: InfrahubDatabase, default_branch: Branch, critic
     assert gql_params.context.related_node_ids == {obj1.id, obj2.id}
 
 
+async def test_query_count_and_edges_single_query(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema, monkeypatch
+):
+    for name, level in (("low", 4), ("medium", 3), ("high", 2)):
+        obj = await Node.init(db=db, schema=criticality_schema)
+        await obj.new(db=db, name=name, level=level)
+        await obj.save(db=db)
+
+    query = """
+    query {
+        TestCriticality(limit: 2) {
+            count
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    query_names = []
+    original_execute_query_with_metadata = InfrahubDatabase.execute_query_with_metadata
+
+    async def execute_query_with_metadata(self, query, params=None, name="undefined"):
+        query_names.append(name)
+        return await original_execute_query_with_metadata(self, query=query, params=params, name=name)
+
+    monkeypatch.setattr(InfrahubDatabase, "execute_query_with_metadata", execute_query_with_metadata)
+
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestCriticality"]["count"] == 3
+    assert len(result.data["TestCriticality"]["edges"]) == 2
+    assert query_names == ["node_get_list_with_attributes"]
+
+
 async def test_simple_query_with_offset_and_limit(
     db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema
 ):
@@ -4,6 +4,8 @@ import graphene
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.constants import InfrahubKind
+from infrahub.core.schema import AttributeSchema
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.manager import GraphQLSchemaManager
 from infrahub.graphql.types import InfrahubObject
@@ -170,6 +172,35 @@ async def test_generate_object_types(db: InfrahubDatabase, default_branch: Branc
     ]
 
 
+async def test_generate_object_types_incremental(
+    db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    gqlm = GraphQLSchemaManager(schema=schema)
+
+    gqlm.generate_object_types()
+    car = gqlm.get_type(name="TestCar")
+    person = gqlm.get_type(name="TestPerson")
+    group = gqlm.get_type(name=InfrahubKind.STANDARDGROUP)
+
+    # Without any change, all the types are reused
+    gqlm.generate_object_types()
+    assert gqlm.get_type(name="TestCar") is car
+    assert gqlm.get_type(name="TestPerson") is person
+
+    car_schema = schema.get(name="TestCar")
+    car_schema.attributes.append(AttributeSchema(name="vin", kind="Text", optional=True))
+    schema.set(name="TestCar", schema=car_schema)
+
+    gqlm.generate_object_types()
+    new_car = gqlm.get_type(name="TestCar")
+    assert new_car is not car
+    assert "vin" in new_car._meta.fields
+    # TestPerson has a relationship to TestCar, its types must be regenerated
+    assert gqlm.get_type(name="TestPerson") is not person
+    assert gqlm.get_type(name=InfrahubKind.STANDARDGROUP) is group
+
+
 async def test_generate_filters(db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema_generics):
     schema = registry.schema.get_schema_branch(name=default_branch.name)
     gqlm = GraphQLSchemaManager(schema=schema)
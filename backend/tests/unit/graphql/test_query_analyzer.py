@@ -4,6 +4,7 @@ from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.document_cache import graphql_document_cache
 from infrahub.graphql.initialization import prepare_graphql_params
 
 
@@ -104,3 +105,84 @@ async def test_get_models_in_use(
         "TestGazCar",
         "TestPerson",
     }
+
+
+async def test_analyzer_from_cache(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema_generics, query_01: str, bad_query_01: str
+):
+    graphql_document_cache.clear()
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+
+    gqa1 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=query_01, schema_hash=gql_params.schema_hash, schema=gql_params.schema, branch=default_branch
+    )
+    assert gqa1.is_valid == (True, None)
+    depth = await gqa1.calculate_depth()
+    models = await gqa1.get_models_in_use(types=gql_params.context.types)
+
+    # The same query for the same schema reuses the document and the results of the previous analysis
+    gqa2 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=query_01, schema_hash=gql_params.schema_hash, schema=gql_params.schema, branch=default_branch
+    )
+    assert gqa2.document is gqa1.document
+    assert gqa2.cache_entry.validated
+    assert gqa2.cache_entry.depth == depth
+    assert await gqa2.get_models_in_use(types=gql_params.context.types) == models
+
+    # A different schema hash or operation name creates a new entry
+    gqa3 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=query_01, schema_hash="other", schema=gql_params.schema, branch=default_branch
+    )
+    assert gqa3.document is not gqa1.document
+    gqa4 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=query_01,
+        schema_hash=gql_params.schema_hash,
+        schema=gql_params.schema,
+        branch=default_branch,
+        operation_name="Other",
+    )
+    assert gqa4.document is not gqa1.document
+    assert len(graphql_document_cache) == 3
+
+    gqa5 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=bad_query_01, schema_hash=gql_params.schema_hash, schema=gql_params.schema, branch=default_branch
+    )
+    is_valid, errors = gqa5.is_valid
+    assert is_valid is False
+    assert errors
+    assert gqa5.cache_entry.validation_errors == errors
+
+
+async def test_analyzer_from_cache_query_only_schema(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema_generics
+):
+    graphql_document_cache.clear()
+    mutation = """
+    mutation {
+        TestPersonCreate(data: {name: {value: "John"}}) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    gql_params_query_only = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    assert gql_params_query_only.schema_hash == gql_params.schema_hash
+
+    gqa1 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=mutation, schema_hash=gql_params.schema_hash, schema=gql_params.schema, branch=default_branch
+    )
+    assert gqa1.is_valid == (True, None)
+
+    # The validation against the schema with the mutations is not reused for the schema without them
+    gqa2 = InfrahubGraphQLQueryAnalyzer.from_cache(
+        query=mutation,
+        schema_hash=gql_params_query_only.schema_hash,
+        schema=gql_params_query_only.schema,
+        branch=default_branch,
+    )
+    assert gqa2.document is not gqa1.document
+    is_valid, errors = gqa2.is_valid
+    assert is_valid is False
+    assert errors
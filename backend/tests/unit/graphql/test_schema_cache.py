@@ -0,0 +1,61 @@
+from graphql import GraphQLSchema
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.schema import AttributeSchema
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.schema_cache import GraphQLSchemaCache, GraphQLSchemaCacheEntry, graphql_schema_cache
+
+
+def test_graphql_schema_cache_eviction():
+    cache = GraphQLSchemaCache(max_size=2)
+    entry1 = GraphQLSchemaCacheEntry(schema=GraphQLSchema(), types={})
+    entry2 = GraphQLSchemaCacheEntry(schema=GraphQLSchema(), types={})
+    entry3 = GraphQLSchemaCacheEntry(schema=GraphQLSchema(), types={})
+    key1 = ("hash1", False, True, True, True, True)
+    key2 = ("hash2", False, True, True, True, True)
+    key3 = ("hash3", False, True, True, True, True)
+
+    cache.set(key=key1, entry=entry1)
+    cache.set(key=key2, entry=entry2)
+    # Access the first entry to make the second one the least recently used
+    assert cache.get(key=key1, branch_name="main") is entry1
+    cache.set(key=key3, entry=entry3)
+
+    assert len(cache) == 2
+    assert cache.get(key=key1, branch_name="main") is entry1
+    assert cache.get(key=key2, branch_name="main") is None
+    assert cache.get(key=key3, branch_name="main") is entry3
+
+
+def test_graphql_schema_cache_disabled():
+    cache = GraphQLSchemaCache(max_size=0)
+    key = ("hash1", False, True, True, True, True)
+    cache.set(key=key, entry=GraphQLSchemaCacheEntry(schema=GraphQLSchema(), types={}))
+
+    assert len(cache) == 0
+    assert cache.get(key=key, branch_name="main") is None
+
+
+async def test_graphql_schema_shared_between_branches(
+    db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema
+):
+    graphql_schema_cache.clear()
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    gql_schema = schema.get_graphql_schema()
+
+    # A branch with the same schema reuses the GraphQL schema and the types already generated
+    other_schema = schema.duplicate(name="branch2")
+    assert other_schema.get_graphql_schema() is gql_schema
+    assert other_schema.get_graphql_types() is schema.get_graphql_types()
+
+    car_schema = other_schema.get(name="TestCar")
+    car_schema.attributes.append(AttributeSchema(name="vin", kind="Text", optional=True))
+    other_schema.set(name="TestCar", schema=car_schema)
+    other_schema.clear_cache()
+
+    new_gql_schema = other_schema.get_graphql_schema()
+    assert new_gql_schema is not gql_schema
+    assert "vin" in other_schema.get_graphql_types()["TestCar"]._meta.fields
+    assert "vin" not in schema.get_graphql_types()["TestCar"]._meta.fields
+    assert schema.get_graphql_schema() is gql_schema
@@ -1,11 +1,15 @@
 from uuid import uuid4
 
 from infrahub.core.branch import Branch
+from infrahub.core.constants import InfrahubKind
+from infrahub.core.initialization import create_branch
 from infrahub.core.registry import registry
+from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.database import InfrahubDatabase
 from infrahub.message_bus import Meta, messages
 from infrahub.message_bus.operations.refresh.registry import rebased_branch
 from infrahub.services import InfrahubServices
+from infrahub.tasks.registry import refresh_branches
 from tests.adapters.message_bus import BusSimulator
 
 
@@ -22,3 +26,76 @@ async def test_rebased_branch(db: InfrahubDatabase):
     assert branch_name not in registry.branch
     await rebased_branch(message=message, service=service)
     assert branch_name in registry.branch
+
+
+async def test_refresh_branches_schema_up_to_date(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    """Validate that the schema is not loaded again when the registry already has the new schema of the branch"""
+    schema_hash = registry.schema.get_schema_branch(name=default_branch.name).get_hash_full()
+
+    calls = []
+
+    async def load_schema(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(registry.schema, "load_schema", load_schema)
+
+    await refresh_branches(db=db, branch_name=default_branch.name, schema_hash=schema_hash)
+    assert not calls
+    assert registry.branch[default_branch.name].name == default_branch.name
+
+
+def set_outdated_schema(branch_name: str, description: str) -> None:
+    """Change the schema of a branch in the registry only, as if this worker missed an update of the schema."""
+    schema_branch = registry.schema.get_schema_branch(name=branch_name).duplicate(name=branch_name)
+    tag_schema = schema_branch.get(name=InfrahubKind.TAG)
+    tag_schema.description = description
+    schema_branch.set(name=InfrahubKind.TAG, schema=tag_schema)
+    registry.schema.set_schema_branch(name=branch_name, schema=schema_branch)
+
+
+async def test_refresh_branches_schema_identical_to_other_branch(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    """Validate that a new schema already loaded for another branch is reused instead of being loaded from the database"""
+    branch2 = await create_branch(branch_name="branch2", db=db)
+    main_schema = registry.schema.get_schema_branch(name=default_branch.name)
+    set_outdated_schema(branch_name=branch2.name, description="outdated")
+    assert registry.schema.get_schema_branch(name=branch2.name).get_hash() != branch2.active_schema_hash.main
+
+    calls = []
+
+    async def load_schema_from_db(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(registry.schema, "load_schema_from_db", load_schema_from_db)
+
+    await refresh_branches(db=db, branch_name=branch2.name, schema_hash=branch2.active_schema_hash)
+    assert not calls
+    branch2_schema = registry.schema.get_schema_branch(name=branch2.name)
+    assert branch2_schema.get_hash() == main_schema.get_hash() == branch2.active_schema_hash.main
+    assert branch2_schema is not main_schema
+    assert branch2_schema.name == branch2.name
+
+
+async def test_refresh_branches_schema_loaded_from_db(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    """Validate that a new schema not loaded for any other branch is loaded from the database"""
+    branch2 = await create_branch(branch_name="branch2", db=db)
+    new_schema = registry.schema.get_schema_branch(name=branch2.name).duplicate(name=branch2.name)
+    set_outdated_schema(branch_name=default_branch.name, description="changed in main")
+    set_outdated_schema(branch_name=branch2.name, description="outdated")
+
+    calls = []
+
+    async def load_schema_from_db(db: InfrahubDatabase, branch: Branch, **kwargs) -> SchemaBranch:
+        calls.append(branch.name)
+        return new_schema
+
+    monkeypatch.setattr(registry.schema, "load_schema_from_db", load_schema_from_db)
+
+    await refresh_branches(db=db, branch_name=branch2.name, schema_hash=branch2.active_schema_hash)
+    assert calls == [branch2.name]
+    assert registry.schema.get_schema_branch(name=branch2.name).get_hash() == branch2.active_schema_hash.main